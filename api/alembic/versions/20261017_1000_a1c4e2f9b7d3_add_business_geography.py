@@ -0,0 +1,37 @@
+"""add PostGIS geography column to businesses
+
+Revision ID: a1c4e2f9b7d3
+Revises: 7ee7828769b2
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c4e2f9b7d3'
+down_revision: Union[str, None] = '7ee7828769b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS postgis")
+
+    # Generated column keeps geog in sync with lat/lon on every insert/update
+    op.execute(
+        """
+        ALTER TABLE businesses
+        ADD COLUMN geog geography(Point,4326)
+        GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(lon, lat), 4326)::geography) STORED
+        """
+    )
+    op.create_index('ix_businesses_geog', 'businesses', ['geog'], unique=False, postgresql_using='gist')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_businesses_geog', table_name='businesses', postgresql_using='gist')
+    op.drop_column('businesses', 'geog')
@@ -0,0 +1,62 @@
+"""add full-text and trigram search for businesses and services
+
+Revision ID: b7d2f3a9c615
+Revises: a1c4e2f9b7d3
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2f3a9c615'
+down_revision: Union[str, None] = 'a1c4e2f9b7d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('russian', search_normalize(name)), 'A') || "
+    "setweight(to_tsvector('russian', search_normalize(description)), 'C')"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Lowercase and fold ё into е, so "ёлка" and "елка" match in both indexes
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION search_normalize(value text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE
+        AS $$ SELECT lower(translate(coalesce(value, ''), 'Ёё', 'Ее')) $$
+        """
+    )
+
+    for table in ('businesses', 'services'):
+        op.execute(
+            f"""
+            ALTER TABLE {table}
+            ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS ({SEARCH_VECTOR}) STORED
+            """
+        )
+        op.create_index(
+            f'ix_{table}_search_vector', table, ['search_vector'], unique=False,
+            postgresql_using='gin',
+        )
+        # Typo-tolerant and partial name matches (word similarity)
+        op.execute(
+            f"CREATE INDEX ix_{table}_name_trgm ON {table} "
+            f"USING gin (search_normalize(name) gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    for table in ('services', 'businesses'):
+        op.drop_index(f'ix_{table}_name_trgm', table_name=table)
+        op.drop_index(f'ix_{table}_search_vector', table_name=table, postgresql_using='gin')
+        op.drop_column(table, 'search_vector')
+    op.execute("DROP FUNCTION IF EXISTS search_normalize(text)")
@@ -0,0 +1,36 @@
+"""add composite indexes for keyset pagination
+
+Revision ID: c3e8a1d4f2b6
+Revises: b7d2f3a9c615
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e8a1d4f2b6'
+down_revision: Union[str, None] = 'b7d2f3a9c615'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_bookings_business_date_time_id', 'bookings',
+        ['business_id', 'booking_date', 'booking_time', 'id'], unique=False,
+    )
+    op.create_index(
+        'ix_status_history_business_updated_id', 'status_history',
+        ['business_id', 'updated_at', 'id'], unique=False,
+    )
+    op.create_index('ix_businesses_name_id', 'businesses', ['name', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_businesses_name_id', table_name='businesses')
+    op.drop_index('ix_status_history_business_updated_id', table_name='status_history')
+    op.drop_index('ix_bookings_business_date_time_id', table_name='bookings')
@@ -0,0 +1,116 @@
+"""add business_summary read model
+
+Revision ID: d5a9c7e3b1f8
+Revises: c3e8a1d4f2b6
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a9c7e3b1f8'
+down_revision: Union[str, None] = 'c3e8a1d4f2b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'business_summary',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column(
+            'type',
+            postgresql.ENUM(name='businesstype', create_type=False),
+            nullable=False,
+        ),
+        sa.Column('address', sa.String(length=500), nullable=False),
+        sa.Column('lat', sa.Float(), nullable=False),
+        sa.Column('lon', sa.Float(), nullable=False),
+        sa.Column('phones', postgresql.JSON(astext_type=sa.Text()), server_default='[]', nullable=False),
+        sa.Column('email', sa.String(length=255), nullable=True),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('logo_url', sa.String(length=500), nullable=True),
+        sa.Column('dgis_id', sa.String(length=100), nullable=True),
+        sa.Column(
+            'subscription_status',
+            postgresql.ENUM(name='subscriptionstatus', create_type=False),
+            nullable=False,
+        ),
+        sa.Column('subscription_end_date', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('main_photo_url', sa.String(length=500), nullable=True),
+        sa.Column('min_price', sa.Float(), nullable=True),
+        sa.Column('hours', postgresql.JSON(astext_type=sa.Text()), server_default='[]', nullable=False),
+        sa.Column('favorite_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['id'], ['businesses.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.execute(
+        """
+        ALTER TABLE business_summary
+        ADD COLUMN geog geography(Point,4326)
+        GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(lon, lat), 4326)::geography) STORED
+        """
+    )
+    op.create_index('ix_business_summary_geog', 'business_summary', ['geog'], unique=False, postgresql_using='gist')
+    op.create_index('ix_business_summary_name_id', 'business_summary', ['name', 'id'], unique=False)
+    op.create_index(op.f('ix_business_summary_type'), 'business_summary', ['type'], unique=False)
+
+    # Backfill; afterwards the API keeps rows current
+    op.execute(
+        """
+        INSERT INTO business_summary (
+            id, name, type, address, lat, lon, phones, email, description, logo_url,
+            dgis_id, subscription_status, subscription_end_date, created_at, updated_at,
+            main_photo_url, min_price, hours, favorite_count, refreshed_at
+        )
+        SELECT
+            b.id, b.name, b.type, b.address, b.lat, b.lon, b.phones, b.email,
+            b.description, b.logo_url, b.dgis_id, b.subscription_status,
+            b.subscription_end_date, b.created_at, b.updated_at,
+            (
+                SELECT p.photo_url FROM business_photos p
+                WHERE p.business_id = b.id
+                ORDER BY p.is_main DESC, p.display_order, p.id
+                LIMIT 1
+            ),
+            (
+                SELECT min(s.price_from) FROM services s
+                WHERE s.business_id = b.id AND s.is_active
+            ),
+            (
+                SELECT coalesce(
+                    json_agg(
+                        json_build_object(
+                            'day_of_week', h.day_of_week,
+                            'open_time', to_char(h.open_time, 'HH24:MI'),
+                            'close_time', to_char(h.close_time, 'HH24:MI'),
+                            'is_closed', h.is_closed
+                        )
+                        ORDER BY h.day_of_week
+                    ),
+                    '[]'::json
+                )
+                FROM business_hours h
+                WHERE h.business_id = b.id
+            ),
+            (SELECT count(*) FROM favorites f WHERE f.business_id = b.id),
+            timezone('utc', now())
+        FROM businesses b
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_business_summary_type'), table_name='business_summary')
+    op.drop_index('ix_business_summary_name_id', table_name='business_summary')
+    op.drop_index('ix_business_summary_geog', table_name='business_summary')
+    op.drop_table('business_summary')
@@ -0,0 +1,58 @@
+"""add booking_daily_stats rollups
+
+Revision ID: e2b6f4a8c9d1
+Revises: d5a9c7e3b1f8
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b6f4a8c9d1'
+down_revision: Union[str, None] = 'd5a9c7e3b1f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'booking_daily_stats',
+        sa.Column('business_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column(
+            'status',
+            postgresql.ENUM(name='bookingstatus', create_type=False),
+            nullable=False,
+        ),
+        sa.Column('employee_id', sa.Integer(), nullable=False),
+        sa.Column('service_id', sa.Integer(), nullable=False),
+        sa.Column('came_through_app', sa.Boolean(), nullable=False),
+        sa.Column('bookings', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['business_id'], ['businesses.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint(
+            'business_id', 'day', 'status', 'employee_id', 'service_id', 'came_through_app'
+        ),
+    )
+
+    # Backfill; afterwards the API keeps counts current
+    op.execute(
+        """
+        INSERT INTO booking_daily_stats (
+            business_id, day, status, employee_id, service_id, came_through_app, bookings
+        )
+        SELECT business_id, booking_date, status, coalesce(employee_id, 0), service_id,
+               came_through_app, count(*)
+        FROM bookings
+        GROUP BY business_id, booking_date, status, coalesce(employee_id, 0), service_id,
+                 came_through_app
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('booking_daily_stats')
@@ -0,0 +1,150 @@
+"""partition status_history by month, add status rollups
+
+Revision ID: f7c1d9e5a3b2
+Revises: e2b6f4a8c9d1
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c1d9e5a3b2'
+down_revision: Union[str, None] = 'e2b6f4a8c9d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Monthly partitions created ahead of the current month; the API's maintenance
+# job keeps this many ahead afterwards (settings.status_history_partitions_ahead)
+PARTITIONS_AHEAD = 3
+
+
+def upgrade() -> None:
+    # Move the old table aside; its index names are reused by the new table
+    op.drop_index('ix_status_history_business_updated_id', table_name='status_history')
+    op.drop_index('ix_status_history_updated_at', table_name='status_history')
+    op.drop_index('ix_status_history_business_id', table_name='status_history')
+    op.drop_index('ix_status_history_id', table_name='status_history')
+    op.execute("ALTER TABLE status_history RENAME TO status_history_unpartitioned")
+    op.execute(
+        "ALTER TABLE status_history_unpartitioned "
+        "RENAME CONSTRAINT status_history_pkey TO status_history_unpartitioned_pkey"
+    )
+    op.execute("ALTER SEQUENCE status_history_id_seq OWNED BY NONE")
+
+    # The partition key must be part of the primary key
+    op.execute(
+        """
+        CREATE TABLE status_history (
+            id integer NOT NULL DEFAULT nextval('status_history_id_seq'),
+            business_id integer NOT NULL REFERENCES businesses (id),
+            status availabilitystatus NOT NULL,
+            estimated_wait_minutes integer NOT NULL,
+            updated_at timestamp without time zone NOT NULL,
+            PRIMARY KEY (id, updated_at)
+        ) PARTITION BY RANGE (updated_at)
+        """
+    )
+    op.execute("ALTER SEQUENCE status_history_id_seq OWNED BY status_history.id")
+    op.create_index(
+        'ix_status_history_business_updated_id', 'status_history',
+        ['business_id', 'updated_at', 'id'], unique=False,
+    )
+    op.create_index(op.f('ix_status_history_updated_at'), 'status_history', ['updated_at'], unique=False)
+
+    # One partition per month from the oldest row to PARTITIONS_AHEAD months ahead
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            month date := date_trunc(
+                'month', coalesce((SELECT min(updated_at) FROM status_history_unpartitioned), now())
+            );
+        BEGIN
+            WHILE month <= date_trunc('month', now()) + interval '{PARTITIONS_AHEAD} months' LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF status_history FOR VALUES FROM (%L) TO (%L)',
+                    'status_history_y' || to_char(month, 'YYYY') || 'm' || to_char(month, 'MM'),
+                    month,
+                    month + interval '1 month'
+                );
+                month := month + interval '1 month';
+            END LOOP;
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO status_history (id, business_id, status, estimated_wait_minutes, updated_at)
+        SELECT id, business_id, status, estimated_wait_minutes, updated_at
+        FROM status_history_unpartitioned
+        """
+    )
+    op.drop_table('status_history_unpartitioned')
+
+    op.create_table(
+        'status_hourly_stats',
+        sa.Column('business_id', sa.Integer(), nullable=False),
+        sa.Column('hour', sa.DateTime(), nullable=False),
+        sa.Column('available_seconds', sa.Float(), server_default='0', nullable=False),
+        sa.Column('busy_seconds', sa.Float(), server_default='0', nullable=False),
+        sa.Column('busy_wait_minute_seconds', sa.Float(), server_default='0', nullable=False),
+        sa.Column('changes', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['business_id'], ['businesses.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('business_id', 'hour'),
+    )
+    op.create_index(op.f('ix_status_hourly_stats_hour'), 'status_hourly_stats', ['hour'], unique=False)
+    op.create_table(
+        'status_daily_stats',
+        sa.Column('business_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('available_seconds', sa.Float(), server_default='0', nullable=False),
+        sa.Column('busy_seconds', sa.Float(), server_default='0', nullable=False),
+        sa.Column('busy_wait_minute_seconds', sa.Float(), server_default='0', nullable=False),
+        sa.Column('changes', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['business_id'], ['businesses.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('business_id', 'day'),
+    )
+    # Rollups are backfilled by the maintenance job, a week of history per run
+
+
+def downgrade() -> None:
+    op.drop_table('status_daily_stats')
+    op.drop_index(op.f('ix_status_hourly_stats_hour'), table_name='status_hourly_stats')
+    op.drop_table('status_hourly_stats')
+
+    op.execute("ALTER TABLE status_history RENAME TO status_history_partitioned")
+    op.execute("ALTER SEQUENCE status_history_id_seq OWNED BY NONE")
+    op.drop_index('ix_status_history_business_updated_id', table_name='status_history_partitioned')
+    op.drop_index('ix_status_history_updated_at', table_name='status_history_partitioned')
+    op.execute(
+        """
+        CREATE TABLE status_history (
+            id integer NOT NULL DEFAULT nextval('status_history_id_seq') PRIMARY KEY,
+            business_id integer NOT NULL REFERENCES businesses (id),
+            status availabilitystatus NOT NULL,
+            estimated_wait_minutes integer NOT NULL,
+            updated_at timestamp without time zone NOT NULL
+        )
+        """
+    )
+    op.execute("ALTER SEQUENCE status_history_id_seq OWNED BY status_history.id")
+    op.execute(
+        """
+        INSERT INTO status_history (id, business_id, status, estimated_wait_minutes, updated_at)
+        SELECT id, business_id, status, estimated_wait_minutes, updated_at
+        FROM status_history_partitioned
+        """
+    )
+    op.execute("DROP TABLE status_history_partitioned")
+    op.create_index(op.f('ix_status_history_id'), 'status_history', ['id'], unique=False)
+    op.create_index(op.f('ix_status_history_business_id'), 'status_history', ['business_id'], unique=False)
+    op.create_index(op.f('ix_status_history_updated_at'), 'status_history', ['updated_at'], unique=False)
+    op.create_index(
+        'ix_status_history_business_updated_id', 'status_history',
+        ['business_id', 'updated_at', 'id'], unique=False,
+    )
@@ -0,0 +1,38 @@
+"""add business_occupancy weekly profiles
+
+Revision ID: a9e3b5c7d2f4
+Revises: f7c1d9e5a3b2
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9e3b5c7d2f4'
+down_revision: Union[str, None] = 'f7c1d9e5a3b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'business_occupancy',
+        sa.Column('business_id', sa.Integer(), nullable=False),
+        sa.Column('busy_seconds', postgresql.ARRAY(sa.Float()), nullable=False),
+        sa.Column('observed_seconds', postgresql.ARRAY(sa.Float()), nullable=False),
+        sa.Column('completed_bookings', postgresql.ARRAY(sa.Float()), nullable=False),
+        sa.Column('profile', sa.LargeBinary(), nullable=False),
+        sa.Column('through_day', sa.Date(), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['business_id'], ['businesses.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('business_id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('business_occupancy')
@@ -0,0 +1,29 @@
+"""add version to business_summary
+
+Revision ID: b4d8f2a6c1e9
+Revises: a9e3b5c7d2f4
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d8f2a6c1e9'
+down_revision: Union[str, None] = 'a9e3b5c7d2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'business_summary',
+        sa.Column('version', sa.Integer(), server_default='0', nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('business_summary', 'version')
@@ -0,0 +1,32 @@
+"""replace the updated_at btree index of status_history with BRIN
+
+Revision ID: c6e1a9d3f5b8
+Revises: b4d8f2a6c1e9
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e1a9d3f5b8'
+down_revision: Union[str, None] = 'b4d8f2a6c1e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Per-business reads use ix_status_history_business_updated_id; the rollups'
+    # time windows only need a BRIN index, far cheaper to maintain on insert
+    op.drop_index('ix_status_history_updated_at', table_name='status_history')
+    op.create_index(
+        'ix_status_history_updated_at_brin', 'status_history', ['updated_at'],
+        unique=False, postgresql_using='brin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_status_history_updated_at_brin', table_name='status_history')
+    op.create_index('ix_status_history_updated_at', 'status_history', ['updated_at'], unique=False)
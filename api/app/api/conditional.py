@@ -0,0 +1,57 @@
+"""Conditional GET support: ETag validators and If-None-Match handling.
+
+Validators are cheap to compute (a Redis version read or a hash of bytes
+already in hand), so a matching request is answered with 304 before the
+response is serialized, and for version-based tags before any DB query.
+"""
+import hashlib
+
+from fastapi import Request, Response, status
+
+from app.core.redis import redis_client
+from app.services.business_version import get_business_version
+
+
+def make_etag(*parts: object) -> str:
+    """Weak ETag from the parts that determine a representation."""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+
+async def business_etag(business_id: int, *parts: object) -> str | None:
+    """
+    ETag from the business version, or None if Redis is unavailable.
+
+    Only valid for representations that change solely through admin writes
+    (which bump the version).
+    """
+    if redis_client.redis is None:
+        # Without the counter every version would read as 0
+        return None
+    version = await get_business_version(business_id)
+    return make_etag("business", business_id, version, *parts)
+
+
+def is_not_modified(request: Request, etag: str | None) -> bool:
+    """Whether If-None-Match matches etag (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not etag or not header:
+        return False
+    if header.strip() == "*":
+        return True
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in tags
+
+
+def set_etag(response: Response, etag: str | None):
+    """Attach the validator; clients must revalidate before reusing the body."""
+    if etag:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response carrying the validator."""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_etag(response, etag)
+    return response
@@ -1,21 +1,94 @@
+import json
+from dataclasses import asdict, dataclass
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.redis import redis_client
 from app.models.user import User
 from app.models.business import BusinessAdmin
 
 security = HTTPBearer()
 
+CLIENT = "client"
+BUSINESS_ADMIN = "business_admin"
+
+# Hot principals are served from process memory; Redis shares them across workers
+_principal_cache = TTLCache(maxsize=10_000, ttl=settings.principal_local_ttl_seconds)
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Authenticated caller identity, cheap enough to resolve on every request."""
+
+    id: int
+    type: str  # client, business_admin
+    business_id: int | None = None
+    phone: str | None = None
+
+
+def _principal_key(user_type: str, principal_id: int) -> str:
+    return f"principal:{user_type}:{principal_id}"
+
+
+async def _load_principal(
+    user_type: str, principal_id: int, db: AsyncSession
+) -> Principal | None:
+    """Resolve principal from the in-process cache, then Redis, then the database."""
+    key = _principal_key(user_type, principal_id)
+
+    principal = _principal_cache.get(key)
+    if principal is not None:
+        return principal
+
+    cached = await redis_client.get(key)
+    if cached:
+        principal = Principal(**json.loads(cached))
+        _principal_cache.set(key, principal)
+        return principal
+
+    # Only the columns the principal needs, never the full ORM row
+    if user_type == BUSINESS_ADMIN:
+        result = await db.execute(
+            select(BusinessAdmin.business_id).where(BusinessAdmin.id == principal_id)
+        )
+        business_id = result.scalar_one_or_none()
+        if business_id is None:
+            return None
+        principal = Principal(id=principal_id, type=user_type, business_id=business_id)
+    else:
+        result = await db.execute(
+            select(User.id, User.phone).where(User.id == principal_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        principal = Principal(id=principal_id, type=CLIENT, phone=row.phone)
+
+    _principal_cache.set(key, principal)
+    await redis_client.set(
+        key, json.dumps(asdict(principal)), expire=settings.principal_redis_ttl_seconds
+    )
+    return principal
+
+
+async def invalidate_principal(user_type: str, principal_id: int):
+    """Drop cached principal after the underlying user or admin changes."""
+    key = _principal_key(user_type, principal_id)
+    _principal_cache.delete(key)
+    await redis_client.delete(key)
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
-) -> User:
+) -> Principal:
     """Get current authenticated user."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -35,9 +108,7 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    # Get user from database
-    result = await db.execute(select(User).where(User.id == int(user_id)))
-    user = result.scalar_one_or_none()
+    user = await _load_principal(CLIENT, int(user_id), db)
 
     if user is None:
         raise credentials_exception
@@ -45,35 +116,35 @@ async def get_current_user(
     return user
 
 
-async def get_current_business_admin(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
-) -> BusinessAdmin:
-    """Get current authenticated business admin."""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
+async def authenticate_business_admin(token: str, db: AsyncSession) -> Principal | None:
+    """Resolve a business admin access token, or None if it is not valid."""
     try:
-        token = credentials.credentials
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        admin_id: str = payload.get("sub")
-        token_type: str = payload.get("type")
-        user_type: str = payload.get("user_type")
+    except JWTError:
+        return None
 
-        if admin_id is None or token_type != "access" or user_type != "business_admin":
-            raise credentials_exception
+    admin_id: str = payload.get("sub")
+    token_type: str = payload.get("type")
+    user_type: str = payload.get("user_type")
 
-    except JWTError:
-        raise credentials_exception
+    if admin_id is None or token_type != "access" or user_type != BUSINESS_ADMIN:
+        return None
 
-    # Get admin from database
-    result = await db.execute(select(BusinessAdmin).where(BusinessAdmin.id == int(admin_id)))
-    admin = result.scalar_one_or_none()
+    return await _load_principal(BUSINESS_ADMIN, int(admin_id), db)
+
+
+async def get_current_business_admin(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db),
+) -> Principal:
+    """Get current authenticated business admin."""
+    admin = await authenticate_business_admin(credentials.credentials, db)
 
     if admin is None:
-        raise credentials_exception
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
     return admin
@@ -0,0 +1,43 @@
+"""Opaque cursors for keyset pagination.
+
+A cursor holds the sort key of the last row of a page. The next page is the
+rows strictly after it in the endpoint's order, so every page is an index
+range scan no matter how deep it is. Cursors travel in the ``cursor`` query
+parameter and the ``X-Next-Cursor`` response header, keeping list bodies
+unchanged for existing clients.
+"""
+import base64
+import json
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import HTTPException, Response, status
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row (dates and times as ISO strings)."""
+    payload = json.dumps(values, default=lambda value: value.isoformat(), separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> tuple:
+    """Decode a cursor, converting each value with its parser; 400 if invalid."""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(payload)
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError("cursor has wrong shape")
+        return tuple(parse(value) for parse, value in zip(parsers, values))
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def set_next_cursor(response: Response, cursor: str | None):
+    """Expose the cursor of the next page, if there may be one."""
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
@@ -1,17 +1,21 @@
-from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date as date_type, datetime, time as time_type
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, delete
+from sqlalchemy import select, func, and_, delete, tuple_
 from sqlalchemy.orm import selectinload
 
 from app.core.database import get_db
-from app.api.dependencies import get_current_business_admin
-from app.models.business import Business, BusinessAdmin, BusinessStatus, StatusHistory, AvailabilityStatus, BusinessHours
+from app.api.conditional import is_not_modified, make_etag, not_modified, set_etag
+from app.api.dependencies import Principal, get_current_business_admin
+from app.api.pagination import decode_cursor, encode_cursor, set_next_cursor
+from app.models.business import Business, BusinessStatus, StatusHistory, AvailabilityStatus, BusinessHours
 from app.models.business_photo import BusinessPhoto
 from app.models.employee import Employee
 from app.models.service import Service
 from app.models.booking import Booking, BookingStatus
+from app.models.booking_stats import BookingDailyStats
 from app.models.promotion import Promotion
+from app.models.loading import BusinessProfile, business_loader_options
 from app.schemas.business import Business as BusinessSchema, BusinessUpdate, BusinessStatusUpdate
 from app.schemas.business_photo import BusinessPhoto as BusinessPhotoSchema, BusinessPhotoCreate, BusinessPhotoUpdate
 from app.schemas.employee import Employee as EmployeeSchema, EmployeeCreate, EmployeeUpdate
@@ -19,6 +23,30 @@ from app.schemas.service import Service as ServiceSchema, ServiceCreate, Service
 from app.schemas.booking import Booking as BookingSchema, BookingCreate, BookingUpdate
 from app.schemas.promotion import Promotion as PromotionSchema, PromotionCreate, PromotionUpdate
 from app.schemas.business_hours import BusinessHoursResponse, BusinessHoursBulkUpdate
+from app.services.analytics import (
+    INTERVALS,
+    analytics_period,
+    bookings_series,
+    cached_report,
+    channel_split,
+    employee_utilization,
+    load_heatmap,
+    status_series,
+)
+from app.services.availability import (
+    EmployeeNotQualifiedError,
+    OutsideBusinessHoursError,
+    SlotConflictError,
+    reserve_slot,
+)
+from app.services.booking_stats import booking_stats_key, record_booking
+from app.services.live_status import get_status, write_status
+from app.services.realtime import publish_booking_event
+from app.services.business_summary import refresh_business_summary
+from app.services.business_version import bump_business_version
+from app.services.slot_cache import invalidate_day
+from app.services.status_coalescer import status_coalescer
+from app.services.spatial_index import business_index, indexed_business
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -29,12 +57,14 @@ router = APIRouter(prefix="/admin", tags=["admin"])
 
 @router.get("/business/profile", response_model=BusinessSchema)
 async def get_business_profile(
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Get business profile for current admin."""
     result = await db.execute(
-        select(Business).where(Business.id == current_admin.business_id)
+        select(Business)
+        .options(*business_loader_options(BusinessProfile.ADMIN_DASHBOARD))
+        .where(Business.id == current_admin.business_id)
     )
     business = result.scalar_one_or_none()
 
@@ -50,12 +80,14 @@ async def get_business_profile(
 @router.patch("/business/profile", response_model=BusinessSchema)
 async def update_business_profile(
     business_data: BusinessUpdate,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Update business profile."""
     result = await db.execute(
-        select(Business).where(Business.id == current_admin.business_id)
+        select(Business)
+        .options(*business_loader_options(BusinessProfile.ADMIN_DASHBOARD))
+        .where(Business.id == current_admin.business_id)
     )
     business = result.scalar_one_or_none()
 
@@ -72,9 +104,13 @@ async def update_business_profile(
 
     business.updated_at = datetime.utcnow()
 
+    await refresh_business_summary(db, current_admin.business_id)
     await db.commit()
     await db.refresh(business)
 
+    business_index.upsert(indexed_business(business))
+    await bump_business_version(current_admin.business_id)
+
     return business
 
 
@@ -85,7 +121,7 @@ async def update_business_profile(
 @router.patch("/status")
 async def update_business_status(
     status_data: BusinessStatusUpdate,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Update business availability status."""
@@ -111,15 +147,10 @@ async def update_business_status(
         )
         db.add(business_status)
 
-    # Add to history
-    status_history = StatusHistory(
-        business_id=current_admin.business_id,
-        status=AvailabilityStatus(status_data.status),
-        estimated_wait_minutes=status_data.estimated_wait_minutes,
-    )
-    db.add(status_history)
-
     await db.commit()
+    await write_status(business_status)
+    # Broadcast and history row, merged with other changes in the coalescing window
+    await status_coalescer.submit(business_status)
 
     return {
         "success": True,
@@ -131,44 +162,57 @@ async def update_business_status(
 
 @router.get("/status/current")
 async def get_current_status(
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    request: Request,
+    response: Response,
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Get current business status."""
-    result = await db.execute(
-        select(BusinessStatus).where(BusinessStatus.business_id == current_admin.business_id)
+    current = await get_status(db, current_admin.business_id)
+
+    etag = make_etag(
+        "status",
+        current_admin.business_id,
+        current["status"],
+        current["estimated_wait_minutes"],
+        current["updated_at"],
     )
-    business_status = result.scalar_one_or_none()
+    if is_not_modified(request, etag):
+        return not_modified(etag)
 
-    if not business_status:
-        return {
-            "status": "available",
-            "estimated_wait_minutes": 0,
-            "updated_at": None,
-        }
-
-    return {
-        "status": business_status.status.value,
-        "estimated_wait_minutes": business_status.estimated_wait_minutes,
-        "updated_at": business_status.updated_at,
-    }
+    set_etag(response, etag)
+    return current
 
 
 @router.get("/status/history")
 async def get_status_history(
-    limit: int = 50,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: str | None = None,
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get status update history."""
+    """
+    Get status update history, newest first.
+
+    Pass the X-Next-Cursor header of a page as cursor to get the next one.
+    """
+    query = select(StatusHistory).where(StatusHistory.business_id == current_admin.business_id)
+
+    if cursor:
+        last_updated_at, last_id = decode_cursor(cursor, datetime.fromisoformat, int)
+        query = query.where(
+            tuple_(StatusHistory.updated_at, StatusHistory.id) < tuple_(last_updated_at, last_id)
+        )
+
     result = await db.execute(
-        select(StatusHistory)
-        .where(StatusHistory.business_id == current_admin.business_id)
-        .order_by(StatusHistory.updated_at.desc())
-        .limit(limit)
+        query.order_by(StatusHistory.updated_at.desc(), StatusHistory.id.desc()).limit(limit)
     )
     history = result.scalars().all()
 
+    if len(history) == limit:
+        set_next_cursor(response, encode_cursor(history[-1].updated_at, history[-1].id))
+
     return [
         {
             "status": h.status.value,
@@ -185,7 +229,7 @@ async def get_status_history(
 
 @router.get("/services", response_model=list[ServiceSchema])
 async def get_services(
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Get all services for the business."""
@@ -201,7 +245,7 @@ async def get_services(
 @router.post("/services", response_model=ServiceSchema, status_code=status.HTTP_201_CREATED)
 async def create_service(
     service_data: ServiceCreate,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new service."""
@@ -215,8 +259,10 @@ async def create_service(
     )
 
     db.add(new_service)
+    await refresh_business_summary(db, current_admin.business_id)
     await db.commit()
     await db.refresh(new_service)
+    await bump_business_version(current_admin.business_id)
 
     return new_service
 
@@ -225,7 +271,7 @@ async def create_service(
 async def update_service(
     service_id: int,
     service_data: ServiceUpdate,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Update a service."""
@@ -252,8 +298,10 @@ async def update_service(
 
     service.updated_at = datetime.utcnow()
 
+    await refresh_business_summary(db, current_admin.business_id)
     await db.commit()
     await db.refresh(service)
+    await bump_business_version(current_admin.business_id)
 
     return service
 
@@ -261,7 +309,7 @@ async def update_service(
 @router.delete("/services/{service_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_service(
     service_id: int,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a service."""
@@ -282,7 +330,9 @@ async def delete_service(
         )
 
     await db.delete(service)
+    await refresh_business_summary(db, current_admin.business_id)
     await db.commit()
+    await bump_business_version(current_admin.business_id)
 
 
 # =============================================================================
@@ -291,13 +341,19 @@ async def delete_service(
 
 @router.get("/bookings", response_model=list[BookingSchema])
 async def get_bookings(
+    response: Response,
     status: str | None = None,
     employee_id: int | None = None,
-    limit: int = 50,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    limit: int = Query(50, ge=1, le=500),
+    cursor: str | None = None,
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get bookings for the business."""
+    """
+    Get bookings for the business, latest booking time first.
+
+    Pass the X-Next-Cursor header of a page as cursor to get the next one.
+    """
     query = select(Booking).where(Booking.business_id == current_admin.business_id)
 
     if status:
@@ -312,11 +368,26 @@ async def get_bookings(
         selectinload(Booking.employee)
     )
 
-    query = query.order_by(Booking.booking_date.desc(), Booking.booking_time.desc()).limit(limit)
+    if cursor:
+        last_date, last_time, last_id = decode_cursor(
+            cursor, date_type.fromisoformat, time_type.fromisoformat, int
+        )
+        query = query.where(
+            tuple_(Booking.booking_date, Booking.booking_time, Booking.id)
+            < tuple_(last_date, last_time, last_id)
+        )
+
+    query = query.order_by(
+        Booking.booking_date.desc(), Booking.booking_time.desc(), Booking.id.desc()
+    ).limit(limit)
 
     result = await db.execute(query)
     bookings = result.scalars().all()
 
+    if len(bookings) == limit:
+        last = bookings[-1]
+        set_next_cursor(response, encode_cursor(last.booking_date, last.booking_time, last.id))
+
     return bookings
 
 
@@ -324,7 +395,7 @@ async def get_bookings(
 async def update_booking(
     booking_id: int,
     booking_data: BookingUpdate,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Update booking status."""
@@ -349,6 +420,8 @@ async def update_booking(
             detail="Booking not found",
         )
 
+    previous_stats = booking_stats_key(booking)
+
     # Update status
     if booking_data.status:
         booking.status = BookingStatus(booking_data.status)
@@ -358,9 +431,14 @@ async def update_booking(
 
     booking.updated_at = datetime.utcnow()
 
+    await record_booking(db, booking, previous_stats)
     await db.commit()
     await db.refresh(booking)
 
+    await invalidate_day(booking.business_id, booking.booking_date)
+    event = "cancelled" if booking.status == BookingStatus.CANCELLED else "updated"
+    await publish_booking_event(event, booking)
+
     return booking
 
 
@@ -370,7 +448,7 @@ async def update_booking(
 
 @router.get("/promotions", response_model=list[PromotionSchema])
 async def get_promotions(
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Get all promotions for the business."""
@@ -386,7 +464,7 @@ async def get_promotions(
 @router.post("/promotions", response_model=PromotionSchema, status_code=status.HTTP_201_CREATED)
 async def create_promotion(
     promotion_data: PromotionCreate,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new promotion."""
@@ -402,6 +480,7 @@ async def create_promotion(
     db.add(new_promotion)
     await db.commit()
     await db.refresh(new_promotion)
+    await bump_business_version(current_admin.business_id)
 
     return new_promotion
 
@@ -410,7 +489,7 @@ async def create_promotion(
 async def update_promotion(
     promotion_id: int,
     promotion_data: PromotionUpdate,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Update a promotion."""
@@ -437,6 +516,7 @@ async def update_promotion(
 
     await db.commit()
     await db.refresh(promotion)
+    await bump_business_version(current_admin.business_id)
 
     return promotion
 
@@ -444,7 +524,7 @@ async def update_promotion(
 @router.delete("/promotions/{promotion_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_promotion(
     promotion_id: int,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a promotion."""
@@ -466,6 +546,7 @@ async def delete_promotion(
 
     await db.delete(promotion)
     await db.commit()
+    await bump_business_version(current_admin.business_id)
 
 
 # =============================================================================
@@ -474,37 +555,41 @@ async def delete_promotion(
 
 @router.get("/analytics")
 async def get_analytics(
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    days: int = Query(30, ge=1, le=365, description="Period length, e.g. 7, 30 or 90"),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get analytics for the business."""
-    # Total bookings
-    total_bookings_result = await db.execute(
-        select(func.count(Booking.id)).where(Booking.business_id == current_admin.business_id)
-    )
-    total_bookings = total_bookings_result.scalar()
+    """
+    Get analytics for the business over the last `days` days (today included).
 
-    # Bookings by status
-    bookings_by_status_result = await db.execute(
-        select(Booking.status, func.count(Booking.id))
-        .where(Booking.business_id == current_admin.business_id)
-        .group_by(Booking.status)
-    )
-    bookings_by_status = {
-        status.value: count for status, count in bookings_by_status_result.all()
-    }
+    Booking counts come from the daily rollups, so the cost depends on the
+    period length, not on the size of the booking history.
+    """
+    start_date, end_date = analytics_period(days)
 
-    # Bookings through app
-    through_app_result = await db.execute(
-        select(func.count(Booking.id))
+    # Bookings by status and channel, summed over the period
+    bookings_result = await db.execute(
+        select(
+            BookingDailyStats.status,
+            BookingDailyStats.came_through_app,
+            func.sum(BookingDailyStats.bookings),
+        )
         .where(
-            and_(
-                Booking.business_id == current_admin.business_id,
-                Booking.came_through_app == True,
-            )
+            BookingDailyStats.business_id == current_admin.business_id,
+            BookingDailyStats.day.between(start_date, end_date),
         )
+        .group_by(BookingDailyStats.status, BookingDailyStats.came_through_app)
     )
-    through_app = through_app_result.scalar()
+
+    total_bookings = 0
+    through_app = 0
+    bookings_by_status = {}
+    for booking_status, came_through_app, count in bookings_result.all():
+        total_bookings += count
+        if came_through_app:
+            through_app += count
+        key = booking_status.value
+        bookings_by_status[key] = bookings_by_status.get(key, 0) + count
 
     # Total services
     total_services_result = await db.execute(
@@ -532,6 +617,8 @@ async def get_analytics(
     active_promotions = active_promotions_result.scalar()
 
     return {
+        "start_date": start_date,
+        "end_date": end_date,
         "total_bookings": total_bookings,
         "bookings_by_status": bookings_by_status,
         "bookings_through_app": through_app,
@@ -541,13 +628,108 @@ async def get_analytics(
     }
 
 
+@router.get("/analytics/bookings")
+async def get_bookings_series(
+    days: int = Query(30, ge=1, le=365),
+    interval: str = Query("day", description="day, week or month"),
+    current_admin: Principal = Depends(get_current_business_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get bookings per period: total, through the app, walk-in and cancelled.
+
+    Column-oriented: `period[i]` is the first day of the i-th period.
+    """
+    if interval not in INTERVALS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid interval. Must be one of: day, week, month",
+        )
+    start_date, end_date = analytics_period(days)
+    document = await cached_report(
+        current_admin.business_id,
+        "bookings",
+        (start_date, days, interval),
+        lambda: bookings_series(db, current_admin.business_id, start_date, end_date, interval),
+    )
+    return Response(content=document, media_type="application/json")
+
+
+@router.get("/analytics/heatmap")
+async def get_load_heatmap(
+    days: int = Query(90, ge=1, le=365),
+    current_admin: Principal = Depends(get_current_business_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get bookings by weekday (0=Monday) and hour; only non-empty cells are listed."""
+    start_date, end_date = analytics_period(days)
+    document = await cached_report(
+        current_admin.business_id,
+        "heatmap",
+        (start_date, days),
+        lambda: load_heatmap(db, current_admin.business_id, start_date, end_date),
+    )
+    return Response(content=document, media_type="application/json")
+
+
+@router.get("/analytics/employees")
+async def get_employee_utilization(
+    days: int = Query(30, ge=1, le=365),
+    current_admin: Principal = Depends(get_current_business_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get bookings, booked minutes and utilization per employee."""
+    start_date, end_date = analytics_period(days)
+    document = await cached_report(
+        current_admin.business_id,
+        "employees",
+        (start_date, days),
+        lambda: employee_utilization(db, current_admin.business_id, start_date, end_date),
+    )
+    return Response(content=document, media_type="application/json")
+
+
+@router.get("/analytics/channels")
+async def get_channel_split(
+    days: int = Query(30, ge=1, le=365),
+    current_admin: Principal = Depends(get_current_business_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get bookings through the app vs. walk-in, by status."""
+    start_date, end_date = analytics_period(days)
+    document = await cached_report(
+        current_admin.business_id,
+        "channels",
+        (start_date, days),
+        lambda: channel_split(db, current_admin.business_id, start_date, end_date),
+    )
+    return Response(content=document, media_type="application/json")
+
+
+@router.get("/analytics/status")
+async def get_status_series(
+    days: int = Query(30, ge=1, le=365),
+    current_admin: Principal = Depends(get_current_business_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get hours available and busy, average wait and status changes per day."""
+    start_date, end_date = analytics_period(days)
+    document = await cached_report(
+        current_admin.business_id,
+        "status",
+        (start_date, days),
+        lambda: status_series(db, current_admin.business_id, start_date, end_date),
+    )
+    return Response(content=document, media_type="application/json")
+
+
 # =============================================================================
 # BUSINESS HOURS MANAGEMENT
 # =============================================================================
 
 @router.get("/business-hours", response_model=list[BusinessHoursResponse])
 async def get_business_hours(
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Get business hours for current admin's business."""
@@ -581,7 +763,7 @@ async def get_business_hours(
 @router.put("/business-hours", response_model=list[BusinessHoursResponse])
 async def update_business_hours(
     hours_update: BusinessHoursBulkUpdate,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Update business hours (all 7 days at once)."""
@@ -628,7 +810,9 @@ async def update_business_hours(
         db.add(hour)
         new_hours.append(hour)
 
+    await refresh_business_summary(db, current_admin.business_id)
     await db.commit()
+    await bump_business_version(current_admin.business_id)
 
     # Refresh to get IDs
     for hour in new_hours:
@@ -643,7 +827,7 @@ async def update_business_hours(
 
 @router.get("/business/photos", response_model=list[BusinessPhotoSchema])
 async def get_business_photos(
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Get all photos for the business."""
@@ -659,7 +843,7 @@ async def get_business_photos(
 @router.post("/business/photos", response_model=BusinessPhotoSchema, status_code=status.HTTP_201_CREATED)
 async def create_business_photo(
     photo_data: BusinessPhotoCreate,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Add a new photo to the business."""
@@ -671,8 +855,10 @@ async def create_business_photo(
     )
 
     db.add(new_photo)
+    await refresh_business_summary(db, current_admin.business_id)
     await db.commit()
     await db.refresh(new_photo)
+    await bump_business_version(current_admin.business_id)
 
     return new_photo
 
@@ -681,7 +867,7 @@ async def create_business_photo(
 async def update_business_photo(
     photo_id: int,
     photo_data: BusinessPhotoUpdate,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Update a business photo."""
@@ -714,8 +900,10 @@ async def update_business_photo(
     for field, value in update_data.items():
         setattr(photo, field, value)
 
+    await refresh_business_summary(db, current_admin.business_id)
     await db.commit()
     await db.refresh(photo)
+    await bump_business_version(current_admin.business_id)
 
     return photo
 
@@ -723,7 +911,7 @@ async def update_business_photo(
 @router.patch("/business/photos/{photo_id}/set-main")
 async def set_main_photo(
     photo_id: int,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Set a photo as the main photo for the business."""
@@ -755,7 +943,9 @@ async def set_main_photo(
     # Set this photo as main
     photo.is_main = True
 
+    await refresh_business_summary(db, current_admin.business_id)
     await db.commit()
+    await bump_business_version(current_admin.business_id)
 
     return {"success": True, "message": "Main photo updated"}
 
@@ -763,7 +953,7 @@ async def set_main_photo(
 @router.delete("/business/photos/{photo_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_business_photo(
     photo_id: int,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a business photo."""
@@ -784,7 +974,9 @@ async def delete_business_photo(
         )
 
     await db.delete(photo)
+    await refresh_business_summary(db, current_admin.business_id)
     await db.commit()
+    await bump_business_version(current_admin.business_id)
 
     return {"success": True, "message": "Photo deleted"}
 
@@ -794,7 +986,7 @@ async def delete_business_photo(
 
 @router.get("/employees", response_model=list[EmployeeSchema])
 async def get_employees(
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Get all employees for the business."""
@@ -810,7 +1002,7 @@ async def get_employees(
 @router.post("/employees", response_model=EmployeeSchema, status_code=status.HTTP_201_CREATED)
 async def create_employee(
     employee_data: EmployeeCreate,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new employee."""
@@ -841,6 +1033,7 @@ async def create_employee(
 
     await db.commit()
     await db.refresh(employee)
+    await bump_business_version(current_admin.business_id)
 
     return employee
 
@@ -849,7 +1042,7 @@ async def create_employee(
 async def update_employee(
     employee_id: int,
     employee_data: EmployeeUpdate,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Update employee information."""
@@ -895,6 +1088,7 @@ async def update_employee(
     employee.updated_at = datetime.utcnow()
     await db.commit()
     await db.refresh(employee)
+    await bump_business_version(current_admin.business_id)
 
     return employee
 
@@ -902,7 +1096,7 @@ async def update_employee(
 @router.patch("/employees/{employee_id}/toggle-active", response_model=EmployeeSchema)
 async def toggle_employee_active(
     employee_id: int,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Toggle employee active status."""
@@ -927,6 +1121,7 @@ async def toggle_employee_active(
 
     await db.commit()
     await db.refresh(employee)
+    await bump_business_version(current_admin.business_id)
 
     return employee
 
@@ -934,12 +1129,15 @@ async def toggle_employee_active(
 @router.delete("/employees/{employee_id}")
 async def delete_employee(
     employee_id: int,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Delete an employee."""
+    # Bookings are loaded so the unit of work can detach them from the employee
     result = await db.execute(
-        select(Employee).where(
+        select(Employee)
+        .options(selectinload(Employee.bookings))
+        .where(
             and_(
                 Employee.id == employee_id,
                 Employee.business_id == current_admin.business_id,
@@ -956,6 +1154,7 @@ async def delete_employee(
 
     await db.delete(employee)
     await db.commit()
+    await bump_business_version(current_admin.business_id)
 
     return {"success": True, "message": "Employee deleted"}
 
@@ -966,7 +1165,7 @@ async def delete_employee(
 @router.post("/bookings", response_model=BookingSchema, status_code=status.HTTP_201_CREATED)
 async def create_booking(
     booking_data: BookingCreate,
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new booking (admin creates booking manually)."""
@@ -1005,6 +1204,33 @@ async def create_booking(
                 detail="Employee not found",
             )
 
+    # Admins may book outside opening hours, but not over another booking
+    try:
+        await reserve_slot(
+            db,
+            current_admin.business_id,
+            service,
+            booking_data.booking_date,
+            booking_data.booking_time,
+            booking_data.employee_id,
+            ignore_hours=True,
+        )
+    except EmployeeNotQualifiedError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Employee is inactive or does not provide this service",
+        )
+    except OutsideBusinessHoursError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Requested time is outside business hours",
+        )
+    except SlotConflictError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Time slot is already booked",
+        )
+
     booking = Booking(
         business_id=current_admin.business_id,
         service_id=booking_data.service_id,
@@ -1019,15 +1245,19 @@ async def create_booking(
     )
 
     db.add(booking)
+    await record_booking(db, booking)
     await db.commit()
     await db.refresh(booking)
 
+    await invalidate_day(booking.business_id, booking.booking_date)
+    await publish_booking_event("created", booking)
+
     return booking
 
 
 @router.get("/bookings/by-employee")
 async def get_bookings_by_employee(
-    current_admin: BusinessAdmin = Depends(get_current_business_admin),
+    current_admin: Principal = Depends(get_current_business_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Get booking counts grouped by employee."""
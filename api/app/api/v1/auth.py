@@ -24,6 +24,9 @@ from app.schemas.auth import (
     PhoneOTPRequest,
     OTPVerify,
 )
+from app.services.business_summary import refresh_business_summary
+from app.services.live_status import write_status
+from app.services.spatial_index import business_index, indexed_business
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -84,7 +87,7 @@ async def register_business(
         address=business_data.address,
         lat=business_data.lat,
         lon=business_data.lon,
-        phone=business_data.phone,
+        phones=[business_data.phone],
         email=business_data.business_email,
         description=business_data.description,
         subscription_end_date=datetime.utcnow() + timedelta(days=90),  # 3 month trial
@@ -111,9 +114,13 @@ async def register_business(
     )
 
     db.add(initial_status)
+    await refresh_business_summary(db, new_business.id)
     await db.commit()
     await db.refresh(new_admin)
 
+    await write_status(initial_status)
+    business_index.upsert(indexed_business(new_business))
+
     # Create tokens with user_type flag
     access_token = create_access_token(subject=new_admin.id, user_type="business_admin")
     refresh_token = create_refresh_token(subject=new_admin.id)
@@ -1,15 +1,37 @@
-from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime, timezone
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 
 from app.core.database import get_db
-from app.api.dependencies import get_current_user
-from app.models.user import User
+from app.api.dependencies import Principal, get_current_user
 from app.models.booking import Booking, BookingStatus
 from app.models.business import Business
 from app.models.service import Service
-from app.schemas.booking import Booking as BookingSchema, BookingCreate
+from app.models.loading import BusinessProfile, business_loader_options
+from app.schemas.booking import (
+    Booking as BookingSchema,
+    BookingCreate,
+    SlotHold as SlotHoldSchema,
+    SlotHoldCreate,
+)
+from app.services.availability import (
+    EmployeeNotQualifiedError,
+    OutsideBusinessHoursError,
+    SlotConflictError,
+    reserve_slot,
+    to_minute,
+)
+from app.services.booking_stats import booking_stats_key, record_booking
+from app.services.slot_holds import (
+    HoldLimitError,
+    consume_hold,
+    parse_hold_id,
+    place_hold,
+    release_hold,
+)
+from app.services.realtime import publish_booking_event
+from app.services.slot_cache import invalidate_day
 
 router = APIRouter(prefix="/bookings", tags=["bookings"])
 
@@ -18,7 +40,7 @@ router = APIRouter(prefix="/bookings", tags=["bookings"])
 async def create_booking(
     booking_data: BookingCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User | None = Depends(lambda: None),  # Optional auth
+    current_user: Principal | None = Depends(lambda: None),  # Optional auth
 ):
     """
     Create a new booking.
@@ -27,7 +49,9 @@ async def create_booking(
     """
     # Verify business exists
     business_result = await db.execute(
-        select(Business).where(Business.id == booking_data.business_id)
+        select(Business)
+        .options(*business_loader_options(BusinessProfile.LIST_CARD))
+        .where(Business.id == booking_data.business_id)
     )
     business = business_result.scalar_one_or_none()
 
@@ -55,6 +79,33 @@ async def create_booking(
             detail="Service not found or inactive",
         )
 
+    # Lock the day and check the slot; the lock is held until commit
+    try:
+        hold_id = await reserve_slot(
+            db,
+            booking_data.business_id,
+            service,
+            booking_data.booking_date,
+            booking_data.booking_time,
+            booking_data.employee_id,
+            hold_id=booking_data.hold_id,
+        )
+    except EmployeeNotQualifiedError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Employee is inactive or does not provide this service",
+        )
+    except OutsideBusinessHoursError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Requested time is outside business hours",
+        )
+    except SlotConflictError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Time slot is no longer available",
+        )
+
     # Create booking
     new_booking = Booking(
         business_id=booking_data.business_id,
@@ -70,15 +121,109 @@ async def create_booking(
     )
 
     db.add(new_booking)
+    await record_booking(db, new_booking)
+    # The booking row is flushed and takes the slot, the hold can go
+    if hold_id:
+        await consume_hold(hold_id)
     await db.commit()
     await db.refresh(new_booking)
 
+    await invalidate_day(new_booking.business_id, new_booking.booking_date)
+    await publish_booking_event("created", new_booking)
+
     return new_booking
 
 
+@router.post("/holds", response_model=SlotHoldSchema, status_code=status.HTTP_201_CREATED)
+async def create_slot_hold(
+    hold_data: SlotHoldCreate,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Hold a slot while the client fills in the booking form.
+
+    Other clients see the slot as unavailable until the hold expires or is
+    released; pass hold_id to POST /bookings to book it. A client (IP address)
+    may keep settings.slot_hold_max_per_client holds at a time.
+    """
+    service_result = await db.execute(
+        select(Service).where(
+            and_(
+                Service.id == hold_data.service_id,
+                Service.business_id == hold_data.business_id,
+                Service.is_active == True,
+            )
+        )
+    )
+    service = service_result.scalar_one_or_none()
+
+    if not service:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Service not found or inactive",
+        )
+
+    try:
+        await reserve_slot(
+            db,
+            hold_data.business_id,
+            service,
+            hold_data.booking_date,
+            hold_data.booking_time,
+            hold_data.employee_id,
+        )
+    except EmployeeNotQualifiedError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Employee is inactive or does not provide this service",
+        )
+    except OutsideBusinessHoursError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Requested time is outside business hours",
+        )
+    except SlotConflictError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Time slot is no longer available",
+        )
+
+    # Place the hold before the day lock is released
+    try:
+        hold_id, expires_at = await place_hold(
+            hold_data.business_id,
+            hold_data.booking_date,
+            to_minute(hold_data.booking_time),
+            service.duration_minutes,
+            hold_data.employee_id,
+            holder=request.client.host if request.client else "unknown",
+        )
+    except HoldLimitError:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many active slot holds, book or release one first",
+        )
+    await db.commit()
+
+    await invalidate_day(hold_data.business_id, hold_data.booking_date)
+
+    return SlotHoldSchema(
+        hold_id=hold_id, expires_at=datetime.fromtimestamp(expires_at, tz=timezone.utc)
+    )
+
+
+@router.delete("/holds/{hold_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_slot_hold(hold_id: str):
+    """Release a slot hold (client closed the booking form)."""
+    hold = parse_hold_id(hold_id)
+    if hold and await release_hold(hold_id):
+        await invalidate_day(hold.business_id, hold.day)
+
+
 @router.get("/my", response_model=list[BookingSchema])
 async def get_my_bookings(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Get all bookings for the authenticated user."""
@@ -94,7 +239,7 @@ async def get_my_bookings(
 @router.get("/{booking_id}", response_model=BookingSchema)
 async def get_booking(
     booking_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Get a specific booking."""
@@ -117,7 +262,7 @@ async def get_booking(
 @router.patch("/{booking_id}/cancel", response_model=BookingSchema)
 async def cancel_booking(
     booking_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Cancel a booking."""
@@ -146,10 +291,15 @@ async def cancel_booking(
             detail="Cannot cancel completed booking",
         )
 
+    previous_stats = booking_stats_key(booking)
     booking.status = BookingStatus.CANCELLED
     booking.updated_at = datetime.utcnow()
 
+    await record_booking(db, booking, previous_stats)
     await db.commit()
     await db.refresh(booking)
 
+    await invalidate_day(booking.business_id, booking.booking_date)
+    await publish_booking_event("cancelled", booking)
+
     return booking
@@ -1,128 +1,276 @@
-from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from datetime import date as date_type, datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import Float, select, and_, or_, func, cast, null, tuple_
 from sqlalchemy.orm import selectinload
 from typing import Optional
 
+from app.core.config import settings
 from app.core.database import get_db
-from app.api.dependencies import get_current_user
-from app.models.user import User
-from app.models.business import Business, BusinessStatus, BusinessType, BusinessHours
+from app.api.conditional import business_etag, is_not_modified, make_etag, not_modified, set_etag
+from app.api.pagination import decode_cursor, encode_cursor, set_next_cursor
+from app.models.business import Business, BusinessType
+from app.models.business_summary import BusinessSummary
 from app.models.service import Service
 from app.models.employee import Employee
 from app.models.promotion import Promotion
-from app.models.favorite import Favorite
-from app.models.booking import Booking
+from app.models.types import Geography
 from app.schemas.business import Business as BusinessSchema
 from app.schemas.service import Service as ServiceSchema
-from app.schemas.employee import Employee as EmployeeSchema
 from app.schemas.promotion import Promotion as PromotionSchema
-from app.schemas.available_slots import AvailableSlotsResponse, TimeSlot
+from app.schemas.available_slots import (
+    AvailabilityCalendarResponse,
+    AvailableSlotsResponse,
+    DayAvailability,
+    TimeSlot,
+)
+from app.services.business_detail import get_business_detail_json
+from app.services.availability import (
+    format_minute,
+    load_availability_inputs,
+    load_day_inputs_for_businesses,
+    to_minute,
+)
+from app.services.live_status import get_statuses
+from app.services.search import matching_business_ids, search_relevance, text_match
+from app.services.slot_cache import get_cached_slots, slot_cache_key, store_slots
+from app.services.spatial_index import business_index
 
 router = APIRouter(prefix="/businesses", tags=["businesses"])
 
 
-@router.get("", response_model=list[BusinessSchema])
-async def get_businesses(
+def _geography_point(lat: float, lon: float):
+    """Build a geography point for comparison with a geog column."""
+    return cast(func.ST_SetSRID(func.ST_MakePoint(lon, lat), 4326), Geography)
+
+
+async def _find_businesses(
+    db: AsyncSession,
     business_type: Optional[str] = None,
     search: Optional[str] = None,
     lat: Optional[float] = None,
     lon: Optional[float] = None,
     radius_km: float = 10.0,
-    limit: int = Query(50, le=100),
+    limit: int = 50,
     offset: int = 0,
-    db: AsyncSession = Depends(get_db),
-):
+    cursor: Optional[str] = None,
+    with_service: bool = False,
+    service: Optional[str] = None,
+) -> tuple[list[tuple[BusinessSummary, float | None]], str | None]:
     """
-    Get list of businesses with filters.
+    Find business summaries with their distance in km (None without a location).
 
-    Filters:
-    - business_type: car_wash, repair_shop, tire_service
-    - search: search by name or description
-    - lat, lon: filter by location (requires both)
-    - radius_km: radius in kilometers (default 10km)
-    - limit: max results (default 50, max 100)
-    - offset: pagination offset
+    With with_service only businesses offering an active service are returned,
+    matching the service keyword if one is given.
+
+    Results are ordered by distance with a location, by relevance with a search
+    term, and by name otherwise. Returns the page and the cursor of the next one
+    (None when the page is not full); a cursor from one ordering is rejected by
+    the others.
     """
-    query = select(Business)
+    query = select(BusinessSummary)
 
     # Filter by type
     if business_type:
         try:
-            query = query.where(Business.type == BusinessType(business_type))
+            query = query.where(BusinessSummary.type == BusinessType(business_type))
         except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid business_type. Must be one of: car_wash, repair_shop, tire_service",
             )
 
-    # Search by name or description
+    # Search by name, description or service names (full-text and trigram indexes)
     if search:
-        search_filter = or_(
-            Business.name.ilike(f"%{search}%"),
-            Business.description.ilike(f"%{search}%"),
+        query = query.where(BusinessSummary.id.in_(matching_business_ids(search)))
+
+    if with_service:
+        offered = select(Service.id).where(
+            Service.business_id == BusinessSummary.id, Service.is_active == True
         )
-        query = query.where(search_filter)
+        if service:
+            offered = offered.where(text_match(Service, service))
+        query = query.where(offered.exists())
 
-    # Filter by location (simple distance calculation)
-    # Note: For production, use PostGIS for better performance
+    # Filter by exact radius and order nearest first (GiST index on geog)
     if lat is not None and lon is not None:
-        # Haversine formula approximation
-        # This is a simplified version, for production use PostGIS
-        lat_range = radius_km / 111.0  # ~111 km per degree latitude
-        lon_range = radius_km / (111.0 * func.cos(func.radians(lat)))
+        point = _geography_point(lat, lon)
+        distance_km = (func.ST_Distance(BusinessSummary.geog, point) / 1000.0).label("distance_km")
+        order, sort_key = "distance", BusinessSummary.geog.op("<->", return_type=Float)(point)
 
-        query = query.where(
-            and_(
-                Business.lat.between(lat - lat_range, lat + lat_range),
-                Business.lon.between(lon - lon_range, lon + lon_range),
-            )
+        query = query.add_columns(distance_km).where(
+            func.ST_DWithin(BusinessSummary.geog, point, radius_km * 1000.0)
+        )
+    elif search:
+        # Relevance reads the search columns, which only businesses have
+        order, sort_key = "relevance", search_relevance(search)
+        query = query.join(Business, Business.id == BusinessSummary.id).add_columns(
+            null().label("distance_km")
+        )
+    else:
+        order, sort_key = "name", BusinessSummary.name
+        query = query.add_columns(null().label("distance_km"))
+
+    query = query.add_columns(sort_key.label("sort_key"))
+
+    # Keyset: rows strictly after the last one of the previous page
+    if cursor:
+        cursor_order, last_key, last_id = decode_cursor(
+            cursor, str, str if order == "name" else float, int
         )
+        if cursor_order != order:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor does not match the requested ordering",
+            )
+        if order == "relevance":
+            query = query.where(
+                or_(sort_key < last_key, and_(sort_key == last_key, BusinessSummary.id > last_id))
+            )
+        else:
+            query = query.where(tuple_(sort_key, BusinessSummary.id) > tuple_(last_key, last_id))
+
+    if order == "relevance":
+        query = query.order_by(sort_key.desc(), BusinessSummary.id)
+    else:
+        query = query.order_by(sort_key, BusinessSummary.id)
 
-    # Order by name
-    query = query.order_by(Business.name).limit(limit).offset(offset)
+    query = query.limit(limit).offset(offset)
 
     result = await db.execute(query)
-    businesses = result.scalars().all()
+    rows = result.all()
 
-    return businesses
+    next_cursor = None
+    if rows and len(rows) == limit:
+        last_business, _, last_key = rows[-1]
+        next_cursor = encode_cursor(order, last_key, last_business.id)
 
+    return [(business, distance) for business, distance, _ in rows], next_cursor
 
-@router.get("/nearby")
-async def get_nearby_businesses(
+
+async def _find_businesses_indexed(
+    db: AsyncSession,
     lat: float,
     lon: float,
-    radius_km: float = 5.0,
+    radius_km: float,
     business_type: Optional[str] = None,
     limit: int = 20,
+) -> list[tuple[BusinessSummary, float]]:
+    """Same as _find_businesses with a location, served from the in-process index."""
+    if business_type:
+        try:
+            BusinessType(business_type)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid business_type. Must be one of: car_wash, repair_shop, tire_service",
+            )
+
+    page = business_index.nearby(lat, lon, radius_km, business_type=business_type, limit=limit)
+    if not page:
+        return []
+
+    # Only the final page of ids is read from the database
+    result = await db.execute(
+        select(BusinessSummary).where(
+            BusinessSummary.id.in_([business_id for business_id, _ in page])
+        )
+    )
+    businesses = {b.id: b for b in result.scalars().all()}
+
+    return [
+        (businesses[business_id], distance)
+        for business_id, distance in page
+        if business_id in businesses
+    ]
+
+
+@router.get("", response_model=list[BusinessSchema])
+async def get_businesses(
+    response: Response,
+    business_type: Optional[str] = None,
+    search: Optional[str] = None,
+    lat: Optional[float] = None,
+    lon: Optional[float] = None,
+    radius_km: float = Query(10.0, gt=0, le=settings.max_search_radius_km),
+    limit: int = Query(50, le=100),
+    offset: int = 0,
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
 ):
     """
-    Get businesses near a specific location with their current status.
+    Get list of businesses with filters.
 
-    Returns businesses sorted by distance with status information.
+    Filters:
+    - business_type: car_wash, repair_shop, tire_service
+    - search: search by name, description or service names (typo tolerant),
+      results sorted by relevance
+    - lat, lon: filter by location (requires both), results sorted by distance
+    - radius_km: radius in kilometers (default 10km, max settings.max_search_radius_km)
+    - limit: max results (default 50, max 100)
+    - cursor: value of the X-Next-Cursor header of the previous page
+    - offset: pagination offset (deprecated, deep offsets are slow; use cursor)
     """
-    # Get businesses near location
-    businesses_result = await get_businesses(
+    businesses, next_cursor = await _find_businesses(
+        db,
         business_type=business_type,
+        search=search,
         lat=lat,
         lon=lon,
         radius_km=radius_km,
         limit=limit,
-        db=db,
+        offset=offset,
+        cursor=cursor,
     )
 
-    # Fetch status for each business
-    business_ids = [b.id for b in businesses_result]
-    statuses_result = await db.execute(
-        select(BusinessStatus).where(BusinessStatus.business_id.in_(business_ids))
-    )
-    statuses = {s.business_id: s for s in statuses_result.scalars().all()}
+    set_next_cursor(response, next_cursor)
+    return [
+        BusinessSchema.model_validate(business).model_copy(update={"distance_km": distance})
+        for business, distance in businesses
+    ]
+
+
+@router.get("/nearby")
+async def get_nearby_businesses(
+    lat: float,
+    lon: float,
+    radius_km: float = Query(5.0, gt=0, le=settings.max_search_radius_km),
+    business_type: Optional[str] = None,
+    limit: int = 20,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get businesses near a specific location with their current status.
+
+    Returns businesses sorted by distance with status information and the
+    list card fields (main photo, lowest price, today's hours, favorites).
+    """
+    # Get businesses near location
+    if settings.spatial_index_enabled and business_index.ready:
+        businesses_result = await _find_businesses_indexed(
+            db,
+            business_type=business_type,
+            lat=lat,
+            lon=lon,
+            radius_km=radius_km,
+            limit=limit,
+        )
+    else:
+        businesses_result, _ = await _find_businesses(
+            db,
+            business_type=business_type,
+            lat=lat,
+            lon=lon,
+            radius_km=radius_km,
+            limit=limit,
+        )
+
+    # Fetch live status for the whole page in one round trip
+    statuses = await get_statuses(db, [b.id for b, _ in businesses_result])
 
     # Combine business data with status
     result = []
-    for business in businesses_result:
+    for business, distance_km in businesses_result:
         business_dict = {
             "id": business.id,
             "name": business.name,
@@ -130,138 +278,201 @@ async def get_nearby_businesses(
             "address": business.address,
             "lat": business.lat,
             "lon": business.lon,
+            "distance_km": round(distance_km, 3),
             "phone": business.phones[0] if business.phones else "",
             "description": business.description,
             "logo_url": business.logo_url,
+            "main_photo_url": business.main_photo_url,
+            "min_price": business.min_price,
+            "today_hours": business.today_hours,
+            "favorite_count": business.favorite_count,
+            "status": statuses[business.id],
         }
 
-        # Add status if exists
-        if business.id in statuses:
-            st = statuses[business.id]
-            business_dict["status"] = {
-                "status": st.status.value,
-                "estimated_wait_minutes": st.estimated_wait_minutes,
-                "updated_at": st.updated_at,
-            }
-        else:
-            business_dict["status"] = {
-                "status": "available",
-                "estimated_wait_minutes": 0,
-                "updated_at": None,
-            }
-
         result.append(business_dict)
 
     return result
 
 
+@router.get("/available-now")
+async def get_available_now(
+    lat: float,
+    lon: float,
+    radius_km: float = Query(5.0, gt=0, le=settings.max_search_radius_km),
+    business_type: Optional[str] = None,
+    service: Optional[str] = Query(None, description="Service keyword, e.g. 'стрижка'"),
+    within_minutes: int = Query(60, ge=15, le=240),
+    limit: int = Query(20, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Find businesses near a location with a free slot starting soon.
+
+    Considers the nearest businesses of the type offering an active service
+    matching the keyword (without one, each business's shortest service) and
+    checks today's slots starting within `within_minutes`. The keyword filters
+    candidates before they are cut to settings.available_now_candidates.
+    Availability of all candidates is computed in one pass: one hours, one
+    employees and one bookings query plus one Redis round trip for holds.
+
+    Results are ordered by the first free start time, then by distance.
+    """
+    now = datetime.now()
+    today = now.date()
+    not_before = to_minute(now.time())
+    not_after = not_before + within_minutes
+
+    candidates, _ = await _find_businesses(
+        db,
+        business_type=business_type,
+        lat=lat,
+        lon=lon,
+        radius_km=radius_km,
+        limit=settings.available_now_candidates,
+        with_service=True,
+        service=service,
+    )
+    if not candidates:
+        return []
+
+    # The shortest matching service of each candidate
+    services_query = select(Service).where(
+        Service.business_id.in_([summary.id for summary, _ in candidates]),
+        Service.is_active == True,
+    )
+    if service:
+        services_query = services_query.where(text_match(Service, service))
+    services_result = await db.execute(
+        services_query.order_by(Service.business_id, Service.duration_minutes, Service.id)
+    )
+    services = {}
+    for candidate_service in services_result.scalars().all():
+        services.setdefault(candidate_service.business_id, candidate_service)
+    if not services:
+        return []
+
+    inputs = await load_day_inputs_for_businesses(db, services, today)
+
+    matches = []
+    for summary, distance_km in candidates:
+        business_inputs = inputs.get(summary.id)
+        if business_inputs is None:
+            continue
+        plan = business_inputs.day_plan(today)
+        if plan is None:
+            continue
+        free = [
+            start
+            for start, available in plan.slots(
+                business_inputs.service.duration_minutes,
+                step=settings.slot_interval_minutes,
+                not_before=not_before,
+            )
+            if available and start <= not_after
+        ]
+        if free:
+            matches.append((free, summary, distance_km))
+
+    matches.sort(key=lambda match: (match[0][0], match[2]))
+    matches = matches[:limit]
+
+    statuses = await get_statuses(db, [summary.id for _, summary, _ in matches])
+
+    result = []
+    for free, summary, distance_km in matches:
+        matched_service = services[summary.id]
+        result.append({
+            "id": summary.id,
+            "name": summary.name,
+            "type": summary.type.value,
+            "address": summary.address,
+            "lat": summary.lat,
+            "lon": summary.lon,
+            "distance_km": round(distance_km, 3),
+            "phone": summary.phones[0] if summary.phones else "",
+            "logo_url": summary.logo_url,
+            "main_photo_url": summary.main_photo_url,
+            "status": statuses[summary.id],
+            "service": {
+                "id": matched_service.id,
+                "name": matched_service.name,
+                "duration_minutes": matched_service.duration_minutes,
+                "price_from": matched_service.price_from,
+                "price_to": matched_service.price_to,
+            },
+            "first_free_time": format_minute(free[0]),
+            "free_times": [format_minute(start) for start in free],
+        })
+
+    return result
+
+
 @router.get("/{business_id}")
 async def get_business_details(
     business_id: int,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
-    """Get detailed information about a specific business."""
-    # Get business
-    business_result = await db.execute(select(Business).where(Business.id == business_id))
-    business = business_result.scalar_one_or_none()
+    """
+    Get detailed information about a specific business.
 
-    if not business:
+    Includes active services, current promotions, photos, active employees,
+    working hours and live status. Served from a cached JSON document.
+    """
+    document = await get_business_detail_json(db, business_id)
+
+    if document is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Business not found",
         )
 
-    # Get current status
-    status_result = await db.execute(
-        select(BusinessStatus).where(BusinessStatus.business_id == business_id)
-    )
-    business_status = status_result.scalar_one_or_none()
-
-    # Get services
-    services_result = await db.execute(
-        select(Service).where(
-            and_(Service.business_id == business_id, Service.is_active == True)
-        )
-    )
-    services = services_result.scalars().all()
+    # Hash of the bytes: also changes with the live status and expiring promotions
+    etag = make_etag(document.decode())
+    if is_not_modified(request, etag):
+        return not_modified(etag)
 
-    # Get active promotions
-    promotions_result = await db.execute(
-        select(Promotion).where(
-            and_(
-                Promotion.business_id == business_id,
-                Promotion.is_active == True,
-                Promotion.valid_until >= func.now(),
-            )
-        )
-    )
-    promotions = promotions_result.scalars().all()
-
-    return {
-        "id": business.id,
-        "name": business.name,
-        "type": business.type.value,
-        "address": business.address,
-        "lat": business.lat,
-        "lon": business.lon,
-        "phone": business.phones[0] if business.phones else "",
-        "email": business.email,
-        "description": business.description,
-        "logo_url": business.logo_url,
-        "status": {
-            "status": business_status.status.value if business_status else "available",
-            "estimated_wait_minutes": (
-                business_status.estimated_wait_minutes if business_status else 0
-            ),
-            "updated_at": business_status.updated_at if business_status else None,
-        },
-        "services": [
-            {
-                "id": s.id,
-                "name": s.name,
-                "description": s.description,
-                "price_from": s.price_from,
-                "price_to": s.price_to,
-                "duration_minutes": s.duration_minutes,
-            }
-            for s in services
-        ],
-        "promotions": [
-            {
-                "id": p.id,
-                "title": p.title,
-                "description": p.description,
-                "discount_percent": p.discount_percent,
-                "valid_from": p.valid_from,
-                "valid_until": p.valid_until,
-            }
-            for p in promotions
-        ],
-    }
+    response = Response(content=document, media_type="application/json")
+    set_etag(response, etag)
+    return response
 
 
 @router.get("/{business_id}/services", response_model=list[ServiceSchema])
 async def get_business_services(
     business_id: int,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ):
     """Get all active services for a business."""
+    etag = await business_etag(business_id, "services")
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
     result = await db.execute(
         select(Service).where(
             and_(Service.business_id == business_id, Service.is_active == True)
         )
     )
     services = result.scalars().all()
+
+    set_etag(response, etag)
     return services
 
 
 @router.get("/{business_id}/employees")
 async def get_business_employees(
     business_id: int,
+    request: Request,
+    response: Response,
     service_id: int | None = None,
     db: AsyncSession = Depends(get_db),
 ):
     """Get all active employees for a business, optionally filtered by service."""
+    etag = await business_etag(business_id, "employees", service_id)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
     query = select(Employee).where(
         and_(Employee.business_id == business_id, Employee.is_active == True)
     ).options(selectinload(Employee.services))
@@ -290,12 +501,15 @@ async def get_business_employees(
             "service_ids": [s.id for s in emp.services],
         })
 
+    set_etag(response, etag)
     return employees_data
 
 
 @router.get("/{business_id}/promotions", response_model=list[PromotionSchema])
 async def get_business_promotions(
     business_id: int,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ):
     """Get all active promotions for a business."""
@@ -309,6 +523,13 @@ async def get_business_promotions(
         )
     )
     promotions = result.scalars().all()
+
+    # Promotions also drop out when they end, so the set of ids is part of the tag
+    etag = await business_etag(business_id, "promotions", sorted(p.id for p in promotions))
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    set_etag(response, etag)
     return promotions
 
 
@@ -317,6 +538,7 @@ async def get_available_slots(
     business_id: int,
     service_id: int = Query(..., description="Service ID"),
     date: str = Query(..., description="Date in YYYY-MM-DD format"),
+    employee_id: int | None = Query(None, description="Only slots of this employee"),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -324,9 +546,11 @@ async def get_available_slots(
 
     This endpoint:
     1. Checks business working hours for the given day
-    2. Gets the service duration
-    3. Finds all existing bookings for that day
-    4. Returns available slots (excluding past times if date is today)
+    2. Gets the service duration and employees qualified for it
+    3. Subtracts existing bookings (each for its own service duration) and
+       slots held by other clients during checkout
+    4. Returns start times where the service fits for at least one employee
+       (excluding past times if date is today)
     """
 
     # Parse date
@@ -339,106 +563,144 @@ async def get_available_slots(
         )
 
     # Check if date is in the past
-    today = datetime.now().date()
+    now = datetime.now()
+    today = now.date()
     if booking_date < today:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot book in the past"
         )
 
-    # Get service to know duration
-    service_result = await db.execute(
-        select(Service).where(
-            Service.id == service_id, Service.business_id == business_id
-        )
-    )
-    service = service_result.scalar_one_or_none()
-    if not service:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Service not found"
-        )
+    # Slots without the "past times" filter are cached until a booking or schedule change
+    cache_key = await slot_cache_key(business_id, service_id, employee_id, booking_date)
+    day = await get_cached_slots(cache_key)
 
-    # Get day of week (0 = Monday, 6 = Sunday)
-    day_of_week = booking_date.weekday()
+    if day is None:
+        # Get service to know duration
+        service_result = await db.execute(
+            select(Service).where(
+                Service.id == service_id, Service.business_id == business_id
+            )
+        )
+        service = service_result.scalar_one_or_none()
+        if not service:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Service not found"
+            )
 
-    # Get business hours for this day
-    hours_result = await db.execute(
-        select(BusinessHours).where(
-            BusinessHours.business_id == business_id,
-            BusinessHours.day_of_week == day_of_week,
+        inputs = await load_availability_inputs(
+            db, business_id, service, booking_date, booking_date
         )
-    )
-    business_hours = hours_result.scalar_one_or_none()
+        plan = inputs.day_plan(booking_date)
+
+        if plan is None:
+            day = {"is_closed": True}
+        else:
+            day = {
+                "is_closed": False,
+                "open_minute": plan.open_minute,
+                "close_minute": plan.close_minute,
+                "slots": plan.slots(
+                    service.duration_minutes,
+                    step=settings.slot_interval_minutes,
+                    resource_ids=[employee_id] if employee_id else None,
+                ),
+            }
+        await store_slots(cache_key, day, inputs.hold_expires_at)
 
     # If no hours set or closed, return empty slots
-    if not business_hours or business_hours.is_closed:
+    if day["is_closed"]:
         return AvailableSlotsResponse(
             date=booking_date,
             slots=[],
             business_hours={"open_time": None, "close_time": None, "is_closed": True},
         )
 
-    if not business_hours.open_time or not business_hours.close_time:
-        return AvailableSlotsResponse(
-            date=booking_date,
-            slots=[],
-            business_hours={"open_time": None, "close_time": None, "is_closed": True},
-        )
+    # If date is today, filter out past times
+    not_before = to_minute(now.time()) if booking_date == today else None
 
-    # Generate all possible slots based on working hours
-    def generate_time_slots(start_time, end_time, interval_minutes=30):
-        """Generate time slots between start and end time."""
-        slots = []
-        current = datetime.combine(datetime.today(), start_time)
-        end_dt = datetime.combine(datetime.today(), end_time)
+    return AvailableSlotsResponse(
+        date=booking_date,
+        slots=[
+            TimeSlot(time=format_minute(start), available=available)
+            for start, available in day["slots"]
+            if not_before is None or start > not_before
+        ],
+        business_hours={
+            "open_time": format_minute(day["open_minute"]),
+            "close_time": format_minute(day["close_minute"]),
+            "is_closed": False,
+        },
+    )
 
-        while current < end_dt:
-            slots.append(current.strftime("%H:%M"))
-            current += timedelta(minutes=interval_minutes)
 
-        return slots
+@router.get("/{business_id}/availability-calendar", response_model=AvailabilityCalendarResponse)
+async def get_availability_calendar(
+    business_id: int,
+    service_id: int = Query(..., description="Service ID"),
+    start_date: date_type | None = Query(None, description="First day (default today)"),
+    days: int = Query(30, ge=1, le=60, description="Number of days"),
+    employee_id: int | None = Query(None, description="Only slots of this employee"),
+    include_slots: bool = Query(False, description="Include full slot lists"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get per-day availability for a service over a date range.
 
-    all_slots = generate_time_slots(
-        business_hours.open_time, business_hours.close_time, interval_minutes=30
-    )
+    Hours, qualified employees and bookings for the whole range are loaded once,
+    so the cost does not grow with the number of days requested.
+    """
+    now = datetime.now()
+    today = now.date()
+    start_date = max(start_date or today, today)
+    end_date = start_date + timedelta(days=days - 1)
 
-    # Get existing bookings for this date
-    bookings_result = await db.execute(
-        select(Booking).where(
-            Booking.business_id == business_id,
-            Booking.booking_date == booking_date,
-            Booking.status.in_(["pending", "confirmed"]),  # Only active bookings
+    service_result = await db.execute(
+        select(Service).where(
+            Service.id == service_id, Service.business_id == business_id
         )
     )
-    bookings = bookings_result.scalars().all()
-
-    # Create set of booked times
-    booked_times = {b.booking_time.strftime("%H:%M") for b in bookings}
+    service = service_result.scalar_one_or_none()
+    if not service:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Service not found"
+        )
 
-    # If date is today, filter out past times
-    current_time = None
-    if booking_date == today:
-        current_time = datetime.now().time()
+    inputs = await load_availability_inputs(db, business_id, service, start_date, end_date)
 
-    # Check availability for each slot
-    available_slots = []
-    for slot_str in all_slots:
-        slot_time = datetime.strptime(slot_str, "%H:%M").time()
+    calendar = []
+    for offset in range(days):
+        day = start_date + timedelta(days=offset)
+        plan = inputs.day_plan(day)
 
-        # Skip if in the past (for today)
-        if current_time and slot_time <= current_time:
+        if plan is None:
+            calendar.append(
+                DayAvailability(date=day, is_closed=True, slots=[] if include_slots else None)
+            )
             continue
 
-        # Check if slot is available
-        is_available = slot_str not in booked_times
-
-        available_slots.append(TimeSlot(time=slot_str, available=is_available))
+        slots = plan.slots(
+            service.duration_minutes,
+            step=settings.slot_interval_minutes,
+            not_before=to_minute(now.time()) if day == today else None,
+            resource_ids=[employee_id] if employee_id else None,
+        )
+        free = [start for start, available in slots if available]
+
+        calendar.append(
+            DayAvailability(
+                date=day,
+                is_closed=False,
+                first_free_time=format_minute(free[0]) if free else None,
+                free_slots=len(free),
+                slots=(
+                    [
+                        TimeSlot(time=format_minute(start), available=available)
+                        for start, available in slots
+                    ]
+                    if include_slots
+                    else None
+                ),
+            )
+        )
 
-    return AvailableSlotsResponse(
-        date=booking_date,
-        slots=available_slots,
-        business_hours={
-            "open_time": business_hours.open_time.strftime("%H:%M"),
-            "close_time": business_hours.close_time.strftime("%H:%M"),
-            "is_closed": False,
-        },
-    )
+    return AvailabilityCalendarResponse(service_id=service_id, days=calendar)
@@ -4,10 +4,12 @@ from sqlalchemy import select, and_
 from pydantic import BaseModel
 
 from app.core.database import get_db
-from app.api.dependencies import get_current_user
-from app.models.user import User
+from app.api.dependencies import Principal, get_current_user
 from app.models.business import Business
 from app.models.favorite import Favorite
+from app.models.loading import BusinessProfile, business_loader_options
+from app.services.business_summary import adjust_favorite_count
+from app.services.live_status import get_statuses
 
 router = APIRouter(prefix="/favorites", tags=["favorites"])
 
@@ -21,6 +23,7 @@ class FavoriteResponse(BaseModel):
     business_id: int
     business_name: str
     business_type: str
+    status: dict | None = None
 
     class Config:
         from_attributes = True
@@ -28,25 +31,30 @@ class FavoriteResponse(BaseModel):
 
 @router.get("/my", response_model=list[FavoriteResponse])
 async def get_my_favorites(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Get all favorites for the authenticated user."""
     result = await db.execute(
         select(Favorite, Business)
         .join(Business, Favorite.business_id == Business.id)
+        .options(*business_loader_options(BusinessProfile.LIST_CARD))
         .where(Favorite.user_id == current_user.id)
         .order_by(Favorite.created_at.desc())
     )
 
+    rows = result.all()
+    statuses = await get_statuses(db, [business.id for _, business in rows])
+
     favorites = []
-    for favorite, business in result.all():
+    for favorite, business in rows:
         favorites.append(
             {
                 "id": favorite.id,
                 "business_id": business.id,
                 "business_name": business.name,
                 "business_type": business.type.value,
+                "status": statuses[business.id],
             }
         )
 
@@ -56,13 +64,15 @@ async def get_my_favorites(
 @router.post("", status_code=status.HTTP_201_CREATED)
 async def add_favorite(
     favorite_data: FavoriteCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Add a business to favorites."""
     # Check if business exists
     business_result = await db.execute(
-        select(Business).where(Business.id == favorite_data.business_id)
+        select(Business)
+        .options(*business_loader_options(BusinessProfile.LIST_CARD))
+        .where(Business.id == favorite_data.business_id)
     )
     business = business_result.scalar_one_or_none()
 
@@ -96,6 +106,7 @@ async def add_favorite(
     )
 
     db.add(new_favorite)
+    await adjust_favorite_count(db, favorite_data.business_id, 1)
     await db.commit()
     await db.refresh(new_favorite)
 
@@ -109,7 +120,7 @@ async def add_favorite(
 @router.delete("/{favorite_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_favorite(
     favorite_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Remove a business from favorites."""
@@ -127,13 +138,14 @@ async def remove_favorite(
         )
 
     await db.delete(favorite)
+    await adjust_favorite_count(db, favorite.business_id, -1)
     await db.commit()
 
 
 @router.delete("/business/{business_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_favorite_by_business(
     business_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Remove a business from favorites by business_id."""
@@ -154,4 +166,5 @@ async def remove_favorite_by_business(
         )
 
     await db.delete(favorite)
+    await adjust_favorite_count(db, favorite.business_id, -1)
     await db.commit()
@@ -6,7 +6,7 @@ import os
 import uuid
 
 from app.core.database import get_db
-from app.api.dependencies import get_current_user
+from app.api.dependencies import CLIENT, Principal, get_current_user, invalidate_principal
 from app.models.user import User
 from app.schemas.user import User as UserSchema, UserProfileUpdate
 
@@ -15,19 +15,38 @@ router = APIRouter(prefix="/profile", tags=["profile"])
 UPLOAD_DIR = "uploads"
 
 
+async def _get_profile_user(principal: Principal, db: AsyncSession) -> User:
+    """Load the full user row for profile endpoints."""
+    result = await db.execute(select(User).where(User.id == principal.id))
+    user = result.scalar_one_or_none()
+
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found",
+        )
+
+    return user
+
+
 @router.get("/me", response_model=UserSchema)
-async def get_my_profile(current_user: User = Depends(get_current_user)):
+async def get_my_profile(
+    principal: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
     """Get current user profile."""
-    return current_user
+    return await _get_profile_user(principal, db)
 
 
 @router.patch("/me", response_model=UserSchema)
 async def update_my_profile(
     profile_data: UserProfileUpdate,
-    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Update current user profile."""
+    current_user = await _get_profile_user(principal, db)
+
     # Update fields if provided
     if profile_data.name is not None:
         current_user.name = profile_data.name
@@ -48,6 +67,7 @@ async def update_my_profile(
 
     await db.commit()
     await db.refresh(current_user)
+    await invalidate_principal(CLIENT, current_user.id)
 
     logger.info(f"User {current_user.id} updated profile")
     return current_user
@@ -56,10 +76,12 @@ async def update_my_profile(
 @router.post("/me/avatar", response_model=UserSchema)
 async def upload_avatar(
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Upload user avatar photo."""
+    current_user = await _get_profile_user(principal, db)
+
     # Validate file type
     allowed_extensions = {".jpg", ".jpeg", ".png", ".webp"}
     file_ext = os.path.splitext(file.filename)[1].lower()
@@ -103,6 +125,7 @@ async def upload_avatar(
     current_user.avatar_url = f"/{file_path.replace(os.sep, '/')}"
     await db.commit()
     await db.refresh(current_user)
+    await invalidate_principal(CLIENT, current_user.id)
 
     logger.info(f"User {current_user.id} uploaded avatar: {file_path}")
     return current_user
@@ -110,10 +133,12 @@ async def upload_avatar(
 
 @router.delete("/me/avatar", response_model=UserSchema)
 async def delete_avatar(
-    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Delete user avatar photo."""
+    current_user = await _get_profile_user(principal, db)
+
     if not current_user.avatar_url:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -132,6 +157,7 @@ async def delete_avatar(
     current_user.avatar_url = None
     await db.commit()
     await db.refresh(current_user)
+    await invalidate_principal(CLIENT, current_user.id)
 
     logger.info(f"User {current_user.id} deleted avatar")
     return current_user
@@ -0,0 +1,127 @@
+import asyncio
+
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect, status
+from sqlalchemy import Boolean, func, select
+
+from app.api.dependencies import authenticate_business_admin
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.models.business import Business
+from app.services.live_status import get_statuses
+from app.services.realtime import SubscriberQueue, booking_fanout, status_fanout
+
+router = APIRouter(prefix="/realtime", tags=["realtime"])
+
+
+async def _resolve_business_ids(command: dict) -> set[int]:
+    """Get business ids for a subscribe command (explicit ids or a lat/lon viewport)."""
+    limit = settings.realtime_max_subscriptions
+
+    if "business_ids" in command:
+        return {int(i) for i in command["business_ids"][:limit]}
+
+    min_lat, min_lon, max_lat, max_lon = (float(v) for v in command["viewport"])
+    async with async_session_maker() as db:
+        result = await db.execute(
+            select(Business.id)
+            .where(
+                # Bounding box overlap, served by the GiST index on geog
+                Business.geog.op("&&", return_type=Boolean)(
+                    func.geography(func.ST_MakeEnvelope(min_lon, min_lat, max_lon, max_lat, 4326))
+                )
+            )
+            .limit(limit)
+        )
+        return set(result.scalars().all())
+
+
+async def _snapshot(business_ids: set[int]) -> dict:
+    """Current statuses for subscribed businesses (short-lived session on misses only)."""
+    async with async_session_maker() as db:
+        statuses = await get_statuses(db, sorted(business_ids))
+    return {"type": "snapshot", "statuses": statuses}
+
+
+async def _send_messages(websocket: WebSocket, queue: SubscriberQueue):
+    """Forward queued messages to the socket; the only task that sends."""
+    while True:
+        message = await queue.get()
+        if queue.overflowed:
+            # Client fell behind: make it reconnect and take a fresh snapshot
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+            return
+        await websocket.send_json(message)
+
+
+@router.websocket("/status")
+async def status_feed(websocket: WebSocket):
+    """
+    Stream business status changes.
+
+    Client sends a subscribe command, either
+    {"business_ids": [1, 2, 3]} or {"viewport": [min_lat, min_lon, max_lat, max_lon]}.
+    Server replies with {"type": "snapshot", "statuses": {...}} and then pushes
+    {"type": "status", "business_id": ..., "status": {...}} on every change.
+    Sending a new command replaces the subscription.
+    """
+    await websocket.accept()
+
+    queue = SubscriberQueue()
+    subscribed: set[int] = set()
+
+    sender = asyncio.create_task(_send_messages(websocket, queue))
+    try:
+        while True:
+            try:
+                # Frames that are not JSON are answered like any other bad command
+                command = await websocket.receive_json()
+                business_ids = await _resolve_business_ids(command)
+            except (KeyError, TypeError, ValueError):
+                queue.offer({"type": "error", "detail": "Invalid subscribe command"})
+                continue
+
+            # Subscribe before the snapshot so no change in between is lost
+            status_fanout.unsubscribe(queue, subscribed)
+            subscribed = business_ids
+            status_fanout.subscribe(queue, subscribed)
+            queue.offer(await _snapshot(subscribed))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        status_fanout.unsubscribe(queue, subscribed)
+        sender.cancel()
+
+
+@router.websocket("/bookings")
+async def booking_feed(websocket: WebSocket, token: str = Query(...)):
+    """
+    Stream booking events of the admin's business.
+
+    Authenticated with the admin access token in the ``token`` query parameter
+    (browsers cannot set headers on WebSocket requests). Pushes
+    {"type": "booking.created" | "booking.cancelled" | "booking.updated",
+    "business_id": ..., "booking": {...}}.
+    """
+    async with async_session_maker() as db:
+        admin = await authenticate_business_admin(token, db)
+
+    if admin is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+
+    queue = SubscriberQueue()
+    business_ids = {admin.business_id}
+    booking_fanout.subscribe(queue, business_ids)
+
+    sender = asyncio.create_task(_send_messages(websocket, queue))
+    try:
+        # Incoming messages are ignored; reading only notices the client leaving
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        booking_fanout.unsubscribe(queue, business_ids)
+        sender.cancel()
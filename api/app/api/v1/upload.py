@@ -8,9 +8,8 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_current_business_admin
+from app.api.dependencies import Principal, get_current_business_admin
 from app.core.database import get_db
-from app.models.business import Business
 
 router = APIRouter(prefix="/upload", tags=["upload"])
 
@@ -48,7 +47,7 @@ def validate_image(file: UploadFile) -> None:
 @router.post("/photo")
 async def upload_photo(
     file: Annotated[UploadFile, File(description="Image file to upload")],
-    current_business: Annotated[Business, Depends(get_current_business_admin)],
+    current_business: Annotated[Principal, Depends(get_current_business_admin)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> dict[str, str]:
     """
@@ -88,7 +87,7 @@ async def upload_photo(
 @router.delete("/photo")
 async def delete_photo(
     url: str,
-    current_business: Annotated[Business, Depends(get_current_business_admin)],
+    current_business: Annotated[Principal, Depends(get_current_business_admin)],
 ) -> dict[str, str]:
     """Delete a photo file."""
     # Extract filename from URL
@@ -18,6 +18,70 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
 
+    # Auth principal cache (in-process LRU, then Redis)
+    principal_local_ttl_seconds: int = 30
+    principal_redis_ttl_seconds: int = 300
+
+    # In-process spatial index for /businesses/nearby
+    spatial_index_enabled: bool = False
+    spatial_index_refresh_seconds: int = 300
+
+    # Largest radius_km accepted by location searches
+    max_search_radius_km: float = 50.0
+
+    # business_summary read model: full rebuild interval (writes update it inline)
+    business_summary_reconcile_seconds: int = 3600
+
+    # booking_daily_stats rollups: full rebuild interval (writes update them inline)
+    booking_stats_reconcile_seconds: int = 3600
+    booking_stats_reconcile_days: int = 60  # booking dates this far before and after today
+
+    # Cached /admin/analytics/* reports
+    analytics_cache_ttl_seconds: int = 60
+
+    # status_history partitions and rollups
+    status_history_retention_months: int = 12  # raw rows and hourly rollups; 0 keeps them forever
+    # Monthly partitions created in advance. There is no DEFAULT partition (it would rule out
+    # DETACH PARTITION CONCURRENTLY), so this is how long inserts survive a stalled maintenance job
+    status_history_partitions_ahead: int = 12
+    status_rollup_seconds: int = 900  # rollup and partition maintenance interval
+
+    # Status changes within this window share one broadcast and history row (0 disables)
+    status_coalesce_seconds: int = 3
+
+    # Buffered status history writer
+    status_history_queue_size: int = 10000  # pending rows per worker
+    status_history_batch_size: int = 500  # rows per INSERT
+    status_history_flush_seconds: float = 1.0  # longest a row waits in the queue
+    status_history_enqueue_timeout_seconds: float = 0.5  # wait for room, then write directly
+    status_history_flush_timeout_seconds: float = 10.0  # shutdown flush budget
+
+    # Weekly occupancy profiles ("usually busy at")
+    # Job interval; each run adds the days completed since the previous one.
+    occupancy_refresh_seconds: int = 21600
+    occupancy_half_life_days: int = 28  # weight of older weeks halves every this many days
+    occupancy_initial_days: int = 56  # history read when a profile is first built
+    occupancy_batch_size: int = 500  # businesses per transaction
+
+    # Booking slots grid
+    slot_interval_minutes: int = 30
+    slot_cache_ttl_seconds: int = 86400
+    slot_hold_ttl_seconds: int = 300  # how long a client may keep a slot while checking out
+    slot_hold_max_per_client: int = 3  # live holds one client (IP address) may keep
+    available_now_candidates: int = 100  # nearest businesses checked by /businesses/available-now
+
+    # Cached business detail documents (also invalidated by the business version)
+    business_detail_cache_ttl_seconds: int = 3600
+
+    # Idempotency-Key handling for retried writes
+    idempotency_ttl_seconds: int = 86400  # how long a response is replayed
+    idempotency_lock_seconds: int = 30  # upper bound of a request in flight
+    idempotency_wait_seconds: float = 5.0  # how long a duplicate waits for the first
+
+    # Real-time WebSocket feeds
+    realtime_max_subscriptions: int = 500  # business ids per socket
+    realtime_queue_size: int = 100  # pending messages per socket before it is dropped
+
     # 2GIS API
     dgis_api_key: str
 
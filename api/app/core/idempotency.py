@@ -0,0 +1,199 @@
+import asyncio
+import hashlib
+import json
+
+from jose import JWTError
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import Counter
+from app.core.redis import redis_client
+from app.core.security import decode_token
+
+IDEMPOTENCY_HEADER = "idempotency-key"
+CLIENT_ID_HEADER = "x-client-id"
+POLL_INTERVAL_SECONDS = 0.1
+
+idempotency_requests = Counter(
+    "idempotency_requests_total",
+    "Requests with an Idempotency-Key by result (new, replayed, in_flight, mismatch)",
+)
+
+
+class IdempotencyMiddleware:
+    """
+    Replay stored responses for retried write requests.
+
+    For the configured (method, path) pairs, a request carrying an
+    Idempotency-Key header runs once per key and caller. The caller is the
+    authenticated principal (user type and id from the access token, so a
+    refreshed token keeps the key); anonymous callers are identified by an
+    X-Client-Id header and are not deduplicated without one. Its response is kept in Redis, and retries with the same key get
+    it back without reaching the endpoint. A duplicate arriving while the first
+    request is still running waits for its response, and gets 409 if it takes
+    too long. Reusing a key for a different body gives 422. 5xx responses are
+    not stored, so the client can retry them.
+    """
+
+    def __init__(self, app: ASGIApp, routes: set[tuple[str, str]]):
+        self.app = app
+        self.routes = routes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or (scope["method"], scope["path"]) not in self.routes:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        key = headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            await self.app(scope, receive, send)
+            return
+
+        if len(key) > 255:
+            response = JSONResponse({"detail": "Idempotency-Key is too long"}, status_code=400)
+            await response(scope, receive, send)
+            return
+
+        caller = _caller(headers)
+        if caller is None:
+            await self.app(scope, receive, send)
+            return
+
+        body = await _read_body(receive)
+        fingerprint = hashlib.sha256(body).hexdigest()
+        redis_key = "idempotency:" + hashlib.sha256(
+            f"{caller}\n{scope['method']} {scope['path']}\n{key}".encode()
+        ).hexdigest()
+
+        acquired = await redis_client.set_nx(
+            redis_key,
+            json.dumps({"state": "in_flight", "fingerprint": fingerprint}),
+            expire=settings.idempotency_lock_seconds,
+        )
+        if not acquired:
+            await self._replay(redis_key, fingerprint, scope, receive, send)
+            return
+
+        idempotency_requests.inc(result="new")
+        started: dict = {}
+        chunks: list[bytes] = []
+
+        async def capture(message: Message):
+            if message["type"] == "http.response.start":
+                started.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, _replay_body(body, receive), capture)
+        except BaseException:
+            await redis_client.delete(redis_key)
+            raise
+
+        if not started or started["status"] >= 500:
+            await redis_client.delete(redis_key)
+            return
+
+        await redis_client.set(
+            redis_key,
+            json.dumps(
+                {
+                    "state": "done",
+                    "fingerprint": fingerprint,
+                    "status": started["status"],
+                    "headers": [
+                        [name.decode("latin-1"), value.decode("latin-1")]
+                        for name, value in started.get("headers", [])
+                    ],
+                    "body": b"".join(chunks).decode("latin-1"),
+                }
+            ),
+            expire=settings.idempotency_ttl_seconds,
+        )
+
+    async def _replay(self, redis_key: str, fingerprint: str, scope: Scope, receive: Receive, send: Send):
+        """Answer a duplicate with the stored response, waiting for one in flight."""
+        record = None
+        deadline = asyncio.get_running_loop().time() + settings.idempotency_wait_seconds
+        while asyncio.get_running_loop().time() < deadline:
+            cached = await redis_client.get(redis_key)
+            record = json.loads(cached) if cached else None
+            if record is None or record["state"] == "done":
+                break
+            await asyncio.sleep(POLL_INTERVAL_SECONDS)
+
+        if record is not None and record["fingerprint"] != fingerprint:
+            idempotency_requests.inc(result="mismatch")
+            response = JSONResponse(
+                {"detail": "Idempotency-Key was already used for a different request"},
+                status_code=422,
+            )
+        elif record is None or record["state"] != "done":
+            # Still running, or the first attempt failed and released the key
+            idempotency_requests.inc(result="in_flight")
+            response = JSONResponse(
+                {"detail": "A request with this Idempotency-Key is in progress, retry later"},
+                status_code=409,
+            )
+        else:
+            idempotency_requests.inc(result="replayed")
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": record["status"],
+                    "headers": [
+                        (name.encode("latin-1"), value.encode("latin-1"))
+                        for name, value in record["headers"]
+                    ]
+                    + [(b"idempotent-replayed", b"true")],
+                }
+            )
+            await send({"type": "http.response.body", "body": record["body"].encode("latin-1")})
+            return
+
+        await response(scope, receive, send)
+
+
+def _caller(headers: Headers) -> str | None:
+    """Namespace of a caller's keys, or None if the caller cannot be told apart."""
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            payload = decode_token(token)
+        except JWTError:
+            payload = {}
+        if payload.get("type") == "access" and payload.get("sub"):
+            return f"{payload.get('user_type') or 'client'}:{payload['sub']}"
+
+    client_id = headers.get(CLIENT_ID_HEADER)
+    if client_id and len(client_id) <= 255:
+        return f"anonymous:{client_id}"
+    return None
+
+
+async def _read_body(receive: Receive) -> bytes:
+    """Read the whole request body."""
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+def _replay_body(body: bytes, receive: Receive) -> Receive:
+    """Receive callable that yields the already read body first."""
+    sent = False
+
+    async def wrapped() -> Message:
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return wrapped
@@ -0,0 +1,37 @@
+from collections import defaultdict
+
+
+class Counter:
+    """Monotonic in-process counter with optional labels."""
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self._values: dict[tuple[tuple[str, str], ...], float] = defaultdict(float)
+        registry.append(self)
+
+    def inc(self, amount: float = 1, **labels: str):
+        """Increase counter for a label set."""
+        self._values[tuple(sorted(labels.items()))] += amount
+
+    def value(self, **labels: str) -> float:
+        """Current value for a label set."""
+        return self._values.get(tuple(sorted(labels.items())), 0)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        for labels, value in self._values.items():
+            label_str = ",".join(f'{key}="{val}"' for key, val in labels)
+            lines.append(f"{self.name}{{{label_str}}} {value}" if label_str else f"{self.name} {value}")
+        return lines
+
+
+registry: list[Counter] = []
+
+
+def render_metrics() -> str:
+    """Render all counters of this worker in Prometheus text format."""
+    lines = []
+    for counter in registry:
+        lines.extend(counter.render())
+    return "\n".join(lines) + "\n"
@@ -32,10 +32,80 @@ class RedisClient:
         if self.redis:
             await self.redis.set(key, value, ex=expire)
 
+    async def set_nx(self, key: str, value: str, expire: int) -> bool:
+        """Set value only if the key does not exist; True if it was set."""
+        if self.redis:
+            return bool(await self.redis.set(key, value, ex=expire, nx=True))
+        return True
+
     async def delete(self, key: str):
         """Delete key."""
         if self.redis:
             await self.redis.delete(key)
 
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        """Get several values in one round trip."""
+        if self.redis and keys:
+            return await self.redis.mget(keys)
+        return [None] * len(keys)
+
+    async def incr(self, key: str, expire: int | None = None) -> int | None:
+        """Increment counter, optionally refreshing its expiration."""
+        if self.redis:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.incr(key)
+                if expire:
+                    pipe.expire(key, expire)
+                results = await pipe.execute()
+            return results[0]
+        return None
+
+    async def hset(self, name: str, mapping: dict[str, str]):
+        """Set several fields of a hash."""
+        if self.redis and mapping:
+            await self.redis.hset(name, mapping=mapping)
+
+    async def hsetnx(self, name: str, mapping: dict[str, str]):
+        """Set fields of a hash that do not exist yet, pipelined."""
+        if self.redis and mapping:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    pipe.hsetnx(name, key, value)
+                await pipe.execute()
+
+    async def hmget(self, name: str, keys: list[str]) -> list[str | None]:
+        """Get several fields of a hash in one round trip."""
+        if self.redis and keys:
+            return await self.redis.hmget(name, keys)
+        return [None] * len(keys)
+
+    async def zrem(self, name: str, member: str) -> int:
+        """Remove a member from a sorted set; returns number removed."""
+        if self.redis:
+            return await self.redis.zrem(name, member)
+        return 0
+
+    async def zrangebyscore(
+        self, names: list[str], min_score: float
+    ) -> list[list[tuple[str, float]]]:
+        """Get members scored at least min_score from several sorted sets, pipelined."""
+        if self.redis and names:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for name in names:
+                    pipe.zrangebyscore(name, min_score, "+inf", withscores=True)
+                return await pipe.execute()
+        return [[] for _ in names]
+
+    async def eval(self, script: str, keys: list[str], args: list) -> object:
+        """Run a Lua script atomically."""
+        if self.redis:
+            return await self.redis.eval(script, len(keys), *keys, *args)
+        return None
+
+    async def publish(self, channel: str, message: str):
+        """Publish message to a pub/sub channel."""
+        if self.redis:
+            await self.redis.publish(channel, message)
+
 
 redis_client = RedisClient()
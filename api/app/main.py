@@ -1,12 +1,24 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from loguru import logger
 from pathlib import Path
 
 from app.core.config import settings
+from app.core.idempotency import IdempotencyMiddleware
+from app.core.metrics import render_metrics
 from app.core.redis import redis_client
+from app.services.booking_stats import reconcile_booking_stats_periodically
+from app.services.business_summary import reconcile_business_summaries_periodically
+from app.services.occupancy import refresh_occupancy_profiles_periodically
+from app.services.realtime import booking_fanout, status_fanout
+from app.services.status_coalescer import status_coalescer
+from app.services.status_history import maintain_status_history_periodically
+from app.services.status_history_writer import status_history_writer
+from app.services.spatial_index import rebuild_business_index, refresh_business_index_periodically
 from app.api.v1 import auth
 
 
@@ -17,11 +29,34 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Lets API...")
     await redis_client.connect()
     logger.info("Redis connected")
+    status_fanout.start()
+    booking_fanout.start()
+    status_history_writer.start()
+
+    index_refresh_task = None
+    if settings.spatial_index_enabled:
+        await rebuild_business_index()
+        index_refresh_task = asyncio.create_task(refresh_business_index_periodically())
+
+    summary_reconcile_task = asyncio.create_task(reconcile_business_summaries_periodically())
+    stats_reconcile_task = asyncio.create_task(reconcile_booking_stats_periodically())
+    status_history_task = asyncio.create_task(maintain_status_history_periodically())
+    occupancy_task = asyncio.create_task(refresh_occupancy_profiles_periodically())
 
     yield
 
     # Shutdown
     logger.info("Shutting down Lets API...")
+    summary_reconcile_task.cancel()
+    stats_reconcile_task.cancel()
+    status_history_task.cancel()
+    occupancy_task.cancel()
+    await status_coalescer.stop()
+    await status_history_writer.stop()
+    if index_refresh_task:
+        index_refresh_task.cancel()
+    await status_fanout.stop()
+    await booking_fanout.stop()
     await redis_client.disconnect()
     logger.info("Redis disconnected")
 
@@ -34,6 +69,16 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Retried writes from mobile clients are answered from Redis
+# (added before CORS so replayed responses still get CORS headers)
+app.add_middleware(
+    IdempotencyMiddleware,
+    routes={
+        ("POST", "/api/v1/bookings"),
+        ("PATCH", "/api/v1/admin/status"),
+    },
+)
+
 # Configure CORS
 # Origins are managed via settings.allowed_origins_list property
 # Development: predefined 127.0.0.1 origins for dev apps
@@ -44,10 +89,11 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
 # Include routers
-from app.api.v1 import admin, businesses, bookings, favorites, upload, profile
+from app.api.v1 import admin, businesses, bookings, favorites, upload, profile, realtime
 
 app.include_router(auth.router, prefix="/api/v1")
 app.include_router(profile.router, prefix="/api/v1")
@@ -56,6 +102,7 @@ app.include_router(businesses.router, prefix="/api/v1")
 app.include_router(bookings.router, prefix="/api/v1")
 app.include_router(favorites.router, prefix="/api/v1")
 app.include_router(upload.router, prefix="/api/v1")
+app.include_router(realtime.router, prefix="/api/v1")
 
 # Mount static files for uploaded photos
 UPLOAD_DIR = Path("uploads")
@@ -77,3 +124,9 @@ async def root():
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Counters of this worker in Prometheus text format."""
+    return render_metrics()
@@ -6,6 +6,10 @@ from app.models.service import Service
 from app.models.booking import Booking
 from app.models.favorite import Favorite
 from app.models.promotion import Promotion
+from app.models.business_summary import BusinessSummary
+from app.models.booking_stats import BookingDailyStats
+from app.models.status_stats import StatusHourlyStats, StatusDailyStats
+from app.models.business_occupancy import BusinessOccupancy
 
 __all__ = [
     "User",
@@ -20,4 +24,9 @@ __all__ = [
     "Booking",
     "Favorite",
     "Promotion",
+    "BusinessSummary",
+    "BookingDailyStats",
+    "StatusHourlyStats",
+    "StatusDailyStats",
+    "BusinessOccupancy",
 ]
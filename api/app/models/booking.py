@@ -1,5 +1,5 @@
 from datetime import datetime, date, time
-from sqlalchemy import String, DateTime, ForeignKey, Date, Time, Boolean, Text, Enum as SQLEnum
+from sqlalchemy import String, DateTime, ForeignKey, Date, Time, Boolean, Text, Enum as SQLEnum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 
@@ -19,6 +19,10 @@ class Booking(Base):
     """Client booking model."""
 
     __tablename__ = "bookings"
+    # Keyset pagination of a business's bookings (admin list)
+    __table_args__ = (
+        Index("ix_bookings_business_date_time_id", "business_id", "booking_date", "booking_time", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     business_id: Mapped[int] = mapped_column(ForeignKey("businesses.id"), index=True)
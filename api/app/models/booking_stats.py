@@ -0,0 +1,31 @@
+from datetime import date
+from sqlalchemy import ForeignKey, Integer, Date, Boolean, Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.models.booking import BookingStatus
+
+
+class BookingDailyStats(Base):
+    """
+    Number of bookings per business, day and breakdown.
+
+    Maintained by app.services.booking_stats on every booking write and
+    rebuilt periodically from bookings. The day is the booking date.
+    """
+
+    __tablename__ = "booking_daily_stats"
+
+    business_id: Mapped[int] = mapped_column(
+        ForeignKey("businesses.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    status: Mapped[BookingStatus] = mapped_column(
+        SQLEnum(BookingStatus, values_callable=lambda x: [e.value for e in x]),
+        primary_key=True,
+    )
+    # 0 for bookings without an employee (part of the key, so not nullable)
+    employee_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    service_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    came_through_app: Mapped[bool] = mapped_column(Boolean, primary_key=True)
+    bookings: Mapped[int] = mapped_column(Integer, default=0, server_default='0')
@@ -1,10 +1,11 @@
 from datetime import datetime, time
-from sqlalchemy import String, Float, DateTime, ForeignKey, Integer, Text, Enum as SQLEnum, Time, Boolean
+from sqlalchemy import String, Float, DateTime, ForeignKey, Integer, Text, Enum as SQLEnum, Time, Boolean, Computed, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSON, TSVECTOR
 import enum
 
 from app.core.database import Base
+from app.models.types import Geography
 
 
 class BusinessType(str, enum.Enum):
@@ -36,6 +37,13 @@ class Business(Base):
     """Auto service business model."""
 
     __tablename__ = "businesses"
+    # Trigram index on search_normalize(name) is created by its migration
+    __table_args__ = (
+        Index("ix_businesses_geog", "geog", postgresql_using="gist"),
+        Index("ix_businesses_search_vector", "search_vector", postgresql_using="gin"),
+        # Keyset pagination of the list ordered by name
+        Index("ix_businesses_name_id", "name", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(255), index=True)
@@ -45,10 +53,26 @@ class Business(Base):
     address: Mapped[str] = mapped_column(String(500))
     lat: Mapped[float] = mapped_column(Float)
     lon: Mapped[float] = mapped_column(Float)
+    # Maintained by Postgres from lat/lon; deferred because it is only used in SQL
+    geog: Mapped[str] = mapped_column(
+        Geography,
+        Computed("ST_SetSRID(ST_MakePoint(lon, lat), 4326)::geography", persisted=True),
+        deferred=True,
+    )
     phones: Mapped[list[str]] = mapped_column(JSON, default=list, server_default='[]')
     email: Mapped[str | None] = mapped_column(String(255), nullable=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     logo_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    # Russian full-text document (name weighted above description), see app.services.search
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('russian', search_normalize(name)), 'A') || "
+            "setweight(to_tsvector('russian', search_normalize(description)), 'C')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
     dgis_id: Mapped[str | None] = mapped_column(String(100), nullable=True, index=True)
     subscription_status: Mapped[SubscriptionStatus] = mapped_column(
         SQLEnum(SubscriptionStatus, values_callable=lambda x: [e.value for e in x]),
@@ -61,35 +85,38 @@ class Business(Base):
     )
 
     # Relationships
+    # Nothing is loaded implicitly: endpoints opt into a loader profile from
+    # app.models.loading, so an unexpected lazy load fails loudly instead of
+    # silently pulling the whole booking/status history.
     admins: Mapped[list["BusinessAdmin"]] = relationship(
-        "BusinessAdmin", back_populates="business", lazy="selectin"
+        "BusinessAdmin", back_populates="business", lazy="raise"
     )
     services: Mapped[list["Service"]] = relationship(
-        "Service", back_populates="business", lazy="selectin"
+        "Service", back_populates="business", lazy="raise"
     )
     current_status: Mapped["BusinessStatus"] = relationship(
-        "BusinessStatus", back_populates="business", uselist=False, lazy="selectin"
+        "BusinessStatus", back_populates="business", uselist=False, lazy="raise"
     )
     status_history: Mapped[list["StatusHistory"]] = relationship(
-        "StatusHistory", back_populates="business", lazy="selectin"
+        "StatusHistory", back_populates="business", lazy="raise"
     )
     business_hours: Mapped[list["BusinessHours"]] = relationship(
-        "BusinessHours", back_populates="business", lazy="selectin"
+        "BusinessHours", back_populates="business", lazy="raise"
     )
     bookings: Mapped[list["Booking"]] = relationship(
-        "Booking", back_populates="business", lazy="selectin"
+        "Booking", back_populates="business", lazy="raise"
     )
     favorites: Mapped[list["Favorite"]] = relationship(
-        "Favorite", back_populates="business", lazy="selectin"
+        "Favorite", back_populates="business", lazy="raise"
     )
     promotions: Mapped[list["Promotion"]] = relationship(
-        "Promotion", back_populates="business", lazy="selectin"
+        "Promotion", back_populates="business", lazy="raise"
     )
     photos: Mapped[list["BusinessPhoto"]] = relationship(
-        "BusinessPhoto", back_populates="business", lazy="selectin"
+        "BusinessPhoto", back_populates="business", lazy="raise"
     )
     employees: Mapped[list["Employee"]] = relationship(
-        "Employee", back_populates="business", lazy="selectin"
+        "Employee", back_populates="business", lazy="raise"
     )
 
 
@@ -135,17 +162,33 @@ class BusinessStatus(Base):
 
 
 class StatusHistory(Base):
-    """Historical record of status changes for analytics."""
+    """
+    Historical record of status changes for analytics.
+
+    Partitioned by month of updated_at (which is therefore part of the primary
+    key); partitions are created ahead and dropped after the retention period
+    by app.services.status_history, which also rolls the rows up into
+    StatusHourlyStats and StatusDailyStats.
+    """
 
     __tablename__ = "status_history"
+    __table_args__ = (
+        # Keyset pagination of a business's history (newest first)
+        Index("ix_status_history_business_updated_id", "business_id", "updated_at", "id"),
+        # Time windows of the rollups; rows arrive in time order, so BRIN stays tiny
+        Index("ix_status_history_updated_at_brin", "updated_at", postgresql_using="brin"),
+        {"postgresql_partition_by": "RANGE (updated_at)"},
+    )
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    business_id: Mapped[int] = mapped_column(ForeignKey("businesses.id"), index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    business_id: Mapped[int] = mapped_column(ForeignKey("businesses.id"))
     status: Mapped[AvailabilityStatus] = mapped_column(
         SQLEnum(AvailabilityStatus, values_callable=lambda x: [e.value for e in x])
     )
     estimated_wait_minutes: Mapped[int] = mapped_column(Integer)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, primary_key=True
+    )
 
     # Relationships
     business: Mapped["Business"] = relationship("Business", back_populates="status_history")
@@ -0,0 +1,32 @@
+from datetime import date, datetime
+from sqlalchemy import ForeignKey, Float, Date, DateTime, LargeBinary
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from app.core.database import Base
+
+# Cells of the weekly profile: 7 days x 24 hours, Monday 00:00 first
+OCCUPANCY_CELLS = 7 * 24
+
+
+class BusinessOccupancy(Base):
+    """
+    Weekly "usually busy at" profile of a business.
+
+    The sums are decayed running totals per (weekday, hour) of local time,
+    updated by app.services.occupancy with each newly completed day; profile is
+    their packed result, one byte (0-100) per cell.
+    """
+
+    __tablename__ = "business_occupancy"
+
+    business_id: Mapped[int] = mapped_column(
+        ForeignKey("businesses.id", ondelete="CASCADE"), primary_key=True
+    )
+    busy_seconds: Mapped[list[float]] = mapped_column(ARRAY(Float))
+    observed_seconds: Mapped[list[float]] = mapped_column(ARRAY(Float))
+    completed_bookings: Mapped[list[float]] = mapped_column(ARRAY(Float))
+    profile: Mapped[bytes] = mapped_column(LargeBinary)
+    # Last local day included in the sums
+    through_day: Mapped[date] = mapped_column(Date)
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
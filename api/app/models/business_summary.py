@@ -0,0 +1,68 @@
+from datetime import datetime
+from sqlalchemy import String, Float, DateTime, ForeignKey, Integer, Text, Enum as SQLEnum, Computed, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import JSON
+
+from app.core.database import Base
+from app.models.business import BusinessType, SubscriptionStatus
+from app.models.types import Geography
+
+
+class BusinessSummary(Base):
+    """
+    Read model with everything a list card or map marker shows.
+
+    One row per business, written by app.services.business_summary in the
+    same transaction as the change it reflects and reconciled periodically.
+    Column names follow Business so the row validates as the business schema.
+    Live status is not stored here, it comes from the live status store.
+    """
+
+    __tablename__ = "business_summary"
+    __table_args__ = (
+        Index("ix_business_summary_geog", "geog", postgresql_using="gist"),
+        Index("ix_business_summary_name_id", "name", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(
+        ForeignKey("businesses.id", ondelete="CASCADE"), primary_key=True
+    )
+    name: Mapped[str] = mapped_column(String(255))
+    type: Mapped[BusinessType] = mapped_column(
+        SQLEnum(BusinessType, values_callable=lambda x: [e.value for e in x]), index=True
+    )
+    address: Mapped[str] = mapped_column(String(500))
+    lat: Mapped[float] = mapped_column(Float)
+    lon: Mapped[float] = mapped_column(Float)
+    geog: Mapped[str] = mapped_column(
+        Geography,
+        Computed("ST_SetSRID(ST_MakePoint(lon, lat), 4326)::geography", persisted=True),
+        deferred=True,
+    )
+    phones: Mapped[list[str]] = mapped_column(JSON, default=list, server_default='[]')
+    email: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    logo_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    dgis_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    subscription_status: Mapped[SubscriptionStatus] = mapped_column(
+        SQLEnum(SubscriptionStatus, values_callable=lambda x: [e.value for e in x])
+    )
+    subscription_end_date: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+    updated_at: Mapped[datetime] = mapped_column(DateTime)
+
+    # Derived card fields
+    main_photo_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    min_price: Mapped[float | None] = mapped_column(Float, nullable=True)
+    # [{day_of_week, open_time, close_time, is_closed}] with times as "HH:MM"
+    hours: Mapped[list[dict]] = mapped_column(JSON, default=list, server_default='[]')
+    favorite_count: Mapped[int] = mapped_column(Integer, default=0, server_default='0')
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # Bumped by every write of the row, see app.services.business_summary
+    version: Mapped[int] = mapped_column(Integer, default=0, server_default='0')
+
+    @property
+    def today_hours(self) -> dict | None:
+        """Working hours for the current weekday, None if not set."""
+        weekday = datetime.now().weekday()
+        return next((h for h in self.hours if h["day_of_week"] == weekday), None)
@@ -33,7 +33,7 @@ class Employee(Base):
     # Relationships
     business: Mapped["Business"] = relationship("Business", back_populates="employees")
     bookings: Mapped[list["Booking"]] = relationship(
-        "Booking", back_populates="employee", lazy="selectin"
+        "Booking", back_populates="employee", lazy="raise"
     )
     services: Mapped[list["Service"]] = relationship(
         "Service", secondary=employee_services, back_populates="employees", lazy="selectin"
@@ -0,0 +1,34 @@
+"""Named relationship loading profiles.
+
+All Business relationships default to ``lazy="raise"``. Each endpoint picks the
+profile matching what it actually serializes, so the number of round trips is
+fixed per endpoint and does not grow with a business's booking or status history.
+The public detail page does not load ORM objects at all, see
+app.services.business_detail.
+"""
+import enum
+
+from sqlalchemy.orm import load_only, raiseload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from app.models.business import Business
+
+
+class BusinessProfile(str, enum.Enum):
+    """Loader profiles for Business queries."""
+
+    LIST_CARD = "list_card"  # Existence checks and favorites: id, name and type
+    ADMIN_DASHBOARD = "admin_dashboard"  # Admin profile forms: all scalar columns
+
+
+def business_loader_options(profile: BusinessProfile) -> list[LoaderOption]:
+    """Get loader options for a Business query.
+
+    Anything outside the profile raises on access instead of loading lazily.
+    """
+    if profile == BusinessProfile.LIST_CARD:
+        return [
+            load_only(Business.id, Business.name, Business.type, raiseload=True),
+            raiseload("*"),
+        ]
+    return [raiseload("*")]
@@ -1,5 +1,6 @@
 from datetime import datetime
-from sqlalchemy import String, Float, Integer, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import String, Float, Integer, Boolean, DateTime, ForeignKey, Text, Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -9,6 +10,10 @@ class Service(Base):
     """Service offered by a business."""
 
     __tablename__ = "services"
+    # Trigram index on search_normalize(name) is created by its migration
+    __table_args__ = (
+        Index("ix_services_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     business_id: Mapped[int] = mapped_column(ForeignKey("businesses.id"), index=True)
@@ -18,6 +23,16 @@ class Service(Base):
     price_to: Mapped[float] = mapped_column(Float)
     duration_minutes: Mapped[int] = mapped_column(Integer)
     photo_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    # Lets business search match service names, see app.services.search
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('russian', search_normalize(name)), 'A') || "
+            "setweight(to_tsvector('russian', search_normalize(description)), 'C')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(
@@ -0,0 +1,41 @@
+from datetime import date, datetime
+from sqlalchemy import ForeignKey, Integer, Date, DateTime, Float
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class StatusHourlyStats(Base):
+    """
+    Time a business spent in each status during one hour (UTC).
+
+    Rolled up from status_history by app.services.status_history. The average
+    wait while busy is busy_wait_minute_seconds / busy_seconds.
+    """
+
+    __tablename__ = "status_hourly_stats"
+
+    business_id: Mapped[int] = mapped_column(
+        ForeignKey("businesses.id", ondelete="CASCADE"), primary_key=True
+    )
+    hour: Mapped[datetime] = mapped_column(DateTime, primary_key=True, index=True)
+    available_seconds: Mapped[float] = mapped_column(Float, default=0, server_default='0')
+    busy_seconds: Mapped[float] = mapped_column(Float, default=0, server_default='0')
+    # Integral of estimated_wait_minutes over the busy time
+    busy_wait_minute_seconds: Mapped[float] = mapped_column(Float, default=0, server_default='0')
+    changes: Mapped[int] = mapped_column(Integer, default=0, server_default='0')
+
+
+class StatusDailyStats(Base):
+    """Daily (UTC) sums of StatusHourlyStats, kept after the hourly rows expire."""
+
+    __tablename__ = "status_daily_stats"
+
+    business_id: Mapped[int] = mapped_column(
+        ForeignKey("businesses.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    available_seconds: Mapped[float] = mapped_column(Float, default=0, server_default='0')
+    busy_seconds: Mapped[float] = mapped_column(Float, default=0, server_default='0')
+    busy_wait_minute_seconds: Mapped[float] = mapped_column(Float, default=0, server_default='0')
+    changes: Mapped[int] = mapped_column(Integer, default=0, server_default='0')
@@ -0,0 +1,14 @@
+from sqlalchemy.types import UserDefinedType
+
+
+class Geography(UserDefinedType):
+    """PostGIS geography(Point, 4326) column.
+
+    Only used inside SQL expressions (distance, KNN ordering); the value itself
+    is never loaded into Python, so no bind/result processing is needed.
+    """
+
+    cache_ok = True
+
+    def get_col_spec(self, **kw) -> str:
+        return "geography(Point,4326)"
@@ -35,8 +35,8 @@ class User(Base):
 
     # Relationships
     bookings: Mapped[list["Booking"]] = relationship(
-        "Booking", back_populates="user", lazy="selectin"
+        "Booking", back_populates="user", lazy="raise"
     )
     favorites: Mapped[list["Favorite"]] = relationship(
-        "Favorite", back_populates="user", lazy="selectin"
+        "Favorite", back_populates="user", lazy="raise"
     )
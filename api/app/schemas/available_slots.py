@@ -26,3 +26,20 @@ class AvailableSlotsResponse(BaseModel):
     business_hours: dict[str, str | None] = Field(
         ..., description="Opening hours for the day (open_time, close_time)"
     )
+
+
+class DayAvailability(BaseModel):
+    """Availability summary of one day."""
+
+    date: datetime.date
+    is_closed: bool
+    first_free_time: str | None = Field(None, description="Earliest free start in HH:MM format")
+    free_slots: int = Field(0, description="Number of free start times")
+    slots: list[TimeSlot] | None = Field(None, description="Full slot list (include_slots=true)")
+
+
+class AvailabilityCalendarResponse(BaseModel):
+    """Per-day availability over a date range."""
+
+    service_id: int
+    days: list[DayAvailability]
@@ -36,6 +36,24 @@ class BookingCreate(BookingBase):
     """Booking creation schema."""
 
     business_id: int
+    hold_id: str | None = None  # slot hold taken when the form was opened
+
+
+class SlotHoldCreate(BaseModel):
+    """Slot hold request schema."""
+
+    business_id: int
+    service_id: int
+    employee_id: int | None = None
+    booking_date: date
+    booking_time: time
+
+
+class SlotHold(BaseModel):
+    """Slot hold response schema."""
+
+    hold_id: str
+    expires_at: datetime
 
 
 class BookingUpdate(BaseModel):
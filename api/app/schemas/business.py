@@ -52,3 +52,9 @@ class Business(BusinessBase):
     subscription_end_date: datetime | None = None
     created_at: datetime
     updated_at: datetime
+    distance_km: float | None = None  # Set when listing by location
+    # List card fields, read from the business_summary read model
+    main_photo_url: str | None = None
+    min_price: float | None = None
+    today_hours: dict | None = None
+    favorite_count: int = 0
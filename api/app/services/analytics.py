@@ -0,0 +1,262 @@
+"""Business analytics computed in Postgres.
+
+Each report is one grouped statement over the daily rollups
+(app.services.booking_stats, app.services.status_history) or, for hour-level
+booking figures, over the business's bookings in the period. Results are
+column-oriented (one array per field) and cached per business for
+settings.analytics_cache_ttl_seconds, so a dashboard polling every report
+costs a few Redis reads.
+"""
+import json
+from datetime import date, timedelta
+from typing import Awaitable, Callable
+
+from sqlalchemy import Integer, and_, case, cast, extract, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import Counter
+from app.core.redis import redis_client
+from app.models.booking import Booking, BookingStatus
+from app.models.booking_stats import BookingDailyStats
+from app.models.business import BusinessHours
+from app.models.employee import Employee
+from app.models.service import Service
+from app.models.status_stats import StatusDailyStats
+
+INTERVALS = ("day", "week", "month")
+
+analytics_cache_requests = Counter(
+    "analytics_cache_requests_total", "Analytics report cache lookups by report and result"
+)
+
+
+def analytics_period(days: int) -> tuple[date, date]:
+    """First and last date of the last `days` days, today included."""
+    end_date = date.today()
+    return end_date - timedelta(days=days - 1), end_date
+
+
+async def cached_report(
+    business_id: int, report: str, params: tuple, compute: Callable[[], Awaitable[dict]]
+) -> str:
+    """Get a report as JSON from the cache, computing and storing it on a miss."""
+    key = f"analytics:{business_id}:{report}:" + ":".join(str(p) for p in params)
+    cached = await redis_client.get(key)
+    analytics_cache_requests.inc(report=report, result="hit" if cached else "miss")
+    if cached:
+        return cached
+
+    document = json.dumps(await compute(), separators=(",", ":"), default=str)
+    await redis_client.set(key, document, expire=settings.analytics_cache_ttl_seconds)
+    return document
+
+
+def _in_period(business_id: int, start_date: date, end_date: date):
+    return and_(
+        BookingDailyStats.business_id == business_id,
+        BookingDailyStats.day.between(start_date, end_date),
+    )
+
+
+async def bookings_series(
+    db: AsyncSession, business_id: int, start_date: date, end_date: date, interval: str
+) -> dict:
+    """Bookings per day, week or month, every period present (zeros included)."""
+    bucket = cast(func.date_trunc(interval, BookingDailyStats.day), BookingDailyStats.day.type)
+    cancelled = BookingDailyStats.status == BookingStatus.CANCELLED
+    counts = (
+        select(
+            bucket.label("period"),
+            func.sum(BookingDailyStats.bookings).label("total"),
+            func.sum(BookingDailyStats.bookings)
+            .filter(BookingDailyStats.came_through_app == True)
+            .label("through_app"),
+            func.sum(BookingDailyStats.bookings).filter(cancelled).label("cancelled"),
+        )
+        .where(_in_period(business_id, start_date, end_date))
+        .group_by(bucket)
+        .subquery()
+    )
+    periods = (
+        select(
+            cast(
+                func.generate_series(
+                    func.date_trunc(interval, start_date),
+                    end_date,
+                    literal_column(f"interval '1 {interval}'"),
+                ),
+                BookingDailyStats.day.type,
+            ).label("period")
+        )
+        .subquery()
+    )
+    result = await db.execute(
+        select(
+            periods.c.period,
+            func.coalesce(counts.c.total, 0),
+            func.coalesce(counts.c.through_app, 0),
+            func.coalesce(counts.c.cancelled, 0),
+        )
+        .outerjoin(counts, counts.c.period == periods.c.period)
+        .order_by(periods.c.period)
+    )
+    rows = result.all()
+
+    return {
+        "interval": interval,
+        "period": [row[0].isoformat() for row in rows],
+        "total": [row[1] for row in rows],
+        "through_app": [row[2] for row in rows],
+        "walk_in": [row[1] - row[2] for row in rows],
+        "cancelled": [row[3] for row in rows],
+    }
+
+
+async def load_heatmap(db: AsyncSession, business_id: int, start_date: date, end_date: date) -> dict:
+    """
+    Non-cancelled bookings by weekday (0=Monday) and starting hour.
+
+    Only non-empty cells are returned. Reads the bookings of the period through
+    the (business_id, booking_date, booking_time) index.
+    """
+    weekday = cast(extract("isodow", Booking.booking_date), Integer) - 1
+    hour = cast(extract("hour", Booking.booking_time), Integer)
+    result = await db.execute(
+        select(weekday, hour, func.count())
+        .where(
+            Booking.business_id == business_id,
+            Booking.booking_date.between(start_date, end_date),
+            Booking.status != BookingStatus.CANCELLED,
+        )
+        .group_by(weekday, hour)
+        .order_by(weekday, hour)
+    )
+    rows = result.all()
+
+    return {
+        "weekday": [row[0] for row in rows],
+        "hour": [row[1] for row in rows],
+        "bookings": [row[2] for row in rows],
+    }
+
+
+async def _open_minutes(db: AsyncSession, business_id: int, start_date: date, end_date: date) -> int:
+    """Working minutes of the business over the period, from its weekly hours."""
+    result = await db.execute(select(BusinessHours).where(BusinessHours.business_id == business_id))
+    minutes_by_weekday = {}
+    for hours in result.scalars().all():
+        if hours.is_closed or hours.open_time is None or hours.close_time is None:
+            continue
+        open_minute = hours.open_time.hour * 60 + hours.open_time.minute
+        close_minute = hours.close_time.hour * 60 + hours.close_time.minute
+        minutes_by_weekday[hours.day_of_week] = max(close_minute - open_minute, 0)
+
+    total_days = (end_date - start_date).days + 1
+    return sum(
+        minutes_by_weekday.get((start_date + timedelta(days=offset)).weekday(), 0)
+        for offset in range(total_days)
+    )
+
+
+async def employee_utilization(
+    db: AsyncSession, business_id: int, start_date: date, end_date: date
+) -> dict:
+    """
+    Non-cancelled bookings and booked minutes per employee over the period.
+
+    Utilization is booked minutes over the business's working minutes in the
+    period (None without working hours); employee_id None is unassigned bookings.
+    """
+    booked_minutes = func.sum(BookingDailyStats.bookings * Service.duration_minutes)
+    result = await db.execute(
+        select(
+            BookingDailyStats.employee_id,
+            Employee.name,
+            func.sum(BookingDailyStats.bookings),
+            booked_minutes,
+        )
+        .join(Service, Service.id == BookingDailyStats.service_id)
+        .outerjoin(Employee, Employee.id == BookingDailyStats.employee_id)
+        .where(
+            _in_period(business_id, start_date, end_date),
+            BookingDailyStats.status != BookingStatus.CANCELLED,
+        )
+        .group_by(BookingDailyStats.employee_id, Employee.name)
+        .order_by(booked_minutes.desc())
+    )
+    rows = result.all()
+    open_minutes = await _open_minutes(db, business_id, start_date, end_date)
+
+    return {
+        "employee_id": [row[0] or None for row in rows],
+        "name": [row[1] for row in rows],
+        "bookings": [row[2] for row in rows],
+        "booked_minutes": [row[3] for row in rows],
+        "utilization": [
+            round(row[3] / open_minutes, 4) if open_minutes and row[0] else None for row in rows
+        ],
+        "open_minutes": open_minutes,
+    }
+
+
+async def channel_split(db: AsyncSession, business_id: int, start_date: date, end_date: date) -> dict:
+    """Bookings made through the app vs. walk-in (admin-created), by status."""
+    channel = case((BookingDailyStats.came_through_app == True, "app"), else_="walk_in")
+    statuses = [s for s in BookingStatus]
+    result = await db.execute(
+        select(
+            channel,
+            *(
+                func.coalesce(
+                    func.sum(BookingDailyStats.bookings).filter(BookingDailyStats.status == s), 0
+                )
+                for s in statuses
+            ),
+        )
+        .where(_in_period(business_id, start_date, end_date))
+        .group_by(channel)
+    )
+    by_channel = {row[0]: row[1:] for row in result.all()}
+
+    channels = ["app", "walk_in"]
+    report = {"channel": channels}
+    for index, booking_status in enumerate(statuses):
+        report[booking_status.value] = [
+            by_channel[name][index] if name in by_channel else 0 for name in channels
+        ]
+    report["total"] = [sum(by_channel.get(name, ())) for name in channels]
+    return report
+
+
+async def status_series(db: AsyncSession, business_id: int, start_date: date, end_date: date) -> dict:
+    """
+    Hours spent available and busy, average wait while busy and number of
+    status changes per day (UTC), from the status rollups.
+    """
+    result = await db.execute(
+        select(
+            StatusDailyStats.day,
+            StatusDailyStats.available_seconds,
+            StatusDailyStats.busy_seconds,
+            StatusDailyStats.busy_wait_minute_seconds,
+            StatusDailyStats.changes,
+        )
+        .where(
+            StatusDailyStats.business_id == business_id,
+            StatusDailyStats.day.between(start_date, end_date),
+        )
+        .order_by(StatusDailyStats.day)
+    )
+    rows = result.all()
+
+    return {
+        "day": [row.day.isoformat() for row in rows],
+        "available_hours": [round(row.available_seconds / 3600, 2) for row in rows],
+        "busy_hours": [round(row.busy_seconds / 3600, 2) for row in rows],
+        "avg_wait_minutes": [
+            round(row.busy_wait_minute_seconds / row.busy_seconds, 1) if row.busy_seconds else None
+            for row in rows
+        ],
+        "changes": [row.changes for row in rows],
+    }
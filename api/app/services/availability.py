@@ -0,0 +1,350 @@
+"""Booking availability engine.
+
+A day is represented as minute-resolution bitmasks (Python ints, bit i is
+minute i after midnight): one mask for opening hours and one busy mask per
+employee qualified for the requested service. A start time is available when
+the service duration fits into the free time of at least one employee.
+Live slot holds (app.services.slot_holds) count as bookings.
+"""
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, time
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.booking import Booking, BookingStatus
+from app.models.business import BusinessHours
+from app.models.employee import Employee, employee_services
+from app.models.service import Service
+from app.services.slot_holds import (
+    SlotHold,
+    active_holds,
+    active_holds_for_businesses,
+    parse_hold_id,
+)
+
+ACTIVE_BOOKING_STATUSES = [BookingStatus.PENDING, BookingStatus.CONFIRMED]
+MINUTES_PER_DAY = 24 * 60
+
+
+class SlotConflictError(Exception):
+    """Requested booking time is not free."""
+
+
+class EmployeeNotQualifiedError(Exception):
+    """Requested employee is inactive or does not provide the service."""
+
+
+class OutsideBusinessHoursError(Exception):
+    """Requested booking time is outside opening hours."""
+
+
+def to_minute(t: time) -> int:
+    """Minutes since midnight."""
+    return t.hour * 60 + t.minute
+
+
+def format_minute(minute: int) -> str:
+    """Format minutes since midnight as HH:MM."""
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+
+def interval_mask(start: int, end: int) -> int:
+    """Mask with minutes [start, end) set."""
+    if end <= start:
+        return 0
+    return ((1 << (end - start)) - 1) << start
+
+
+def fitting_starts(free: int, duration: int) -> int:
+    """Mask of minutes i such that minutes i .. i + duration - 1 are all free."""
+    mask = free
+    covered = 1
+    # Doubling: after each step bit i means `covered` free minutes from i
+    while covered < duration:
+        shift = min(covered, duration - covered)
+        mask &= mask >> shift
+        covered += shift
+    return mask
+
+
+class DayPlan:
+    """Opening hours and per-employee busy time of one business day."""
+
+    def __init__(self, open_minute: int, close_minute: int, resource_ids: list[int | None]):
+        self.open_minute = open_minute
+        self.close_minute = close_minute
+        self.open_mask = interval_mask(open_minute, close_minute)
+        # A business without qualified employees is a single resource keyed by None
+        self.busy: dict[int | None, int] = {rid: 0 for rid in resource_ids or [None]}
+
+    def reserve(self, start: int, duration: int, resource_id: int | None = None):
+        """Mark a booking as busy time."""
+        booked = interval_mask(start, start + duration)
+
+        if resource_id is not None and None not in self.busy:
+            # Employees not qualified for this service don't affect it
+            if resource_id in self.busy:
+                self.busy[resource_id] |= booked
+            return
+
+        # Unassigned booking: first resource free for the whole interval
+        target = next(
+            (rid for rid, busy in self.busy.items() if not busy & booked),
+            next(iter(self.busy)),
+        )
+        self.busy[target] |= booked
+
+    def start_mask(self, duration: int, resource_ids: list[int] | None = None) -> int:
+        """Mask of start minutes where the service fits for at least one resource."""
+        if None in self.busy:
+            # Single-resource business: every employee shares the same time
+            resource_ids = None
+
+        mask = 0
+        for rid in resource_ids if resource_ids is not None else self.busy:
+            busy = self.busy.get(rid)
+            if busy is None:
+                continue
+            mask |= fitting_starts(self.open_mask & ~busy, duration)
+        return mask
+
+    def is_free(self, start: int, duration: int, resource_ids: list[int] | None = None) -> bool:
+        """Whether the service fits at start for at least one resource."""
+        return bool(self.start_mask(duration, resource_ids) >> start & 1)
+
+    def slots(
+        self,
+        duration: int,
+        step: int,
+        not_before: int | None = None,
+        resource_ids: list[int] | None = None,
+    ) -> list[tuple[int, bool]]:
+        """Get (start minute, available) on a step grid, skipping starts before not_before."""
+        mask = self.start_mask(duration, resource_ids)
+        return [
+            (start, bool(mask >> start & 1))
+            for start in range(self.open_minute, self.close_minute - duration + 1, step)
+            if not_before is None or start > not_before
+        ]
+
+
+@dataclass
+class AvailabilityInputs:
+    """Everything needed to compute availability of one service over a date range."""
+
+    service: Service
+    hours: dict[int, BusinessHours]  # by day_of_week
+    employee_ids: list[int]  # active employees qualified for the service
+    # (start minute, duration, employee_id) of active bookings and holds by date
+    bookings: dict[date, list[tuple[int, int, int | None]]] = field(default_factory=dict)
+    hold_expires_at: float | None = None  # earliest hold expiry, results change then
+
+    def day_plan(self, day: date, ignore_hours: bool = False) -> DayPlan | None:
+        """Build the plan of one day, or None if the business is closed.
+
+        With ignore_hours the whole day counts as open, so only overlaps matter.
+        """
+        if ignore_hours:
+            plan = DayPlan(0, MINUTES_PER_DAY, self.employee_ids)
+        else:
+            hours = self.hours.get(day.weekday())
+            if not hours or hours.is_closed or not hours.open_time or not hours.close_time:
+                return None
+            plan = DayPlan(
+                to_minute(hours.open_time), to_minute(hours.close_time), self.employee_ids
+            )
+
+        for start, duration, employee_id in self.bookings.get(day, []):
+            plan.reserve(start, duration, employee_id)
+        return plan
+
+
+async def load_availability_inputs(
+    db: AsyncSession,
+    business_id: int,
+    service: Service,
+    start_date: date,
+    end_date: date,
+    exclude_hold_id: str | None = None,
+) -> AvailabilityInputs:
+    """Load hours, qualified employees, bookings and holds for a date range.
+
+    Three queries plus one Redis round trip. The hold exclude_hold_id is not
+    counted as busy.
+    """
+    hours_result = await db.execute(
+        select(BusinessHours).where(BusinessHours.business_id == business_id)
+    )
+    hours = {h.day_of_week: h for h in hours_result.scalars().all()}
+
+    employees_result = await db.execute(
+        select(employee_services.c.employee_id)
+        .join(Employee, Employee.id == employee_services.c.employee_id)
+        .where(
+            employee_services.c.service_id == service.id,
+            Employee.business_id == business_id,
+            Employee.is_active == True,
+        )
+        .order_by(employee_services.c.employee_id)
+    )
+    employee_ids = list(employees_result.scalars().all())
+
+    # Each booking occupies its own service's duration
+    bookings_result = await db.execute(
+        select(
+            Booking.booking_date,
+            Booking.booking_time,
+            Booking.employee_id,
+            Service.duration_minutes,
+        )
+        .join(Service, Service.id == Booking.service_id)
+        .where(
+            Booking.business_id == business_id,
+            Booking.booking_date.between(start_date, end_date),
+            Booking.status.in_(ACTIVE_BOOKING_STATUSES),
+        )
+        .order_by(Booking.booking_date, Booking.booking_time)
+    )
+    bookings = defaultdict(list)
+    for row in bookings_result.all():
+        bookings[row.booking_date].append(
+            (to_minute(row.booking_time), row.duration_minutes, row.employee_id)
+        )
+
+    holds, hold_expires_at = await active_holds(
+        business_id, start_date, end_date, exclude_hold_id
+    )
+    for day, day_holds in holds.items():
+        bookings[day].extend(day_holds)
+
+    return AvailabilityInputs(
+        service=service,
+        hours=hours,
+        employee_ids=employee_ids,
+        bookings=dict(bookings),
+        hold_expires_at=hold_expires_at,
+    )
+
+
+async def load_day_inputs_for_businesses(
+    db: AsyncSession, services: dict[int, Service], day: date
+) -> dict[int, AvailabilityInputs]:
+    """Load one day's inputs for many businesses, each for its own service.
+
+    Three queries plus one Redis round trip whatever the number of businesses.
+    """
+    business_ids = list(services)
+
+    hours_result = await db.execute(
+        select(BusinessHours).where(
+            BusinessHours.business_id.in_(business_ids),
+            BusinessHours.day_of_week == day.weekday(),
+        )
+    )
+    hours = {h.business_id: h for h in hours_result.scalars().all()}
+
+    employees_result = await db.execute(
+        select(Employee.business_id, employee_services.c.employee_id)
+        .join(Employee, Employee.id == employee_services.c.employee_id)
+        .where(
+            employee_services.c.service_id.in_([service.id for service in services.values()]),
+            Employee.business_id.in_(business_ids),
+            Employee.is_active == True,
+        )
+        .order_by(employee_services.c.employee_id)
+    )
+    employee_ids = defaultdict(list)
+    for business_id, employee_id in employees_result.all():
+        employee_ids[business_id].append(employee_id)
+
+    bookings_result = await db.execute(
+        select(
+            Booking.business_id,
+            Booking.booking_time,
+            Booking.employee_id,
+            Service.duration_minutes,
+        )
+        .join(Service, Service.id == Booking.service_id)
+        .where(
+            Booking.business_id.in_(business_ids),
+            Booking.booking_date == day,
+            Booking.status.in_(ACTIVE_BOOKING_STATUSES),
+        )
+        .order_by(Booking.booking_time)
+    )
+    bookings = defaultdict(list)
+    for row in bookings_result.all():
+        bookings[row.business_id].append(
+            (to_minute(row.booking_time), row.duration_minutes, row.employee_id)
+        )
+
+    holds = await active_holds_for_businesses(business_ids, day)
+    for business_id, business_holds in holds.items():
+        bookings[business_id].extend(business_holds)
+
+    return {
+        business_id: AvailabilityInputs(
+            service=service,
+            hours={day.weekday(): hours[business_id]} if business_id in hours else {},
+            employee_ids=employee_ids.get(business_id, []),
+            bookings={day: bookings.get(business_id, [])},
+        )
+        for business_id, service in services.items()
+    }
+
+
+async def reserve_slot(
+    db: AsyncSession,
+    business_id: int,
+    service: Service,
+    booking_date: date,
+    booking_time: time,
+    employee_id: int | None = None,
+    ignore_hours: bool = False,
+    hold_id: str | None = None,
+) -> str | None:
+    """
+    Lock the business day and check that a booking fits.
+
+    Takes a transaction-scoped advisory lock on (business, date), so concurrent
+    bookings of the same day are checked one after another while other days and
+    businesses proceed in parallel. The lock is released on commit or rollback,
+    so insert the booking (or place the hold) in the same transaction.
+
+    A hold given by hold_id is ignored by the check if it holds exactly this
+    slot (business, day, start, service duration and employee), so the client's
+    own hold does not block it. The matching hold id is returned; consume it
+    (app.services.slot_holds.consume_hold) once the booking row is flushed.
+    Returns None if there is no matching hold.
+
+    Raises EmployeeNotQualifiedError if employee_id is not one of the service's
+    active employees (any employee fits a service no employee is linked to),
+    OutsideBusinessHoursError if the booking does not fit the opening hours and
+    SlotConflictError if it overlaps other bookings or holds.
+    """
+    await db.execute(
+        select(func.pg_advisory_xact_lock(business_id, booking_date.toordinal()))
+    )
+
+    start = to_minute(booking_time)
+    hold = parse_hold_id(hold_id) if hold_id else None
+    if hold != SlotHold(business_id, booking_date, start, service.duration_minutes, employee_id):
+        hold_id = None
+
+    inputs = await load_availability_inputs(
+        db, business_id, service, booking_date, booking_date, exclude_hold_id=hold_id
+    )
+    if employee_id and inputs.employee_ids and employee_id not in inputs.employee_ids:
+        raise EmployeeNotQualifiedError()
+
+    plan = inputs.day_plan(booking_date, ignore_hours=ignore_hours)
+    end = start + service.duration_minutes
+    if plan is None or start < plan.open_minute or end > plan.close_minute:
+        raise OutsideBusinessHoursError()
+
+    resource_ids = [employee_id] if employee_id else None
+    if not plan.is_free(start, service.duration_minutes, resource_ids):
+        raise SlotConflictError()
+    return hold_id
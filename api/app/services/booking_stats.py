@@ -0,0 +1,150 @@
+"""Maintenance of the booking_daily_stats rollups.
+
+Booking writes add or move their count in the same transaction, so analytics
+read totals that match the committed bookings without scanning them. A
+periodic reconcile recounts recent booking dates from bookings to repair
+anything written outside the API.
+"""
+import asyncio
+from datetime import date, timedelta
+from typing import NamedTuple
+
+from loguru import logger
+from sqlalchemy import delete, exists, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.models.booking import Booking, BookingStatus
+from app.models.booking_stats import BookingDailyStats
+
+
+RECONCILE_LOCK_ID = 7_340_019
+
+
+class StatsKey(NamedTuple):
+    """Rollup row a booking is counted in."""
+
+    business_id: int
+    day: date
+    status: BookingStatus
+    employee_id: int
+    service_id: int
+    came_through_app: bool
+
+
+def booking_stats_key(booking: Booking) -> StatsKey:
+    """Rollup row of a booking as it is now; take it before changing the booking."""
+    return StatsKey(
+        business_id=booking.business_id,
+        day=booking.booking_date,
+        status=booking.status,
+        employee_id=booking.employee_id or 0,
+        service_id=booking.service_id,
+        came_through_app=booking.came_through_app,
+    )
+
+
+async def _add(db: AsyncSession, key: StatsKey, delta: int):
+    stmt = insert(BookingDailyStats).values(**key._asdict(), bookings=delta)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=list(StatsKey._fields),
+            set_={"bookings": BookingDailyStats.bookings + stmt.excluded.bookings},
+        )
+    )
+
+
+async def record_booking(db: AsyncSession, booking: Booking, previous: StatsKey | None = None):
+    """
+    Count a new or changed booking, in the caller's transaction.
+
+    For a changed booking pass the key taken before the change as previous;
+    its count moves to the booking's current row. Call before commit.
+    """
+    await db.flush()
+    current = booking_stats_key(booking)
+    if current == previous:
+        return
+    if previous is not None:
+        await _add(db, previous, -1)
+    await _add(db, current, 1)
+
+
+async def reconcile_booking_stats():
+    """
+    Correct the rollups of booking dates within settings.booking_stats_reconcile_days
+    of today.
+
+    Runs on one worker at a time and without a table lock: recounted rows are
+    written only where they differ, in a REPEATABLE READ transaction, so a row
+    that a booking write changes while the recount runs makes the run fail (it
+    is retried next time) instead of being overwritten with an older count.
+    """
+    today = date.today()
+    window = timedelta(days=settings.booking_stats_reconcile_days)
+    start_date, end_date = today - window, today + window
+    employee_id = func.coalesce(Booking.employee_id, 0)
+
+    async with async_session_maker() as session:
+        await session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        locked = (
+            await session.execute(select(func.pg_try_advisory_xact_lock(RECONCILE_LOCK_ID)))
+        ).scalar()
+        if not locked:
+            return
+
+        key_columns = (
+            Booking.business_id,
+            Booking.booking_date,
+            Booking.status,
+            employee_id,
+            Booking.service_id,
+            Booking.came_through_app,
+        )
+        stmt = insert(BookingDailyStats).from_select(
+            [*StatsKey._fields, "bookings"],
+            select(*key_columns, func.count())
+            .where(Booking.booking_date.between(start_date, end_date))
+            .group_by(*key_columns),
+        )
+        corrected = await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=list(StatsKey._fields),
+                set_={"bookings": stmt.excluded.bookings},
+                where=BookingDailyStats.bookings != stmt.excluded.bookings,
+            )
+        )
+
+        # Rows whose bookings are gone (or were never counted down to zero)
+        removed = await session.execute(
+            delete(BookingDailyStats).where(
+                BookingDailyStats.day.between(start_date, end_date),
+                ~exists().where(
+                    Booking.business_id == BookingDailyStats.business_id,
+                    Booking.booking_date == BookingDailyStats.day,
+                    Booking.status == BookingDailyStats.status,
+                    employee_id == BookingDailyStats.employee_id,
+                    Booking.service_id == BookingDailyStats.service_id,
+                    Booking.came_through_app == BookingDailyStats.came_through_app,
+                ),
+            )
+        )
+        await session.commit()
+
+    if corrected.rowcount or removed.rowcount:
+        logger.info(
+            f"Booking stats reconciled ({corrected.rowcount} rows corrected, "
+            f"{removed.rowcount} removed)"
+        )
+
+
+async def reconcile_booking_stats_periodically():
+    """Reconcile rollups on an interval."""
+    while True:
+        await asyncio.sleep(settings.booking_stats_reconcile_seconds)
+        try:
+            await reconcile_booking_stats()
+        except Exception as e:
+            logger.error(f"Failed to reconcile booking stats: {e}")
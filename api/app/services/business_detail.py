@@ -0,0 +1,212 @@
+"""Business detail page as a cached, pre-serialized JSON document.
+
+The document (business, active services, current promotions, photos, active
+employees, working hours, weekly occupancy profile) is built by one SQL
+statement in which Postgres aggregates every child collection to JSON, and is
+stored in Redis under a key embedding the business and occupancy versions.
+Live status changes far more often than the rest and is spliced in when
+serving, so it never invalidates the document.
+"""
+import json
+import math
+
+from sqlalchemy import JSON, extract, func, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import Counter
+from app.core.redis import redis_client
+from app.models.business import Business, BusinessHours
+from app.models.business_occupancy import BusinessOccupancy
+from app.models.business_photo import BusinessPhoto
+from app.models.employee import Employee, employee_services
+from app.models.promotion import Promotion
+from app.models.service import Service
+from app.services.business_version import business_version_key
+from app.services.live_status import get_status
+from app.services.occupancy import occupancy_version_key, unpack_profile
+
+business_detail_requests = Counter(
+    "business_detail_cache_requests_total", "Business detail cache lookups by result (hit, miss)"
+)
+
+
+def json_list(query, order_by):
+    """Scalar subquery aggregating the rows of query into a JSON array."""
+    rows = query.subquery()
+    return (
+        select(
+            func.coalesce(
+                func.json_agg(aggregate_order_by(rows.table_valued(), rows.c[order_by])),
+                literal_column("'[]'::json"),
+                type_=JSON,
+            )
+        )
+        .scalar_subquery()
+    )
+
+
+def _detail_query(business_id: int):
+    """One statement returning the business row with all child collections as JSON."""
+    services = json_list(
+        select(
+            Service.id,
+            Service.name,
+            Service.description,
+            Service.price_from,
+            Service.price_to,
+            Service.duration_minutes,
+            Service.photo_url,
+        )
+        .where(Service.business_id == Business.id, Service.is_active == True)
+        .correlate(Business),
+        "id",
+    )
+    current_promotions = (
+        Promotion.business_id == Business.id,
+        Promotion.is_active == True,
+        Promotion.valid_until >= func.now(),
+    )
+    promotions = json_list(
+        select(
+            Promotion.id,
+            Promotion.title,
+            Promotion.description,
+            Promotion.discount_percent,
+            Promotion.valid_from,
+            Promotion.valid_until,
+        )
+        .where(*current_promotions)
+        .correlate(Business),
+        "valid_until",
+    )
+    photos = json_list(
+        select(
+            BusinessPhoto.id,
+            BusinessPhoto.photo_url,
+            BusinessPhoto.is_main,
+            BusinessPhoto.display_order,
+        )
+        .where(BusinessPhoto.business_id == Business.id)
+        .correlate(Business),
+        "display_order",
+    )
+    service_ids = (
+        select(
+            func.coalesce(
+                func.array_agg(employee_services.c.service_id), literal_column("'{}'::int[]")
+            )
+        )
+        .where(employee_services.c.employee_id == Employee.id)
+        .scalar_subquery()
+    )
+    employees = json_list(
+        select(Employee.id, Employee.name, Employee.photo_url, service_ids.label("service_ids"))
+        .where(Employee.business_id == Business.id, Employee.is_active == True)
+        .correlate(Business),
+        "id",
+    )
+    hours = json_list(
+        select(
+            BusinessHours.day_of_week,
+            BusinessHours.open_time,
+            BusinessHours.close_time,
+            BusinessHours.is_closed,
+        )
+        .where(BusinessHours.business_id == Business.id)
+        .correlate(Business),
+        "day_of_week",
+    )
+    occupancy = (
+        select(BusinessOccupancy.profile)
+        .where(BusinessOccupancy.business_id == Business.id)
+        .correlate(Business)
+        .scalar_subquery()
+    )
+    # The document must not outlive the first promotion that ends; measured
+    # with the database clock, like the valid_until filter itself
+    promotions_seconds_left = (
+        select(extract("epoch", func.min(Promotion.valid_until) - func.localtimestamp()))
+        .where(*current_promotions)
+        .correlate(Business)
+        .scalar_subquery()
+    )
+
+    return select(
+        Business.id,
+        Business.name,
+        Business.type,
+        Business.address,
+        Business.lat,
+        Business.lon,
+        Business.phones,
+        Business.email,
+        Business.description,
+        Business.logo_url,
+        services.label("services"),
+        promotions.label("promotions"),
+        photos.label("photos"),
+        employees.label("employees"),
+        hours.label("business_hours"),
+        occupancy.label("occupancy"),
+        promotions_seconds_left.label("promotions_seconds_left"),
+    ).where(Business.id == business_id)
+
+
+async def _build_document(db: AsyncSession, business_id: int) -> tuple[str, int] | None:
+    """Build the document JSON (without status) and how long it stays valid."""
+    row = (await db.execute(_detail_query(business_id))).one_or_none()
+    if row is None:
+        return None
+
+    document = {
+        "id": row.id,
+        "name": row.name,
+        "type": row.type.value,
+        "address": row.address,
+        "lat": row.lat,
+        "lon": row.lon,
+        "phone": row.phones[0] if row.phones else "",
+        "email": row.email,
+        "description": row.description,
+        "logo_url": row.logo_url,
+        "services": row.services,
+        "promotions": row.promotions,
+        "photos": row.photos,
+        "employees": row.employees,
+        "business_hours": row.business_hours,
+        # 7 x 24 values 0-100, Monday first; None until the first refresh
+        "occupancy": unpack_profile(row.occupancy) if row.occupancy else None,
+    }
+
+    ttl = settings.business_detail_cache_ttl_seconds
+    if row.promotions_seconds_left is not None:
+        ttl = min(ttl, max(math.ceil(row.promotions_seconds_left), 1))
+    return json.dumps(document, separators=(",", ":")), ttl
+
+
+async def get_business_detail_json(db: AsyncSession, business_id: int) -> bytes | None:
+    """
+    Get the detail page of a business as JSON bytes, or None if not found.
+
+    Cache hits cost one read of both versions, a document read and the status lookup;
+    nothing is parsed or re-serialized.
+    """
+    version, occupancy_version = await redis_client.mget(
+        [business_version_key(business_id), occupancy_version_key(business_id)]
+    )
+    key = f"business_detail:{business_id}:v{version or 0}.{occupancy_version or 0}"
+
+    document = await redis_client.get(key)
+    business_detail_requests.inc(result="hit" if document else "miss")
+
+    if document is None:
+        built = await _build_document(db, business_id)
+        if built is None:
+            return None
+        document, ttl = built
+        await redis_client.set(key, document, expire=ttl)
+
+    status_json = json.dumps(await get_status(db, business_id), separators=(",", ":"))
+    return f'{document[:-1]},"status":{status_json}}}'.encode()
@@ -0,0 +1,181 @@
+"""Maintenance of the business_summary read model.
+
+Every write that changes what a list card shows (profile, services, photos,
+working hours, favorites) updates the business's summary row in the same
+transaction, so lists never read a card older than the committed data. Each
+such write bumps the row's version.
+
+A periodic reconcile, run by one worker at a time, repairs anything written
+outside the API (seed scripts, manual SQL). It reads each row's version along
+with the source tables and only rewrites a row that differs and still has that
+version, so a slow reconcile never replaces a card written after its snapshot.
+"""
+import asyncio
+from datetime import datetime
+
+from loguru import logger
+from sqlalchemy import Text, cast, func, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.models.business import Business, BusinessHours
+from app.models.business_photo import BusinessPhoto
+from app.models.business_summary import BusinessSummary
+from app.models.favorite import Favorite
+from app.models.service import Service
+from app.services.business_detail import json_list
+
+# Columns copied from businesses as they are
+BUSINESS_COLUMNS = (
+    "id",
+    "name",
+    "type",
+    "address",
+    "lat",
+    "lon",
+    "phones",
+    "email",
+    "description",
+    "logo_url",
+    "dgis_id",
+    "subscription_status",
+    "subscription_end_date",
+    "created_at",
+    "updated_at",
+)
+
+# Derived card fields, computed by _summary_select
+DERIVED_COLUMNS = ("main_photo_url", "min_price", "hours", "favorite_count")
+
+# JSON has no equality operator, these are compared as text
+JSON_COLUMNS = ("phones", "hours")
+
+RECONCILE_LOCK_ID = 7_340_018
+
+
+def _summary_select():
+    """Summary rows of all businesses, computed from the source tables."""
+    main_photo_url = (
+        select(BusinessPhoto.photo_url)
+        .where(BusinessPhoto.business_id == Business.id)
+        .order_by(BusinessPhoto.is_main.desc(), BusinessPhoto.display_order, BusinessPhoto.id)
+        .limit(1)
+        .correlate(Business)
+        .scalar_subquery()
+    )
+    min_price = (
+        select(func.min(Service.price_from))
+        .where(Service.business_id == Business.id, Service.is_active == True)
+        .correlate(Business)
+        .scalar_subquery()
+    )
+    hours = json_list(
+        select(
+            BusinessHours.day_of_week,
+            func.to_char(BusinessHours.open_time, "HH24:MI").label("open_time"),
+            func.to_char(BusinessHours.close_time, "HH24:MI").label("close_time"),
+            BusinessHours.is_closed,
+        )
+        .where(BusinessHours.business_id == Business.id)
+        .correlate(Business),
+        "day_of_week",
+    )
+    favorite_count = (
+        select(func.count(Favorite.id))
+        .where(Favorite.business_id == Business.id)
+        .correlate(Business)
+        .scalar_subquery()
+    )
+
+    return select(
+        *(getattr(Business, column) for column in BUSINESS_COLUMNS),
+        main_photo_url.label("main_photo_url"),
+        min_price.label("min_price"),
+        hours.label("hours"),
+        favorite_count.label("favorite_count"),
+        literal(datetime.utcnow()).label("refreshed_at"),
+        # Version of the row this snapshot replaces, 0 if there is none yet
+        func.coalesce(
+            select(BusinessSummary.version)
+            .where(BusinessSummary.id == Business.id)
+            .correlate(Business)
+            .scalar_subquery(),
+            0,
+        ).label("version"),
+    )
+
+
+def _comparable(column):
+    return cast(column, Text) if column.key in JSON_COLUMNS else column
+
+
+def _upsert(rows, reconcile: bool = False):
+    """
+    INSERT ... SELECT of summary rows, bumping the version of replaced rows.
+
+    With reconcile an existing row is only replaced if its contents differ and
+    its version is still the one read with the rows, i.e. no write came between.
+    """
+    columns = [*BUSINESS_COLUMNS, *DERIVED_COLUMNS, "refreshed_at", "version"]
+    stmt = insert(BusinessSummary).from_select(columns, rows)
+    set_ = {column: stmt.excluded[column] for column in columns if column != "id"}
+    set_["version"] = BusinessSummary.version + 1
+    if not reconcile:
+        return stmt.on_conflict_do_update(index_elements=[BusinessSummary.id], set_=set_)
+
+    compared = [*BUSINESS_COLUMNS[1:], *DERIVED_COLUMNS]
+    current = tuple_(*(_comparable(BusinessSummary.__table__.c[c]) for c in compared))
+    incoming = tuple_(*(_comparable(stmt.excluded[c]) for c in compared))
+    return stmt.on_conflict_do_update(
+        index_elements=[BusinessSummary.id],
+        set_=set_,
+        where=(BusinessSummary.version == stmt.excluded.version)
+        & current.is_distinct_from(incoming),
+    )
+
+
+async def refresh_business_summary(db: AsyncSession, business_id: int):
+    """
+    Recompute the summary row of a business.
+
+    Runs in the caller's transaction: call it after the change is flushed and
+    before commit, so the card and the data it shows commit together.
+    """
+    await db.flush()
+    await db.execute(_upsert(_summary_select().where(Business.id == business_id)))
+
+
+async def adjust_favorite_count(db: AsyncSession, business_id: int, delta: int):
+    """Add delta to the favorite count of a business, in the caller's transaction."""
+    await db.execute(
+        update(BusinessSummary)
+        .where(BusinessSummary.id == business_id)
+        .values(
+            favorite_count=BusinessSummary.favorite_count + delta,
+            version=BusinessSummary.version + 1,
+        )
+    )
+
+
+async def reconcile_business_summaries():
+    """Rewrite the summary rows that differ from the source tables, on one worker."""
+    async with async_session_maker() as session:
+        locked = await session.scalar(select(func.pg_try_advisory_xact_lock(RECONCILE_LOCK_ID)))
+        if not locked:
+            return
+        result = await session.execute(_upsert(_summary_select(), reconcile=True))
+        await session.commit()
+    if result.rowcount:
+        logger.info(f"Business summaries reconciled ({result.rowcount} rows rewritten)")
+
+
+async def reconcile_business_summaries_periodically():
+    """Reconcile summaries on an interval."""
+    while True:
+        await asyncio.sleep(settings.business_summary_reconcile_seconds)
+        try:
+            await reconcile_business_summaries()
+        except Exception as e:
+            logger.error(f"Failed to reconcile business summaries: {e}")
@@ -0,0 +1,29 @@
+"""Per-business version counter in Redis.
+
+Every admin write to a business (profile, hours, services, employees,
+promotions, photos) bumps it. Caches derived from business data embed the
+version in their keys, so one increment makes all of them unreachable and
+stale entries simply expire.
+"""
+from app.core.metrics import Counter
+from app.core.redis import redis_client
+
+business_version_bumps = Counter(
+    "business_version_bumps_total", "Business version bumps after admin writes"
+)
+
+
+def business_version_key(business_id: int) -> str:
+    return f"business_version:{business_id}"
+
+
+async def get_business_version(business_id: int) -> int:
+    """Current version of a business (0 if never changed)."""
+    version = await redis_client.get(business_version_key(business_id))
+    return int(version or 0)
+
+
+async def bump_business_version(business_id: int):
+    """Invalidate everything cached for a business after an admin write."""
+    await redis_client.incr(business_version_key(business_id))
+    business_version_bumps.inc()
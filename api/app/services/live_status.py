@@ -0,0 +1,82 @@
+"""Live business status snapshot in Redis.
+
+All statuses live in one hash (business id -> compact JSON), so a page of
+businesses is read with a single HMGET. Postgres ``business_status`` stays the
+durable source: misses are loaded from it and written back to the hash.
+"""
+import json
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.redis import redis_client
+from app.models.business import BusinessStatus
+
+LIVE_STATUS_KEY = "live_status"
+
+DEFAULT_STATUS = {
+    "status": "available",
+    "estimated_wait_minutes": 0,
+    "updated_at": None,
+}
+
+
+def status_payload(business_status: BusinessStatus | None) -> dict:
+    """Convert a status row to the API payload."""
+    if business_status is None:
+        return dict(DEFAULT_STATUS)
+
+    return {
+        "status": business_status.status.value,
+        "estimated_wait_minutes": business_status.estimated_wait_minutes,
+        "updated_at": (
+            business_status.updated_at.isoformat() if business_status.updated_at else None
+        ),
+    }
+
+
+async def write_status(business_status: BusinessStatus):
+    """Write a committed status row through to the live store."""
+    await redis_client.hset(
+        LIVE_STATUS_KEY,
+        {str(business_status.business_id): json.dumps(status_payload(business_status))},
+    )
+
+
+async def get_statuses(db: AsyncSession, business_ids: list[int]) -> dict[int, dict]:
+    """Get status payloads for businesses, falling back to Postgres on misses."""
+    if not business_ids:
+        return {}
+
+    cached = await redis_client.hmget(LIVE_STATUS_KEY, [str(i) for i in business_ids])
+
+    statuses = {}
+    missing = []
+    for business_id, value in zip(business_ids, cached):
+        if value is None:
+            missing.append(business_id)
+        else:
+            statuses[business_id] = json.loads(value)
+
+    if missing:
+        result = await db.execute(
+            select(BusinessStatus).where(BusinessStatus.business_id.in_(missing))
+        )
+        rows = {s.business_id: s for s in result.scalars().all()}
+
+        # Businesses without a row are cached as the default to avoid repeated misses.
+        # HSETNX so a backfill never overwrites a newer write-through.
+        loaded = {business_id: status_payload(rows.get(business_id)) for business_id in missing}
+        await redis_client.hsetnx(
+            LIVE_STATUS_KEY,
+            {str(business_id): json.dumps(payload) for business_id, payload in loaded.items()},
+        )
+        statuses.update(loaded)
+
+    return statuses
+
+
+async def get_status(db: AsyncSession, business_id: int) -> dict:
+    """Get status payload for one business."""
+    statuses = await get_statuses(db, [business_id])
+    return statuses[business_id]
@@ -0,0 +1,235 @@
+"""Weekly "usually busy at" profiles.
+
+A profile has one cell per (weekday, hour) of local time. Two signals feed it:
+the share of the hour the business spent busy (from the status rollups, see
+app.services.status_history) and completed bookings starting in that hour,
+relative to the business's busiest cell. A cell is the mean of the signals
+the business has, from 0 to 100.
+
+Each run walks businesses in id order, one batch per transaction, adding the
+days completed since a profile's last day to decayed running sums stored per
+business, so no run reads more than the new days. The packed profile is served
+inside the cached business detail document; a changed profile bumps its own
+version (occupancy_version_key), which only that document's cache key embeds,
+so slot caches and ETags keyed by the business version are left alone.
+"""
+import asyncio
+from datetime import date, datetime, time, timedelta
+
+from loguru import logger
+from sqlalchemy import Integer, cast, extract, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.core.redis import redis_client
+from app.models.booking import Booking, BookingStatus
+from app.models.business import Business
+from app.models.business_occupancy import OCCUPANCY_CELLS, BusinessOccupancy
+from app.models.status_stats import StatusHourlyStats
+
+REFRESH_LOCK_ID = 7_340_024
+
+
+def pack_profile(busy: list[float], observed: list[float], bookings: list[float]) -> bytes:
+    """Combine the sums into one byte (0-100) per cell."""
+    peak = max(bookings)
+    cells = []
+    for busy_seconds, observed_seconds, count in zip(busy, observed, bookings):
+        signals = []
+        if observed_seconds > 0:
+            signals.append(busy_seconds / observed_seconds)
+        if peak > 0:
+            signals.append(count / peak)
+        cells.append(round(100 * sum(signals) / len(signals)) if signals else 0)
+    return bytes(cells)
+
+
+def unpack_profile(profile: bytes) -> list[list[int]]:
+    """Packed profile as 7 rows (Monday first) of 24 hourly values."""
+    return [list(profile[day * 24:(day + 1) * 24]) for day in range(7)]
+
+
+def _cell(weekday, hour):
+    """Cell index of a SQL isodow/hour pair."""
+    return (cast(weekday, Integer) - 1) * 24 + cast(hour, Integer)
+
+
+async def _status_sums(
+    db: AsyncSession,
+    business_ids: list[int],
+    start_day: date,
+    end_day: date,
+    utc_offset: timedelta,
+) -> dict[int, dict[int, tuple[float, float]]]:
+    """(busy, observed) seconds by business and cell over local days [start_day, end_day]."""
+    start = datetime.combine(start_day, time.min) - utc_offset
+    end = datetime.combine(end_day + timedelta(days=1), time.min) - utc_offset
+    local_hour = StatusHourlyStats.hour + utc_offset
+    cell = _cell(extract("isodow", local_hour), extract("hour", local_hour))
+    result = await db.execute(
+        select(
+            StatusHourlyStats.business_id,
+            cell,
+            func.sum(StatusHourlyStats.busy_seconds),
+            func.sum(StatusHourlyStats.busy_seconds + StatusHourlyStats.available_seconds),
+        )
+        .where(
+            StatusHourlyStats.business_id.in_(business_ids),
+            StatusHourlyStats.hour >= start,
+            StatusHourlyStats.hour < end,
+        )
+        .group_by(StatusHourlyStats.business_id, cell)
+    )
+    sums: dict[int, dict[int, tuple[float, float]]] = {}
+    for business_id, index, busy, observed in result.all():
+        sums.setdefault(business_id, {})[index] = (busy, observed)
+    return sums
+
+
+async def _booking_sums(
+    db: AsyncSession, business_ids: list[int], start_day: date, end_day: date
+) -> dict[int, dict[int, int]]:
+    """Completed bookings by business and cell over [start_day, end_day]."""
+    cell = _cell(extract("isodow", Booking.booking_date), extract("hour", Booking.booking_time))
+    result = await db.execute(
+        select(Booking.business_id, cell, func.count())
+        .where(
+            Booking.business_id.in_(business_ids),
+            Booking.booking_date.between(start_day, end_day),
+            Booking.status == BookingStatus.COMPLETED,
+        )
+        .group_by(Booking.business_id, cell)
+    )
+    sums: dict[int, dict[int, int]] = {}
+    for business_id, index, count in result.all():
+        sums.setdefault(business_id, {})[index] = count
+    return sums
+
+
+def occupancy_version_key(business_id: int) -> str:
+    return f"occupancy_version:{business_id}"
+
+
+async def _refresh_batch(
+    session: AsyncSession, business_ids: list[int], end_day: date, new_through_day: date
+) -> list[int]:
+    """Bring the profiles of business_ids up to end_day; returns those that changed."""
+    profiles = {
+        row.business_id: row
+        for row in (
+            await session.execute(
+                select(BusinessOccupancy).where(BusinessOccupancy.business_id.in_(business_ids))
+            )
+        ).scalars().all()
+    }
+
+    # Each profile continues from its own last day, so a run cut short resumes
+    # where it stopped; businesses without one start from the newest profile
+    by_through_day: dict[date, list[int]] = {}
+    for business_id in business_ids:
+        row = profiles.get(business_id)
+        through_day = row.through_day if row is not None else new_through_day
+        if through_day < end_day:
+            by_through_day.setdefault(through_day, []).append(business_id)
+
+    # Business hours are server-local, like booking dates and times
+    utc_offset = datetime.now().astimezone().utcoffset()
+    changed = []
+    for through_day, ids in by_through_day.items():
+        start_day = through_day + timedelta(days=1)
+        status_sums = await _status_sums(session, ids, start_day, end_day, utc_offset)
+        booking_sums = await _booking_sums(session, ids, start_day, end_day)
+        decay = 0.5 ** ((end_day - through_day).days / settings.occupancy_half_life_days)
+
+        for business_id in ids:
+            row = profiles.get(business_id)
+            if row is None:
+                if business_id not in status_sums and business_id not in booking_sums:
+                    continue
+                row = BusinessOccupancy(
+                    business_id=business_id,
+                    busy_seconds=[0.0] * OCCUPANCY_CELLS,
+                    observed_seconds=[0.0] * OCCUPANCY_CELLS,
+                    completed_bookings=[0.0] * OCCUPANCY_CELLS,
+                )
+                session.add(row)
+
+            new_status = status_sums.get(business_id, {})
+            new_bookings = booking_sums.get(business_id, {})
+            busy, observed, bookings = [], [], []
+            for index in range(OCCUPANCY_CELLS):
+                new_busy, new_observed = new_status.get(index, (0.0, 0.0))
+                busy.append(row.busy_seconds[index] * decay + new_busy)
+                observed.append(row.observed_seconds[index] * decay + new_observed)
+                bookings.append(row.completed_bookings[index] * decay + new_bookings.get(index, 0))
+
+            row.busy_seconds = busy
+            row.observed_seconds = observed
+            row.completed_bookings = bookings
+            profile = pack_profile(busy, observed, bookings)
+            if profile != row.profile:
+                changed.append(business_id)
+            row.profile = profile
+            row.through_day = end_day
+            row.refreshed_at = datetime.utcnow()
+    return changed
+
+
+async def refresh_occupancy_profiles():
+    """Add the days completed since the last run to every profile, batch by batch."""
+    end_day = date.today() - timedelta(days=1)
+    async with async_session_maker() as session:
+        oldest, newest = (
+            await session.execute(
+                select(
+                    func.min(BusinessOccupancy.through_day),
+                    func.max(BusinessOccupancy.through_day),
+                )
+            )
+        ).one()
+    if oldest is not None and oldest >= end_day:
+        return
+    new_through_day = newest or end_day - timedelta(days=settings.occupancy_initial_days)
+
+    changed = 0
+    last_id = 0
+    while True:
+        async with async_session_maker() as session:
+            # Taken per batch: a worker finding it held stops, and every batch
+            # re-reads its profiles under the lock, so none is counted twice
+            locked = (
+                await session.execute(select(func.pg_try_advisory_xact_lock(REFRESH_LOCK_ID)))
+            ).scalar()
+            if not locked:
+                return
+
+            business_ids = (
+                await session.execute(
+                    select(Business.id)
+                    .where(Business.id > last_id)
+                    .order_by(Business.id)
+                    .limit(settings.occupancy_batch_size)
+                )
+            ).scalars().all()
+            if not business_ids:
+                break
+            batch_changed = await _refresh_batch(session, business_ids, end_day, new_through_day)
+            await session.commit()
+
+        last_id = business_ids[-1]
+        for business_id in batch_changed:
+            await redis_client.incr(occupancy_version_key(business_id))
+        changed += len(batch_changed)
+
+    logger.info(f"Occupancy profiles refreshed through {end_day} ({changed} changed)")
+
+
+async def refresh_occupancy_profiles_periodically():
+    """Refresh profiles on an interval."""
+    while True:
+        await asyncio.sleep(settings.occupancy_refresh_seconds)
+        try:
+            await refresh_occupancy_profiles()
+        except Exception as e:
+            logger.error(f"Failed to refresh occupancy profiles: {e}")
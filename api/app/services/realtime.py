@@ -0,0 +1,128 @@
+"""Redis pub/sub fan-out to WebSocket subscribers.
+
+Every worker holds one Redis subscription per channel and routes incoming
+messages to the local sockets subscribed to the message's ``business_id``.
+Publishing goes through Redis, so subscribers on any worker or node receive it.
+"""
+import asyncio
+import json
+
+from loguru import logger
+
+from app.core.config import settings
+from app.core.redis import redis_client
+from app.models.booking import Booking
+
+STATUS_CHANNEL = "status_updates"
+BOOKING_CHANNEL = "booking_events"
+
+
+class SubscriberQueue(asyncio.Queue):
+    """Bounded outgoing message queue of one socket."""
+
+    def __init__(self):
+        super().__init__(maxsize=settings.realtime_queue_size)
+        self.overflowed = False
+
+    def offer(self, message: dict):
+        """Queue a message without waiting; a full queue marks the socket overflowed."""
+        try:
+            self.put_nowait(message)
+        except asyncio.QueueFull:
+            # Slow consumer: the socket handler notices and closes it
+            self.overflowed = True
+
+
+class Fanout:
+    """Routes messages of one Redis channel to local subscriber queues."""
+
+    def __init__(self, channel: str):
+        self.channel = channel
+        self._subscribers: dict[int, set[SubscriberQueue]] = {}
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self, queue: SubscriberQueue, business_ids: set[int]):
+        """Start routing messages for business ids to queue."""
+        for business_id in business_ids:
+            self._subscribers.setdefault(business_id, set()).add(queue)
+
+    def unsubscribe(self, queue: SubscriberQueue, business_ids: set[int]):
+        """Stop routing messages for business ids to queue."""
+        for business_id in business_ids:
+            queues = self._subscribers.get(business_id)
+            if queues is None:
+                continue
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[business_id]
+
+    @property
+    def subscriber_count(self) -> int:
+        return len({queue for queues in self._subscribers.values() for queue in queues})
+
+    async def publish(self, message: dict):
+        """Publish message to subscribers on all workers."""
+        await redis_client.publish(self.channel, json.dumps(message, default=str))
+
+    def dispatch(self, message: dict):
+        """Deliver a message to local subscribers of its business."""
+        for queue in self._subscribers.get(message.get("business_id"), ()):
+            queue.offer(message)
+
+    async def _listen(self):
+        while True:
+            try:
+                pubsub = redis_client.redis.pubsub()
+                await pubsub.subscribe(self.channel)
+                async for raw in pubsub.listen():
+                    if raw["type"] != "message":
+                        continue
+                    self.dispatch(json.loads(raw["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Pub/sub listener for {self.channel} failed: {e}")
+                await asyncio.sleep(1)
+
+    def start(self):
+        """Start the Redis listener (call once per worker)."""
+        if self._task is None and redis_client.redis:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        """Stop the Redis listener."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+status_fanout = Fanout(STATUS_CHANNEL)
+booking_fanout = Fanout(BOOKING_CHANNEL)
+
+
+async def publish_status(business_id: int, payload: dict):
+    """Broadcast a status change to subscribed sockets."""
+    await status_fanout.publish({"type": "status", "business_id": business_id, "status": payload})
+
+
+async def publish_booking_event(event: str, booking: Booking):
+    """Notify the business's admin sockets about a booking (created, cancelled, updated)."""
+    await booking_fanout.publish({
+        "type": f"booking.{event}",
+        "business_id": booking.business_id,
+        "booking": {
+            "id": booking.id,
+            "service_id": booking.service_id,
+            "employee_id": booking.employee_id,
+            "booking_date": booking.booking_date.isoformat(),
+            "booking_time": booking.booking_time.strftime("%H:%M"),
+            "client_name": booking.client_name,
+            "client_phone": booking.client_phone,
+            "status": booking.status.value,
+            "came_through_app": booking.came_through_app,
+        },
+    })
@@ -0,0 +1,58 @@
+"""Business search: Russian full-text plus trigram word similarity.
+
+Text is normalized by the ``search_normalize`` SQL function (lowercase, ё -> е)
+on both sides. A business matches when its name or description matches the
+query with Russian stemming, when its name is close to the query word by word
+(typos, unfinished words), or when one of its active services matches the
+same way. Each condition is served by its own GIN index, and the business
+and service branches are combined with UNION rather than OR, so neither
+falls back to a scan.
+"""
+from sqlalchemy import func, literal_column, select, union
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.business import Business
+from app.models.service import Service
+
+SEARCH_CONFIG = literal_column("'russian'::regconfig")
+
+# A service name match counts less than a match on the business itself
+SERVICE_MATCH_WEIGHT = 0.5
+
+
+def _normalized(value) -> ColumnElement:
+    return func.search_normalize(value)
+
+
+def _tsquery(term: str) -> ColumnElement:
+    return func.websearch_to_tsquery(SEARCH_CONFIG, _normalized(term))
+
+
+def text_match(model, term: str) -> ColumnElement:
+    """Full-text or word-similarity match on a model with name and search_vector."""
+    return model.search_vector.op("@@")(_tsquery(term)) | _normalized(model.name).op("%>")(
+        _normalized(term)
+    )
+
+
+def matching_business_ids(term: str):
+    """Ids of businesses matching term by themselves or through a service."""
+    return union(
+        select(Business.id).where(text_match(Business, term)),
+        select(Service.business_id).where(Service.is_active == True, text_match(Service, term)),
+    )
+
+
+def search_relevance(term: str) -> ColumnElement:
+    """Relevance of a matched business, higher is better."""
+    best_service = (
+        select(func.max(func.word_similarity(_normalized(term), _normalized(Service.name))))
+        .where(Service.business_id == Business.id, Service.is_active == True)
+        .correlate(Business)
+        .scalar_subquery()
+    )
+    return (
+        func.ts_rank_cd(Business.search_vector, _tsquery(term))
+        + func.word_similarity(_normalized(term), _normalized(Business.name))
+        + SERVICE_MATCH_WEIGHT * func.coalesce(best_service, 0)
+    )
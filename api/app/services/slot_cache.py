@@ -0,0 +1,67 @@
+"""Redis cache of computed booking slots.
+
+Cache keys embed two version counters: one per (business, date), bumped by
+booking and hold writes, and the business version
+(app.services.business_version), bumped by admin writes such as hours,
+services and employees. Bumping a counter makes every key built from the old
+value unreachable; stale entries simply expire.
+"""
+import json
+import math
+import time as time_module
+from datetime import date, datetime, time, timedelta
+
+from app.core.config import settings
+from app.core.metrics import Counter
+from app.core.redis import redis_client
+from app.services.business_version import business_version_key
+
+slot_cache_requests = Counter(
+    "slot_cache_requests_total", "Available-slots cache lookups by result (hit, miss)"
+)
+slot_cache_invalidations = Counter(
+    "slot_cache_invalidations_total", "Available-slots version bumps by scope (day)"
+)
+
+
+def _day_version_key(business_id: int, day: date) -> str:
+    return f"slots_version:{business_id}:{day.isoformat()}"
+
+
+async def slot_cache_key(
+    business_id: int, service_id: int, employee_id: int | None, day: date
+) -> str:
+    """Build the current cache key for a (business, service, employee, date)."""
+    day_version, business_version = await redis_client.mget(
+        [_day_version_key(business_id, day), business_version_key(business_id)]
+    )
+    return (
+        f"slots:{business_id}:{day.isoformat()}:{service_id}:{employee_id or 'any'}"
+        f":v{business_version or 0}.{day_version or 0}"
+    )
+
+
+async def get_cached_slots(key: str) -> dict | None:
+    """Get cached day slots, counting hits and misses."""
+    cached = await redis_client.get(key)
+    slot_cache_requests.inc(result="hit" if cached else "miss")
+    return json.loads(cached) if cached else None
+
+
+async def store_slots(key: str, value: dict, hold_expires_at: float | None = None):
+    """Store computed day slots, only until the first hold in them expires."""
+    expire = settings.slot_cache_ttl_seconds
+    if hold_expires_at is not None:
+        expire = min(expire, max(math.ceil(hold_expires_at - time_module.time()), 1))
+    await redis_client.set(key, json.dumps(value), expire=expire)
+
+
+async def invalidate_day(business_id: int, day: date):
+    """Invalidate slots of one date after a booking or hold change."""
+    # The counter must outlive every entry of that date, or a reset to 0 could
+    # make an old entry reachable again; past dates are never served.
+    day_end = datetime.combine(day + timedelta(days=1), time.min)
+    expire = max(int((day_end - datetime.now()).total_seconds()), 0) + settings.slot_cache_ttl_seconds
+    await redis_client.incr(_day_version_key(business_id, day), expire=expire)
+    slot_cache_invalidations.inc(scope="day")
+
@@ -0,0 +1,196 @@
+"""Short-lived slot holds taken while a client fills in the booking form.
+
+Holds of one business day live in a Redis sorted set scored by expiry time.
+The hold id encodes the held interval, so reading the set is enough to mark
+held time as busy, and expired holds are ignored without a cleanup job.
+Each holder (client IP address) may keep settings.slot_hold_max_per_client
+live holds, so one client cannot hold every slot of a business.
+"""
+import secrets
+import time as time_module
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from app.core.config import settings
+from app.core.redis import redis_client
+
+# Remove the hold and report whether it was still live, in one step, so an
+# expiring hold cannot be both consumed by a booking and given to someone else.
+CONSUME_HOLD_SCRIPT = """
+local expires_at = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if not expires_at then
+    return 0
+end
+redis.call('ZREM', KEYS[1], ARGV[1])
+if tonumber(expires_at) > tonumber(ARGV[2]) then
+    return 1
+end
+return 0
+"""
+
+# Count the holder's live holds (dropping expired, consumed and released ones)
+# and add the new hold only if the holder is under the limit, in one step.
+PLACE_HOLD_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', ARGV[3])
+for _, id in ipairs(redis.call('ZRANGE', KEYS[2], 0, -1)) do
+    local business_id, day = string.match(id, '^(%d+):([^:]+):')
+    if not redis.call('ZSCORE', 'slot_holds:' .. business_id .. ':' .. day, id) then
+        redis.call('ZREM', KEYS[2], id)
+    end
+end
+if redis.call('ZCARD', KEYS[2]) >= tonumber(ARGV[5]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+redis.call('ZADD', KEYS[2], ARGV[2], ARGV[1])
+redis.call('EXPIRE', KEYS[2], ARGV[4])
+return 1
+"""
+
+
+class HoldLimitError(Exception):
+    """Holder already keeps settings.slot_hold_max_per_client live holds."""
+
+
+@dataclass(frozen=True)
+class SlotHold:
+    """Interval held by a hold id."""
+
+    business_id: int
+    day: date
+    start: int  # minute of day
+    duration: int
+    employee_id: int | None
+
+
+def _hold_key(business_id: int, day: date) -> str:
+    return f"slot_holds:{business_id}:{day.isoformat()}"
+
+
+def _holder_key(holder: str) -> str:
+    return f"slot_hold_holders:{holder}"
+
+
+def parse_hold_id(hold_id: str) -> SlotHold | None:
+    """Decode a hold id, or None if it is malformed."""
+    try:
+        business_id, day, start, duration, employee_id, _ = hold_id.split(":")
+        return SlotHold(
+            business_id=int(business_id),
+            day=date.fromisoformat(day),
+            start=int(start),
+            duration=int(duration),
+            employee_id=int(employee_id) or None,
+        )
+    except ValueError:
+        return None
+
+
+async def place_hold(
+    business_id: int,
+    day: date,
+    start: int,
+    duration: int,
+    employee_id: int | None,
+    holder: str,
+) -> tuple[str, float]:
+    """
+    Hold an interval for settings.slot_hold_ttl_seconds on behalf of holder.
+
+    The caller must have checked the slot under the day lock
+    (see app.services.availability.reserve_slot). Returns (hold_id, expires_at).
+    Raises HoldLimitError if the holder already keeps the maximum of live holds.
+    """
+    hold_id = ":".join(
+        [
+            str(business_id),
+            day.isoformat(),
+            str(start),
+            str(duration),
+            str(employee_id or 0),
+            secrets.token_urlsafe(12),
+        ]
+    )
+    now = time_module.time()
+    expires_at = now + settings.slot_hold_ttl_seconds
+    placed = await redis_client.eval(
+        PLACE_HOLD_SCRIPT,
+        [_hold_key(business_id, day), _holder_key(holder)],
+        [
+            hold_id,
+            expires_at,
+            now,
+            settings.slot_hold_ttl_seconds,
+            settings.slot_hold_max_per_client,
+        ],
+    )
+    if placed == 0:
+        raise HoldLimitError()
+    return hold_id, expires_at
+
+
+async def release_hold(hold_id: str) -> bool:
+    """Drop a hold the client no longer needs."""
+    hold = parse_hold_id(hold_id)
+    if hold is None:
+        return False
+    return await redis_client.zrem(_hold_key(hold.business_id, hold.day), hold_id) > 0
+
+
+async def consume_hold(hold_id: str) -> bool:
+    """Atomically remove a hold; True if it had not expired yet."""
+    hold = parse_hold_id(hold_id)
+    if hold is None:
+        return False
+    consumed = await redis_client.eval(
+        CONSUME_HOLD_SCRIPT,
+        [_hold_key(hold.business_id, hold.day)],
+        [hold_id, time_module.time()],
+    )
+    return bool(consumed)
+
+
+async def active_holds(
+    business_id: int, start_date: date, end_date: date, exclude_hold_id: str | None = None
+) -> tuple[dict[date, list[tuple[int, int, int | None]]], float | None]:
+    """
+    Get live holds of a date range in one round trip.
+
+    Returns (start minute, duration, employee_id) by date, in the same shape as
+    bookings in AvailabilityInputs, and the earliest expiry among them. The hold
+    exclude_hold_id is left out, so a booking can take its own hold's slot.
+    """
+    days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+    results = await redis_client.zrangebyscore(
+        [_hold_key(business_id, day) for day in days], time_module.time()
+    )
+
+    holds = defaultdict(list)
+    earliest = None
+    for members in results:
+        for hold_id, expires_at in members:
+            hold = parse_hold_id(hold_id)
+            if hold is None or hold_id == exclude_hold_id:
+                continue
+            holds[hold.day].append((hold.start, hold.duration, hold.employee_id))
+            earliest = expires_at if earliest is None else min(earliest, expires_at)
+    return dict(holds), earliest
+
+
+async def active_holds_for_businesses(
+    business_ids: list[int], day: date
+) -> dict[int, list[tuple[int, int, int | None]]]:
+    """Live holds of one date for several businesses in one round trip, by business."""
+    results = await redis_client.zrangebyscore(
+        [_hold_key(business_id, day) for business_id in business_ids], time_module.time()
+    )
+
+    holds = defaultdict(list)
+    for members in results:
+        for hold_id, _ in members:
+            hold = parse_hold_id(hold_id)
+            if hold is not None:
+                holds[hold.business_id].append((hold.start, hold.duration, hold.employee_id))
+    return dict(holds)
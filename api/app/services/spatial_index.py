@@ -0,0 +1,163 @@
+"""In-process spatial index of business coordinates.
+
+Each API worker keeps a grid of business ids bucketed by lat/lon cells. Nearby
+lookups only compute distances for businesses in cells overlapping the search
+circle, then the endpoint reads rows for the final page of ids from the DB.
+"""
+import asyncio
+import math
+from dataclasses import dataclass
+
+from loguru import logger
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.models.business import Business
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.32
+
+
+@dataclass(frozen=True, slots=True)
+class IndexedBusiness:
+    """Coordinates and filterable attributes of a business."""
+
+    id: int
+    lat: float
+    lon: float
+    type: str
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in kilometers."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+class BusinessSpatialIndex:
+    """Uniform lat/lon grid of businesses."""
+
+    def __init__(self, cell_degrees: float = 0.05):
+        self.cell_degrees = cell_degrees
+        self.ready = False
+        self._entries: dict[int, IndexedBusiness] = {}
+        self._cells: dict[tuple[int, int], set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        return (math.floor(lat / self.cell_degrees), math.floor(lon / self.cell_degrees))
+
+    def load(self, entries: list[IndexedBusiness]):
+        """Replace index contents."""
+        cells: dict[tuple[int, int], set[int]] = {}
+        for entry in entries:
+            cells.setdefault(self._cell(entry.lat, entry.lon), set()).add(entry.id)
+
+        self._entries = {entry.id: entry for entry in entries}
+        self._cells = cells
+        self.ready = True
+
+    def upsert(self, entry: IndexedBusiness):
+        """Add or move a business."""
+        self.remove(entry.id)
+        self._entries[entry.id] = entry
+        self._cells.setdefault(self._cell(entry.lat, entry.lon), set()).add(entry.id)
+
+    def remove(self, business_id: int):
+        """Remove a business if indexed."""
+        old = self._entries.pop(business_id, None)
+        if old is None:
+            return
+
+        cell = self._cell(old.lat, old.lon)
+        bucket = self._cells.get(cell)
+        if bucket is not None:
+            bucket.discard(business_id)
+            if not bucket:
+                del self._cells[cell]
+
+    def nearby(
+        self,
+        lat: float,
+        lon: float,
+        radius_km: float,
+        business_type: str | None = None,
+        limit: int = 20,
+    ) -> list[tuple[int, float]]:
+        """Get (business_id, distance_km) within radius, nearest first."""
+        lat_range = radius_km / KM_PER_DEGREE_LAT
+        cos_lat = max(math.cos(math.radians(lat)), 1e-6)
+        lon_range = min(radius_km / (KM_PER_DEGREE_LAT * cos_lat), 180.0)
+
+        min_i, min_j = self._cell(lat - lat_range, lon - lon_range)
+        max_i, max_j = self._cell(lat + lat_range, lon + lon_range)
+
+        # A wide box has more cells than are occupied: walk the occupied ones
+        if (max_i - min_i + 1) * (max_j - min_j + 1) > len(self._cells):
+            buckets = [
+                bucket
+                for (i, j), bucket in self._cells.items()
+                if min_i <= i <= max_i and min_j <= j <= max_j
+            ]
+        else:
+            buckets = [
+                self._cells[(i, j)]
+                for i in range(min_i, max_i + 1)
+                for j in range(min_j, max_j + 1)
+                if (i, j) in self._cells
+            ]
+
+        matches = []
+        for bucket in buckets:
+            for business_id in bucket:
+                entry = self._entries[business_id]
+                if business_type and entry.type != business_type:
+                    continue
+                distance = haversine_km(lat, lon, entry.lat, entry.lon)
+                if distance <= radius_km:
+                    matches.append((distance, business_id))
+
+        matches.sort()
+        return [(business_id, distance) for distance, business_id in matches[:limit]]
+
+
+def indexed_business(business: Business) -> IndexedBusiness:
+    """Build index entry from a Business row."""
+    return IndexedBusiness(
+        id=business.id, lat=business.lat, lon=business.lon, type=business.type.value
+    )
+
+
+async def rebuild_business_index():
+    """Load coordinates of all businesses into the index."""
+    async with async_session_maker() as session:
+        result = await session.execute(
+            select(Business.id, Business.lat, Business.lon, Business.type)
+        )
+        entries = [
+            IndexedBusiness(id=row.id, lat=row.lat, lon=row.lon, type=row.type.value)
+            for row in result.all()
+        ]
+
+    business_index.load(entries)
+    logger.info(f"Spatial index built with {len(entries)} businesses")
+
+
+async def refresh_business_index_periodically():
+    """Rebuild the index on an interval so changes made by other workers show up."""
+    while True:
+        await asyncio.sleep(settings.spatial_index_refresh_seconds)
+        try:
+            await rebuild_business_index()
+        except Exception as e:
+            logger.error(f"Failed to refresh spatial index: {e}")
+
+
+business_index = BusinessSpatialIndex()
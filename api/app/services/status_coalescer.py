@@ -0,0 +1,114 @@
+"""Coalescing of rapid status changes.
+
+The live status (business_status row and the live store) is updated on every
+change. Broadcasts and history rows are rate limited per business: the first
+change in a window of settings.status_coalesce_seconds goes out at once, later
+changes in the window only update the live status, and when the window closes
+the final state goes out if it differs from what was sent. Toggling busy and
+back within a window therefore costs one broadcast and one history row.
+
+The window is a Redis key, so changes arriving on different workers share it;
+the worker that opened the window closes it.
+"""
+import asyncio
+import json
+from datetime import datetime
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.core.metrics import Counter
+from app.core.redis import redis_client
+from app.models.business import AvailabilityStatus, BusinessStatus
+from app.services.live_status import get_status, status_payload
+from app.services.realtime import publish_status
+from app.services.status_history_writer import status_history_writer
+
+status_coalescing = Counter(
+    "status_coalescing_total",
+    "Status changes by outcome: sent (window opened), coalesced (history row and "
+    "broadcast saved), trailing (final state sent at window close), settled "
+    "(window closed with nothing new to send)",
+)
+
+
+def _window_key(business_id: int) -> str:
+    return f"status_coalesce:{business_id}"
+
+
+def _same_state(a: dict, b: dict) -> bool:
+    return (a["status"], a["estimated_wait_minutes"]) == (b["status"], b["estimated_wait_minutes"])
+
+
+async def _emit(business_id: int, payload: dict):
+    """Broadcast a status and record it in history."""
+    await publish_status(business_id, payload)
+    await status_history_writer.record(
+        business_id,
+        AvailabilityStatus(payload["status"]),
+        payload["estimated_wait_minutes"],
+        datetime.fromisoformat(payload["updated_at"]),
+    )
+
+
+class StatusCoalescer:
+    """Per-business windows of coalesced status broadcasts and history rows."""
+
+    def __init__(self):
+        self._pending: dict[int, asyncio.Task] = {}
+
+    async def submit(self, business_status: BusinessStatus):
+        """Handle a committed status change that is already in the live store."""
+        business_id = business_status.business_id
+        payload = status_payload(business_status)
+        window = settings.status_coalesce_seconds
+        if window <= 0:
+            await _emit(business_id, payload)
+            return
+
+        # The key outlives the window so a slow close never reopens it early
+        opened = await redis_client.set_nx(
+            _window_key(business_id), json.dumps(payload), expire=2 * window + 1
+        )
+        if not opened:
+            status_coalescing.inc(event="coalesced")
+            return
+
+        status_coalescing.inc(event="sent")
+        await _emit(business_id, payload)
+        if redis_client.redis:
+            self._pending[business_id] = asyncio.create_task(self._close_later(business_id))
+
+    async def _close_later(self, business_id: int):
+        await asyncio.sleep(settings.status_coalesce_seconds)
+        self._pending.pop(business_id, None)
+        await self._close(business_id)
+
+    async def _close(self, business_id: int):
+        """Send the final state of a window if it differs from the one sent."""
+        key = _window_key(business_id)
+        sent = await redis_client.get(key)
+        # Delete before reading the live status: a change made after this point
+        # opens a new window instead of being missed
+        await redis_client.delete(key)
+        if sent is None:
+            return
+
+        async with async_session_maker() as session:
+            current = await get_status(session, business_id)
+        if current["updated_at"] is None or _same_state(json.loads(sent), current):
+            status_coalescing.inc(event="settled")
+            return
+
+        status_coalescing.inc(event="trailing")
+        await _emit(business_id, current)
+
+    async def stop(self):
+        """Close all open windows now (on shutdown)."""
+        pending, self._pending = self._pending, {}
+        for task in pending.values():
+            task.cancel()
+        for business_id in pending:
+            await self._close(business_id)
+
+
+status_coalescer = StatusCoalescer()
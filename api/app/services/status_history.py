@@ -0,0 +1,259 @@
+"""Status history partitions, retention and rollups.
+
+status_history is partitioned by month. A maintenance job (one worker at a
+time, through an advisory lock) keeps partitions created ahead of time, drops
+partitions older than the retention period, and rolls the raw rows up into
+status_hourly_stats and status_daily_stats so analytics never read raw history.
+Expired partitions are detached concurrently before they are dropped, so
+retention never takes a lock on status_history that blocks inserts.
+
+The hourly rollup turns status changes into intervals: each change lasts until
+the next change of the same business, and the status in force when the window
+starts is carried in from the last earlier change. Intervals are split at hour
+boundaries and summed per (business, hour).
+"""
+import asyncio
+import re
+from datetime import date, datetime, timedelta
+
+from loguru import logger
+from sqlalchemy import DateTime, bindparam, delete, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session_maker, engine
+from app.models.business import StatusHistory
+from app.models.status_stats import StatusHourlyStats
+
+MAINTENANCE_LOCK_ID = 7_340_021
+RETENTION_LOCK_ID = 7_340_121
+# Longest stretch rolled up per run, so a backfill proceeds in bounded steps
+MAX_ROLLUP_WINDOW = timedelta(days=7)
+
+PARTITION_NAME = re.compile(r"^status_history_y(\d{4})m(\d{2})$")
+
+HOURLY_ROLLUP_SQL = text(
+    """
+    WITH carried AS (
+        SELECT b.id AS business_id, last.status, last.estimated_wait_minutes,
+               CAST(:start AS timestamp) AS started_at, false AS is_change
+        FROM businesses b
+        CROSS JOIN LATERAL (
+            SELECT h.status, h.estimated_wait_minutes
+            FROM status_history h
+            WHERE h.business_id = b.id AND h.updated_at < :start
+            ORDER BY h.updated_at DESC, h.id DESC
+            LIMIT 1
+        ) last
+    ),
+    changes AS (
+        SELECT business_id, status, estimated_wait_minutes,
+               updated_at AS started_at, true AS is_change
+        FROM status_history
+        WHERE updated_at >= :start AND updated_at < :end
+    ),
+    events AS (
+        SELECT *,
+               coalesce(
+                   lead(started_at) OVER (PARTITION BY business_id ORDER BY started_at, is_change),
+                   CAST(:end AS timestamp)
+               ) AS ended_at
+        FROM (SELECT * FROM carried UNION ALL SELECT * FROM changes) e
+    ),
+    slices AS (
+        SELECT e.business_id, s.hour, e.status, e.estimated_wait_minutes,
+               e.is_change AND s.hour = date_trunc('hour', e.started_at) AS counts,
+               greatest(
+                   extract(epoch FROM least(e.ended_at, s.hour + interval '1 hour')
+                                      - greatest(e.started_at, s.hour)),
+                   0
+               ) AS seconds
+        FROM events e
+        CROSS JOIN LATERAL generate_series(
+            date_trunc('hour', e.started_at),
+            greatest(e.ended_at - interval '1 microsecond', e.started_at),
+            interval '1 hour'
+        ) AS s(hour)
+    )
+    INSERT INTO status_hourly_stats (
+        business_id, hour, available_seconds, busy_seconds, busy_wait_minute_seconds, changes
+    )
+    SELECT business_id, hour,
+           coalesce(sum(seconds) FILTER (WHERE status = 'available'), 0),
+           coalesce(sum(seconds) FILTER (WHERE status = 'busy'), 0),
+           coalesce(sum(seconds * estimated_wait_minutes) FILTER (WHERE status = 'busy'), 0),
+           count(*) FILTER (WHERE counts)
+    FROM slices
+    GROUP BY business_id, hour
+    ON CONFLICT (business_id, hour) DO UPDATE SET
+        available_seconds = excluded.available_seconds,
+        busy_seconds = excluded.busy_seconds,
+        busy_wait_minute_seconds = excluded.busy_wait_minute_seconds,
+        changes = excluded.changes
+    """
+).bindparams(bindparam("start", type_=DateTime), bindparam("end", type_=DateTime))
+
+DAILY_ROLLUP_SQL = text(
+    """
+    INSERT INTO status_daily_stats (
+        business_id, day, available_seconds, busy_seconds, busy_wait_minute_seconds, changes
+    )
+    SELECT business_id, CAST(hour AS date), sum(available_seconds), sum(busy_seconds),
+           sum(busy_wait_minute_seconds), sum(changes)
+    FROM status_hourly_stats
+    WHERE hour >= date_trunc('day', CAST(:start AS timestamp))
+    GROUP BY business_id, CAST(hour AS date)
+    ON CONFLICT (business_id, day) DO UPDATE SET
+        available_seconds = excluded.available_seconds,
+        busy_seconds = excluded.busy_seconds,
+        busy_wait_minute_seconds = excluded.busy_wait_minute_seconds,
+        changes = excluded.changes
+    """
+).bindparams(bindparam("start", type_=DateTime))
+
+
+def _month_start(value: date, months: int = 0) -> date:
+    """First day of the month `months` after the month of value."""
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _truncate_hour(value: datetime) -> datetime:
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def partition_name(month: date) -> str:
+    return f"status_history_y{month.year}m{month.month:02d}"
+
+
+async def ensure_partitions(db: AsyncSession, today: date):
+    """
+    Create monthly partitions from the current month to
+    settings.status_history_partitions_ahead months ahead.
+    """
+    for offset in range(settings.status_history_partitions_ahead + 1):
+        month = _month_start(today, offset)
+        next_month = _month_start(month, 1)
+        await db.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF status_history "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{next_month.isoformat()}')"
+            )
+        )
+
+
+def _retention_cutoff(today: date) -> date | None:
+    """First month kept by retention, None if history is kept forever."""
+    if settings.status_history_retention_months <= 0:
+        return None
+    return _month_start(today, -settings.status_history_retention_months)
+
+
+async def delete_expired_rollups(db: AsyncSession, today: date):
+    """Delete hourly rollups older than the retention period; daily rollups are kept."""
+    cutoff = _retention_cutoff(today)
+    if cutoff is None:
+        return
+    await db.execute(
+        delete(StatusHourlyStats).where(
+            StatusHourlyStats.hour < datetime.combine(cutoff, datetime.min.time())
+        )
+    )
+
+
+async def drop_expired_partitions(today: date) -> list[str]:
+    """
+    Detach and drop partitions older than the retention period.
+
+    DETACH PARTITION CONCURRENTLY cannot run in a transaction, so this uses an
+    autocommit connection and a session-level advisory lock. A partition left
+    detached or half-detached by an interrupted run is finished on the next.
+    """
+    cutoff = _retention_cutoff(today)
+    if cutoff is None:
+        return []
+
+    dropped = []
+    async with engine.connect() as connection:
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        if not await connection.scalar(select(func.pg_try_advisory_lock(RETENTION_LOCK_ID))):
+            return []
+        try:
+            # Attached, pending detach and already detached partitions alike
+            result = await connection.execute(
+                text(
+                    "SELECT c.relname, i.inhrelid IS NOT NULL, coalesce(i.inhdetachpending, false) "
+                    "FROM pg_class c LEFT JOIN pg_inherits i ON i.inhrelid = c.oid "
+                    "WHERE c.relkind = 'r' AND c.relname ~ '^status_history_y[0-9]{4}m[0-9]{2}$'"
+                )
+            )
+            for name, attached, detach_pending in result.all():
+                match = PARTITION_NAME.match(name)
+                if _month_start(date(int(match[1]), int(match[2]), 1), 1) > cutoff:
+                    continue
+                if detach_pending:
+                    await connection.execute(
+                        text(f"ALTER TABLE status_history DETACH PARTITION {name} FINALIZE")
+                    )
+                elif attached:
+                    await connection.execute(
+                        text(f"ALTER TABLE status_history DETACH PARTITION {name} CONCURRENTLY")
+                    )
+                await connection.execute(text(f"DROP TABLE {name}"))
+                dropped.append(name)
+        finally:
+            await connection.execute(select(func.pg_advisory_unlock(RETENTION_LOCK_ID)))
+    return dropped
+
+
+async def rollup_status_history(db: AsyncSession, start: datetime, end: datetime):
+    """Recompute hourly rollups of [start, end) and daily rollups of its days."""
+    await db.execute(HOURLY_ROLLUP_SQL, {"start": start, "end": end})
+    await db.execute(DAILY_ROLLUP_SQL, {"start": start})
+
+
+async def _rollup_window(db: AsyncSession, now: datetime) -> tuple[datetime, datetime] | None:
+    """
+    Window for this run: the last two job intervals, extended back to the last
+    rolled-up hour (or the first history row) when the job fell behind.
+    """
+    start = _truncate_hour(now - timedelta(seconds=2 * settings.status_rollup_seconds))
+    last_hour = (await db.execute(select(func.max(StatusHourlyStats.hour)))).scalar()
+    if last_hour is None:
+        last_hour = (await db.execute(select(func.min(StatusHistory.updated_at)))).scalar()
+        if last_hour is None:
+            return None
+    start = min(start, _truncate_hour(last_hour))
+    return start, min(now, start + MAX_ROLLUP_WINDOW)
+
+
+async def maintain_status_history():
+    """Create partitions, apply retention and refresh rollups."""
+    async with async_session_maker() as session:
+        locked = (
+            await session.execute(select(func.pg_try_advisory_xact_lock(MAINTENANCE_LOCK_ID)))
+        ).scalar()
+        if not locked:
+            return
+
+        now = datetime.utcnow()
+        await ensure_partitions(session, now.date())
+        window = await _rollup_window(session, now)
+        if window:
+            await rollup_status_history(session, *window)
+        await delete_expired_rollups(session, now.date())
+        await session.commit()
+
+    dropped = await drop_expired_partitions(now.date())
+    if dropped:
+        logger.info(f"Dropped expired status history partitions: {', '.join(dropped)}")
+
+
+async def maintain_status_history_periodically():
+    """Run maintenance at startup and then on an interval."""
+    while True:
+        try:
+            await maintain_status_history()
+        except Exception as e:
+            logger.error(f"Failed to maintain status history: {e}")
+        await asyncio.sleep(settings.status_rollup_seconds)
@@ -0,0 +1,146 @@
+"""Buffered background writer for status history rows.
+
+PATCH /admin/status only updates the current status in its transaction; the
+history row is queued here and inserted by a per-worker task in batches (one
+multi-row INSERT per batch), so a burst of toggles costs a few statements and
+commits instead of one each. Rows carry the time of the change, not of the
+insert, so ordering and rollups are unaffected by the delay.
+
+The queue is bounded. When it is full a request waits for room up to
+settings.status_history_enqueue_timeout_seconds and then writes its row
+directly, which slows producers down instead of growing memory or losing rows.
+On shutdown the queue is flushed before the process exits.
+"""
+import asyncio
+from datetime import datetime
+
+from loguru import logger
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.core.metrics import Counter
+from app.models.business import AvailabilityStatus, StatusHistory
+
+# Write attempts per batch before its rows are given up
+MAX_ATTEMPTS = 3
+
+status_history_rows = Counter(
+    "status_history_rows_total",
+    "Status history rows by write path (batched, direct, dropped)",
+)
+status_history_batches = Counter(
+    "status_history_batches_total", "Status history batch inserts"
+)
+
+
+class StatusHistoryWriter:
+    """Queue of pending status history rows drained by a background task."""
+
+    def __init__(self):
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+
+    async def record(
+        self,
+        business_id: int,
+        status: AvailabilityStatus,
+        estimated_wait_minutes: int,
+        updated_at: datetime,
+    ):
+        """Queue a history row, or write it directly if the writer is not running or full."""
+        row = {
+            "business_id": business_id,
+            "status": status,
+            "estimated_wait_minutes": estimated_wait_minutes,
+            "updated_at": updated_at,
+        }
+        if self._task is None:
+            await self._insert([row])
+            status_history_rows.inc(path="direct")
+            return
+
+        try:
+            await asyncio.wait_for(
+                self._queue.put(row), timeout=settings.status_history_enqueue_timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            await self._insert([row])
+            status_history_rows.inc(path="direct")
+
+    async def _insert(self, rows: list[dict]):
+        async with async_session_maker() as session:
+            await session.execute(insert(StatusHistory), rows)
+            await session.commit()
+
+    async def _write(self, batch: list[dict]):
+        """Insert a batch, retrying transient failures."""
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            try:
+                await self._insert(batch)
+                status_history_batches.inc()
+                status_history_rows.inc(len(batch), path="batched")
+                return
+            except Exception as e:
+                logger.error(
+                    f"Failed to write {len(batch)} status history rows "
+                    f"(attempt {attempt}/{MAX_ATTEMPTS}): {e}"
+                )
+                if attempt < MAX_ATTEMPTS:
+                    await asyncio.sleep(attempt)
+        status_history_rows.inc(len(batch), path="dropped")
+
+    async def _run(self):
+        """Collect rows into batches of up to the batch size or flush interval."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            row = await self._queue.get()
+            if row is None:
+                break
+            batch = [row]
+            deadline = loop.time() + settings.status_history_flush_seconds
+            while len(batch) < settings.status_history_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                batch.append(row)
+            await self._write(batch)
+
+    def start(self):
+        """Start the background writer (call once per worker)."""
+        if self._task is None:
+            self._queue = asyncio.Queue(maxsize=settings.status_history_queue_size)
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Write everything queued so far and stop the background writer."""
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+
+        async def drain():
+            # Rows queued before the sentinel are written first; new rows go direct
+            await self._queue.put(None)
+            await task
+
+        # A full queue delays the sentinel too, so both share the timeout
+        try:
+            await asyncio.wait_for(drain(), timeout=settings.status_history_flush_timeout_seconds)
+        except asyncio.TimeoutError:
+            logger.error(f"Status history writer did not flush in time, {self.pending} rows lost")
+            status_history_rows.inc(self.pending, path="dropped")
+
+
+status_history_writer = StatusHistoryWriter()
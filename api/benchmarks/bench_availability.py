@@ -0,0 +1,51 @@
+"""
+Microbenchmark of the availability engine for salons with many employees.
+
+Usage:
+    python -m benchmarks.bench_availability
+"""
+import random
+import time
+
+from app.services.availability import DayPlan
+
+OPEN_MINUTE = 9 * 60
+CLOSE_MINUTE = 21 * 60
+STEP = 15
+RUNS = 1000
+
+
+def build_plan(employees: int, bookings_per_employee: int, rng: random.Random) -> DayPlan:
+    plan = DayPlan(OPEN_MINUTE, CLOSE_MINUTE, list(range(employees)))
+    for employee_id in range(employees):
+        for _ in range(bookings_per_employee):
+            start = rng.randrange(OPEN_MINUTE, CLOSE_MINUTE - 30, STEP)
+            plan.reserve(start, rng.choice([30, 45, 60, 90]), employee_id)
+    # Some bookings without an assigned employee
+    for _ in range(employees):
+        start = rng.randrange(OPEN_MINUTE, CLOSE_MINUTE - 30, STEP)
+        plan.reserve(start, 60)
+    return plan
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{'employees':>10} {'bookings':>10} {'build us':>10} {'slots us':>10}")
+    for employees in (1, 5, 20, 50, 100):
+        bookings = employees * 7
+
+        start = time.perf_counter()
+        for _ in range(RUNS // 10):
+            plan = build_plan(employees, 6, rng)
+        build_us = (time.perf_counter() - start) / (RUNS // 10) * 1e6
+
+        start = time.perf_counter()
+        for _ in range(RUNS):
+            plan.slots(60, STEP)
+        slots_us = (time.perf_counter() - start) / RUNS * 1e6
+
+        print(f"{employees:>10} {bookings:>10} {build_us:>10.1f} {slots_us:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
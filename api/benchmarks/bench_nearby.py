@@ -0,0 +1,103 @@
+"""
+Benchmark nearby lookups: in-process grid index vs. linear scan vs. SQL.
+
+Usage:
+    python -m benchmarks.bench_nearby            # index vs. linear scan
+    python -m benchmarks.bench_nearby --sql      # also time the PostGIS query
+
+The SQL path runs against DATABASE_URL with whatever businesses it contains, so
+seed the table to the size being compared before using --sql.
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from app.services.spatial_index import BusinessSpatialIndex, IndexedBusiness, haversine_km
+
+# Tyumen city center
+CENTER_LAT = 57.153
+CENTER_LON = 65.534
+SPREAD_DEGREES = 0.5
+RADIUS_KM = 5.0
+LIMIT = 20
+QUERIES = 200
+
+
+def generate(count: int) -> list[IndexedBusiness]:
+    rng = random.Random(count)
+    return [
+        IndexedBusiness(
+            id=i,
+            lat=CENTER_LAT + rng.uniform(-SPREAD_DEGREES, SPREAD_DEGREES),
+            lon=CENTER_LON + rng.uniform(-SPREAD_DEGREES, SPREAD_DEGREES),
+            type="car_wash",
+        )
+        for i in range(count)
+    ]
+
+
+def linear_scan(entries: list[IndexedBusiness], lat: float, lon: float) -> list[tuple[int, float]]:
+    matches = []
+    for entry in entries:
+        distance = haversine_km(lat, lon, entry.lat, entry.lon)
+        if distance <= RADIUS_KM:
+            matches.append((distance, entry.id))
+    matches.sort()
+    return [(business_id, distance) for distance, business_id in matches[:LIMIT]]
+
+
+def timed_ms(fn, points) -> float:
+    start = time.perf_counter()
+    for lat, lon in points:
+        fn(lat, lon)
+    return (time.perf_counter() - start) / len(points) * 1000
+
+
+async def sql_ms(points) -> float:
+    from app.api.v1.businesses import _find_businesses
+    from app.core.database import async_session_maker
+
+    async with async_session_maker() as session:
+        start = time.perf_counter()
+        for lat, lon in points:
+            await _find_businesses(session, lat=lat, lon=lon, radius_km=RADIUS_KM, limit=LIMIT)
+        return (time.perf_counter() - start) / len(points) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--sql", action="store_true", help="also time the PostGIS query")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    points = [
+        (
+            CENTER_LAT + rng.uniform(-SPREAD_DEGREES, SPREAD_DEGREES),
+            CENTER_LON + rng.uniform(-SPREAD_DEGREES, SPREAD_DEGREES),
+        )
+        for _ in range(QUERIES)
+    ]
+
+    print(f"{'businesses':>12} {'build ms':>10} {'index ms':>10} {'scan ms':>10}")
+    for size in args.sizes:
+        entries = generate(size)
+
+        index = BusinessSpatialIndex()
+        start = time.perf_counter()
+        index.load(entries)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        index_ms = timed_ms(lambda lat, lon: index.nearby(lat, lon, RADIUS_KM, limit=LIMIT), points)
+        # The linear scan is slow at 1M, so fewer queries are enough
+        scan_ms = timed_ms(lambda lat, lon: linear_scan(entries, lat, lon), points[:10])
+
+        print(f"{size:>12} {build_ms:>10.1f} {index_ms:>10.3f} {scan_ms:>10.1f}")
+
+    if args.sql:
+        print(f"SQL (PostGIS KNN) per query: {asyncio.run(sql_ms(points)):.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
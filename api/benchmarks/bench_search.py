@@ -0,0 +1,150 @@
+"""
+Benchmark business search: legacy ILIKE '%term%' vs. full-text + trigram.
+
+Usage:
+    python -m benchmarks.bench_search --seed 100000   # add synthetic businesses
+    python -m benchmarks.bench_search                 # time both queries
+    python -m benchmarks.bench_search --cleanup       # remove synthetic rows
+
+Runs against DATABASE_URL (migrated to head). Synthetic businesses are marked
+with dgis_id = 'bench-search' and get three services each. The table prints the
+median latency over --runs and the number of rows for every term.
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import delete, func, insert, or_, select, text
+
+from app.api.v1.businesses import _find_businesses
+from app.core.database import async_session_maker
+from app.models.business import Business, BusinessType
+from app.models.service import Service
+
+MARKER = "bench-search"
+BATCH = 5_000
+
+NAME_WORDS = [
+    "Автомойка", "Мойка", "Шиномонтаж", "Автосервис", "Кузовной ремонт", "Салон красоты",
+    "Барбершоп", "Студия маникюра", "Ёлочка", "Детейлинг", "Автоэлектрик", "Шинный центр",
+]
+NAME_SUFFIXES = [
+    "Люкс", "Премиум", "Экспресс", "Север", "Центр", "24", "Плюс", "Профи", "Звезда", "Пилот",
+]
+SERVICE_NAMES = [
+    "Комплексная мойка", "Замена масла", "Сезонная переобувка", "Балансировка колёс",
+    "Полировка кузова", "Химчистка салона", "Мужская стрижка", "Маникюр с покрытием",
+    "Окрашивание волос", "Диагностика подвески", "Заправка кондиционера",
+]
+TERMS = [
+    "мойка",  # stemmed full-text match
+    "шиномантаж",  # typo
+    "елочка",  # ё/е folding
+    "маникюр",  # only in service names
+    "замена масла",  # phrase in service names
+    "премиум детейлинг",  # two words in the name
+]
+
+
+async def seed(count: int):
+    rng = random.Random(count)
+    types = list(BusinessType)
+    async with async_session_maker() as db:
+        for start in range(0, count, BATCH):
+            rows = [
+                {
+                    "name": f"{rng.choice(NAME_WORDS)} {rng.choice(NAME_SUFFIXES)} {start + i}",
+                    "type": rng.choice(types),
+                    "address": f"ул. Тестовая, {start + i}",
+                    "lat": 57.153 + rng.uniform(-0.5, 0.5),
+                    "lon": 65.534 + rng.uniform(-0.5, 0.5),
+                    "description": " ".join(rng.sample(SERVICE_NAMES, 3)),
+                    "dgis_id": MARKER,
+                }
+                for i in range(min(BATCH, count - start))
+            ]
+            ids = (await db.execute(insert(Business).returning(Business.id), rows)).scalars().all()
+            await db.execute(
+                insert(Service),
+                [
+                    {
+                        "business_id": business_id,
+                        "name": name,
+                        "price_from": 500,
+                        "price_to": 1500,
+                        "duration_minutes": 60,
+                    }
+                    for business_id in ids
+                    for name in rng.sample(SERVICE_NAMES, 3)
+                ],
+            )
+            await db.commit()
+            print(f"seeded {start + len(rows)}/{count}")
+        await db.execute(text("ANALYZE businesses"))
+        await db.execute(text("ANALYZE services"))
+        await db.commit()
+
+
+async def cleanup():
+    async with async_session_maker() as db:
+        marked = select(Business.id).where(Business.dgis_id == MARKER)
+        await db.execute(delete(Service).where(Service.business_id.in_(marked)))
+        await db.execute(delete(Business).where(Business.dgis_id == MARKER))
+        await db.commit()
+
+
+async def legacy_search(db, term: str):
+    """The query search used before full-text indexes."""
+    result = await db.execute(
+        select(Business)
+        .where(or_(Business.name.ilike(f"%{term}%"), Business.description.ilike(f"%{term}%")))
+        .order_by(Business.name)
+        .limit(50)
+    )
+    return result.scalars().all()
+
+
+async def new_search(db, term: str):
+    businesses, _ = await _find_businesses(db, search=term, limit=50)
+    return businesses
+
+
+async def median_ms(fn, runs: int) -> tuple[float, int]:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        rows = await fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), len(rows)
+
+
+async def benchmark(runs: int):
+    async with async_session_maker() as db:
+        total = (await db.execute(select(func.count(Business.id)))).scalar()
+        print(f"businesses: {total}")
+        print(f"{'term':<20} {'ilike ms':>9} {'rows':>5} {'search ms':>10} {'rows':>5}")
+        for term in TERMS:
+            ilike_ms, ilike_rows = await median_ms(lambda: legacy_search(db, term), runs)
+            search_ms, search_rows = await median_ms(lambda: new_search(db, term), runs)
+            print(f"{term:<20} {ilike_ms:>9.2f} {ilike_rows:>5} {search_ms:>10.2f} {search_rows:>5}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seed", type=int, default=0, help="add this many synthetic businesses")
+    parser.add_argument("--cleanup", action="store_true", help="remove synthetic businesses")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.cleanup:
+        asyncio.run(cleanup())
+        return
+    if args.seed:
+        asyncio.run(seed(args.seed))
+    asyncio.run(benchmark(args.runs))
+
+
+if __name__ == "__main__":
+    main()
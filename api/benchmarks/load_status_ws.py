@@ -0,0 +1,88 @@
+"""
+Load test for the status WebSocket feed: many idle subscribers on one node.
+
+Usage:
+    ulimit -n 65536
+    python -m benchmarks.load_status_ws --url ws://127.0.0.1:8000/api/v1/realtime/status \\
+        --clients 10000 --business-id 1
+
+Opens the sockets, subscribes each to --business-id, keeps them idle for
+--idle seconds, then publishes one status change through Redis and reports how
+long it took to reach every subscriber.
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import redis.asyncio as aioredis
+import websockets
+
+from app.core.config import settings
+from app.services.realtime import STATUS_CHANNEL
+
+
+async def subscriber(url: str, business_id: int, ready: asyncio.Event, received: list, go):
+    async with websockets.connect(url, open_timeout=60) as ws:
+        await ws.send(json.dumps({"business_ids": [business_id]}))
+        snapshot = json.loads(await ws.recv())
+        assert snapshot["type"] == "snapshot"
+        ready.set()
+
+        await go.wait()
+        while True:
+            message = json.loads(await ws.recv())
+            if message["type"] == "status":
+                received.append(time.perf_counter())
+                return
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="ws://127.0.0.1:8000/api/v1/realtime/status")
+    parser.add_argument("--clients", type=int, default=10_000)
+    parser.add_argument("--business-id", type=int, default=1)
+    parser.add_argument("--idle", type=float, default=30.0)
+    args = parser.parse_args()
+
+    go = asyncio.Event()
+    received: list[float] = []
+    events = [asyncio.Event() for _ in range(args.clients)]
+
+    start = time.perf_counter()
+    tasks = []
+    # Connect in batches so the accept backlog is not overrun
+    for i in range(0, args.clients, 500):
+        batch = events[i:i + 500]
+        tasks += [
+            asyncio.create_task(subscriber(args.url, args.business_id, event, received, go))
+            for event in batch
+        ]
+        await asyncio.gather(*(event.wait() for event in batch))
+    print(f"{args.clients} subscribers connected in {time.perf_counter() - start:.1f}s")
+
+    await asyncio.sleep(args.idle)
+    go.set()
+
+    redis = aioredis.from_url(settings.redis_url, decode_responses=True)
+    published_at = time.perf_counter()
+    await redis.publish(
+        STATUS_CHANNEL,
+        json.dumps({
+            "type": "status",
+            "business_id": args.business_id,
+            "status": {"status": "busy", "estimated_wait_minutes": 15, "updated_at": None},
+        }),
+    )
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=60)
+    await redis.close()
+
+    latencies = sorted((t - published_at) * 1000 for t in received)
+    print(f"delivered to {len(latencies)} subscribers")
+    print(f"p50 {latencies[len(latencies) // 2]:.1f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99) - 1]:.1f} ms, "
+          f"max {latencies[-1]:.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+"""
+Concurrency stress test for booking creation.
+
+Usage:
+    python -m benchmarks.stress_booking_race --url http://127.0.0.1:8000/api/v1 \\
+        --business-id 1 --service-id 1 --date 2026-11-02 --time 10:00
+
+Round 1 fires --requests parallel bookings for the same slot. A slot fits as
+many bookings as there are active employees qualified for the service (one if
+there are none, or if --employee-id pins the bookings to one employee), so
+exactly that many must get 201 and all others 409; the script reads the count
+from GET /businesses/{id}/employees.
+
+Round 2 fires the same number of bookings for distinct slots spread over --days
+days (--step minutes apart within a day): every one should succeed, and its
+throughput shows that the per-day lock does not serialize unrelated slots.
+
+Use a business open every day from --time for requests / days * step minutes
+and a date range nobody else books; the script does not clean up.
+"""
+import argparse
+import asyncio
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta
+
+import httpx
+
+
+async def book(client: httpx.AsyncClient, args, day: date, at: str, i: int) -> int:
+    response = await client.post(
+        f"{args.url}/bookings",
+        json={
+            "business_id": args.business_id,
+            "service_id": args.service_id,
+            "employee_id": args.employee_id,
+            "booking_date": day.isoformat(),
+            "booking_time": at,
+            "client_name": f"Stress {i}",
+            "client_phone": f"+7900{i:07d}",
+        },
+    )
+    return response.status_code
+
+
+async def slot_capacity(args) -> int:
+    """Bookings the round 1 slot fits: one per qualified employee, at least one."""
+    if args.employee_id is not None:
+        return 1
+    async with httpx.AsyncClient(timeout=60) as client:
+        response = await client.get(
+            f"{args.url}/businesses/{args.business_id}/employees",
+            params={"service_id": args.service_id},
+        )
+        response.raise_for_status()
+    return max(len(response.json()), 1)
+
+
+async def run_round(args, slots: list[tuple[date, str]]) -> tuple[Counter, float]:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=60) as client:
+        start = time.perf_counter()
+        codes = await asyncio.gather(
+            *(book(client, args, day, at, i) for i, (day, at) in enumerate(slots))
+        )
+        elapsed = time.perf_counter() - start
+    return Counter(codes), elapsed
+
+
+def distinct_slots(args) -> list[tuple[date, str]]:
+    first = datetime.combine(date.fromisoformat(args.date), datetime.strptime(args.time, "%H:%M").time())
+    per_day = -(-args.requests // args.days)
+    return [
+        (
+            first.date() + timedelta(days=1 + i // per_day),
+            (first + timedelta(minutes=args.step * (i % per_day))).strftime("%H:%M"),
+        )
+        for i in range(args.requests)
+    ]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="http://127.0.0.1:8000/api/v1")
+    parser.add_argument("--business-id", type=int, required=True)
+    parser.add_argument("--service-id", type=int, required=True)
+    parser.add_argument("--employee-id", type=int, default=None)
+    parser.add_argument("--date", required=True, help="slot date of round 1; round 2 starts the day after")
+    parser.add_argument("--time", default="10:00")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--days", type=int, default=50)
+    parser.add_argument("--step", type=int, default=60, help="minutes between slots, >= service duration")
+    args = parser.parse_args()
+
+    capacity = await slot_capacity(args)
+    same_slot = [(date.fromisoformat(args.date), args.time)] * args.requests
+    codes, elapsed = await run_round(args, same_slot)
+    print(f"same slot:      {dict(codes)} in {elapsed:.2f}s ({args.requests / elapsed:.0f} req/s)")
+    if codes[201] != capacity or codes[409] != args.requests - capacity:
+        raise SystemExit(f"FAIL: expected {capacity} x 201 (slot capacity) and 409 for the rest")
+
+    codes, elapsed = await run_round(args, distinct_slots(args))
+    print(f"distinct slots: {dict(codes)} in {elapsed:.2f}s ({args.requests / elapsed:.0f} req/s)")
+    if codes[201] != args.requests:
+        raise SystemExit("FAIL: expected every distinct slot to be booked")
+
+    print("OK")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
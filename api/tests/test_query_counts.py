@@ -0,0 +1,171 @@
+"""Statements per request must not grow with the size of a business or a user.
+
+Each test calls a real route over a small and a large data set and compares the
+number of SQL statements, so an N+1 query or an unplanned lazy load shows up as
+a difference.
+"""
+from datetime import date, time, timedelta
+
+from app.api.dependencies import BUSINESS_ADMIN, CLIENT, Principal
+from app.models.booking import Booking
+from app.models.business import Business, BusinessHours, BusinessType
+from app.models.favorite import Favorite
+from app.models.service import Service
+from app.models.user import User
+from app.services.business_summary import refresh_business_summary
+
+SIZES = (1, 20)
+
+# Somewhere no real business is, so location queries only see test rows
+LAT, LON = -54.28, -36.51
+
+BOOKING_DATE = date.today() + timedelta(days=7)
+
+
+async def _create_business(db, name: str = "Query count wash", lat: float = LAT) -> Business:
+    business = Business(
+        name=name,
+        type=BusinessType.CAR_WASH,
+        address="Test street 1",
+        lat=lat,
+        lon=LON,
+        phones=["+70000000000"],
+    )
+    db.add(business)
+    await db.flush()
+    for day in range(7):
+        db.add(
+            BusinessHours(
+                business_id=business.id, day_of_week=day, open_time=time(8), close_time=time(20)
+            )
+        )
+    await refresh_business_summary(db, business.id)
+    return business
+
+
+async def _create_service(db, business: Business) -> Service:
+    service = Service(
+        business_id=business.id,
+        name="Wash",
+        price_from=100,
+        price_to=200,
+        duration_minutes=30,
+    )
+    db.add(service)
+    await db.flush()
+    return service
+
+
+async def _create_bookings(db, business: Business, service: Service, count: int):
+    """count back-to-back 30 minute bookings from 08:00 of BOOKING_DATE."""
+    for i in range(count):
+        db.add(
+            Booking(
+                business_id=business.id,
+                service_id=service.id,
+                booking_date=BOOKING_DATE,
+                booking_time=time(8 + i // 2, 30 * (i % 2)),
+                client_name=f"Client {i}",
+                client_phone=f"+7900{i:07d}",
+            )
+        )
+    await db.flush()
+
+
+async def _count_request(db, client, count_queries, method: str, url: str, **kwargs):
+    """Send a request; returns the response and the number of statements it ran."""
+    # Reads must hit the database, not the identity map
+    db.expunge_all()
+    with count_queries() as statements:
+        response = await client.request(method, url, **kwargs)
+    assert response.status_code < 300, response.text
+    return response, len(statements)
+
+
+async def test_business_list(db, client, count_queries):
+    counts = []
+    for index, size in enumerate(SIZES):
+        lat = LAT + index  # one area per size
+        for i in range(size):
+            await _create_business(db, name=f"Query count wash {i}", lat=lat)
+
+        response, statements = await _count_request(
+            db,
+            client,
+            count_queries,
+            "GET",
+            "/api/v1/businesses",
+            params={"lat": lat, "lon": LON, "radius_km": 1},
+        )
+        assert len(response.json()) == size
+        counts.append(statements)
+
+    assert counts[0] == counts[1]
+
+
+async def test_my_favorites(db, client, count_queries, login):
+    counts = []
+    for size in SIZES:
+        user = User(name=f"Favorites user {size}")
+        db.add(user)
+        await db.flush()
+        for i in range(size):
+            business = await _create_business(db, name=f"Favorite {i}")
+            db.add(Favorite(user_id=user.id, business_id=business.id))
+        await db.flush()
+        login(Principal(id=user.id, type=CLIENT))
+
+        response, statements = await _count_request(
+            db, client, count_queries, "GET", "/api/v1/favorites/my"
+        )
+        assert len(response.json()) == size
+        counts.append(statements)
+
+    assert counts[0] == counts[1]
+
+
+async def test_admin_dashboard(db, client, count_queries, login):
+    counts = []
+    for size in SIZES:
+        business = await _create_business(db)
+        service = await _create_service(db, business)
+        await _create_bookings(db, business, service, size)
+        login(Principal(id=1, type=BUSINESS_ADMIN, business_id=business.id))
+
+        _, profile_statements = await _count_request(
+            db, client, count_queries, "GET", "/api/v1/admin/business/profile"
+        )
+        response, bookings_statements = await _count_request(
+            db, client, count_queries, "GET", "/api/v1/admin/bookings"
+        )
+        assert len(response.json()) == size
+        counts.append((profile_statements, bookings_statements))
+
+    assert counts[0] == counts[1]
+
+
+async def test_create_booking(db, client, count_queries):
+    counts = []
+    for size in SIZES:
+        business = await _create_business(db)
+        service = await _create_service(db, business)
+        await _create_bookings(db, business, service, size)
+
+        _, statements = await _count_request(
+            db,
+            client,
+            count_queries,
+            "POST",
+            "/api/v1/bookings",
+            json={
+                "business_id": business.id,
+                "service_id": service.id,
+                "booking_date": BOOKING_DATE.isoformat(),
+                "booking_time": "19:00",
+                "client_name": "New client",
+                "client_phone": "+79990000000",
+            },
+        )
+        counts.append(statements)
+
+    assert counts[0] == counts[1]